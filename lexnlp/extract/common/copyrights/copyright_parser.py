@@ -28,9 +28,18 @@ class CopyrightParser(TextPatternCollector):
         ant.year_end = ptrn.end_year
         return ant
 
-    def get_annotations_as_dictionaries(self) -> List[dict]:
+    def get_annotations_as_dictionaries(self, annotations: List[TextAnnotation] = None) -> List[dict]:
+        """
+        :param annotations: annotations returned by parse(), the result of the last parse() call if None.
+            Deprecated: pass the annotations, the last parse() result is not thread-safe
+            (see ParsingContext)
+        """
+        return self.annotations_to_dictionaries(self.annotations if annotations is None else annotations)
+
+    @staticmethod
+    def annotations_to_dictionaries(annotations: List[TextAnnotation]) -> List[dict]:
         dfs = []
-        for ant in self.annotations:
+        for ant in annotations:
             df = ant.to_dictionary()
             dfs.append(df)
         return dfs
@@ -1,8 +1,9 @@
-import copy
+import itertools
 import logging
 import regex as re
 from dateutil import tz, parser
-from typing import Tuple, List, Dict
+from types import MappingProxyType
+from typing import Any, Tuple, List, Dict, Iterable, Iterator, Optional
 
 logger = logging.getLogger('datefinder')
 
@@ -31,6 +32,62 @@ class DateFragment:
         return sum([1 if len(self.captures[m]) > 0 else 0 for m in self.captures])
 
 
+class DateFinderConfig:
+    """
+    Read-only replacement tables for DateFinder.
+    Replacement regexes are compiled once, so one config object can be shared
+    by any number of DateFinder instances and threads.
+    """
+
+    def __init__(self,
+                 replacements: Dict[str, str],
+                 timezone_replacements: Optional[Dict[str, str]] = None):
+        """
+        :param replacements: tokens dateutil won't handle and their substitutes
+        :param timezone_replacements: timezone names and their abbreviations
+        """
+        self.replacements = MappingProxyType(dict(replacements))
+        self.timezone_replacements = MappingProxyType(dict(timezone_replacements or {}))
+        self.replacement_regexes = tuple(
+            (key, self.compile_replacement_regex(key), replacement)
+            for key, replacement in self.replacements.items()
+        )  # type: Tuple[Tuple[str, Any, str], ...]
+
+    def __repr__(self):
+        return 'DateFinderConfig({} replacements)'.format(len(self.replacements))
+
+    @staticmethod
+    def compile_replacement_regex(key: str):
+        # we really want to match all permutations of the key surrounded by whitespace chars except one
+        # for example: consider the key = 'to'
+        # 1. match 'to '
+        # 2. match ' to'
+        # 3. match ' to '
+        # but never match r'(\s|)to(\s|)' which would make 'october' > 'ocber'
+        return re.compile(r'(^|\s)' + key + r'(\s|$)', re.IGNORECASE)
+
+    def extend(self, replacements: Dict[str, str]) -> 'DateFinderConfig':
+        """
+        Make a new config with extra or overridden replacements
+        """
+        merged = dict(self.replacements)
+        merged.update(replacements)
+        return DateFinderConfig(merged, self.timezone_replacements)
+
+    def get_replacement_regexes(self, timezones: Iterable[str] = None) -> List[Tuple]:
+        """
+        Get (regex, replacement) pairs to apply, in order, to a date string
+        :param timezones: timezone captures to be removed from the date string as well
+        """
+        timezones = dict.fromkeys(timezones or [])
+        regexes = [(key_re, ' ' if key in timezones else replacement)
+                   for key, key_re, replacement in self.replacement_regexes]
+        for tz_string in timezones:
+            if tz_string not in self.replacements:
+                regexes.append((self.compile_replacement_regex(tz_string), ' '))
+        return regexes
+
+
 class DateFinder(object):
     """
     Locates dates in a text
@@ -163,8 +220,19 @@ class DateFinder(object):
     ## Characters that can be removed from ends of matched strings
     STRIP_CHARS = ' \n\t:-.,_'
 
-    def __init__(self, base_date=None):
+    ## Unhelpful whitespace characters replaced with a single space in matched strings
+    WHITESPACE_REGEX = re.compile(r'[\n\t\s\xa0]+')
+
+    ## A fragment should include at least that many adjacent DATE_REGEX matches
+    MIN_FRAGMENT_MATCHES = 3
+
+    def __init__(self, base_date=None, config: Optional[DateFinderConfig] = None):
+        """
+        :param base_date: default datetime to take missing date parts from
+        :param config: replacement tables, DEFAULT_DATE_FINDER_CONFIG if omitted
+        """
         self.base_date = base_date
+        self.config = config or DEFAULT_DATE_FINDER_CONFIG
 
     def tokenize_string(self, text: str) -> List[Tuple[str, str, Dict[str, List[str]]]]:
         items = []  # type:List[Tuple[str, str, Dict[str, List[str]]]]
@@ -186,7 +254,7 @@ class DateFinder(object):
         return items
 
     def merge_tokens(self, tokens: List[Tuple[str, str]]) -> List[DateFragment]:
-        MIN_MATCHES = 3
+        MIN_MATCHES = self.MIN_FRAGMENT_MATCHES
         fragments = []  # type:List[DateFragment]
         frag = DateFragment()
 
@@ -238,79 +306,130 @@ class DateFinder(object):
                 return gr
         return ''
 
+    def iter_fragments(self, text: str, start: int = 0, end: Optional[int] = None) -> Iterator[DateFragment]:
+        """
+        Walk DATE_REGEX matches in text[start:end] once and yield each DateFragment
+        as soon as it is complete. Gives the same fragments as merge_tokens(tokenize_string(...))
+        without building the token list; fragment indices are positions in the whole text.
+        """
+        end = len(text) if end is None else end
+        frag = None  # type: Optional[DateFragment]
+        last_end = start
+
+        for match in self.DATE_REGEX.finditer(text, start, end):
+            match_start, match_end = match.span()
+            captures = match.capturesdict()
+            group = self.get_token_group(captures)
+
+            # text between matches (or a match without groups) ends current fragment
+            if match_start > last_end or not group:
+                if frag and frag.matches_count >= self.MIN_FRAGMENT_MATCHES:
+                    yield self._complete_fragment(frag, text)
+                frag = None
+            last_end = match_end
+            if not group:
+                continue
+
+            if frag is None:
+                frag = DateFragment()
+                frag.indices = (match_start, match_end)
+            else:
+                frag.indices = (frag.indices[0], match_end)
+            frag.matches_count += 1
+
+            for capt in captures:
+                if capt in frag.captures:
+                    frag.captures[capt] += captures[capt]
+                else:
+                    frag.captures[capt] = captures[capt]
+
+        if frag and frag.matches_count >= self.MIN_FRAGMENT_MATCHES:
+            yield self._complete_fragment(frag, text)
+
+    def _complete_fragment(self, frag: DateFragment, text: str) -> DateFragment:
+        frag.match_str = text[frag.indices[0]:frag.indices[1]]
+        for gr in self.ALL_GROUPS:
+            if gr not in frag.captures:
+                frag.captures[gr] = []
+        return frag
+
     def extract_date_strings(self, text: str, strict=False):
-        return self.extract_date_strings_inner(text, text_start=0, strict=strict)
+        """
+        Yield (date string, (start, end), captures) for possible dates in text.
+        Text is scanned once: date ranges ("... to ...", "... through ...") are split
+        lazily and fragments are streamed, so memory use doesn't grow with the text.
+        """
+        range_spans = self.iter_date_range_spans(text)
+        first_spans = list(itertools.islice(range_spans, 2))
+        if len(first_spans) > 1:
+            range_spans = itertools.chain(first_spans, range_spans)
+        else:
+            range_spans = [(0, len(text))]
+
+        for range_start, range_end in range_spans:
+            for frag in self.iter_fragments(text, range_start, range_end):
+                date_string = self.get_fragment_date_string(frag, strict=strict)
+                if date_string:
+                    yield date_string
 
     def extract_date_strings_inner(self, text: str, text_start: int = 0, strict=False):
-        rng = self.split_date_range(text)
-        if rng and len(rng) > 1:
-            range_strings = []
-            for range_str in rng:
-                range_strings.extend(self.extract_date_strings_inner(range_str[0],
-                                                                     range_str[1][0],
-                                                                     strict=strict))
-            for range_string in range_strings:
-                yield range_string
-            return
-
-        tokens = self.tokenize_string(text)
-        items = self.merge_tokens(tokens)
-
-        for match in items:
-            match_str = match.match_str
-            indices = (match.indices[0] + text_start, match.indices[1] + text_start)
-
-            ## Get individual group matches
-            captures = match.captures
-            #time = captures.get('time')
-            digits = captures.get('digits')
-            #digits_modifiers = captures.get('digits_modifiers')
-            #days = captures.get('days')
-            months = captures.get('months')
-            #timezones = captures.get('timezones')
-            delimiters = captures.get('delimiters')
-            #time_periods = captures.get('time_periods')
-            #extra_tokens = captures.get('extra_tokens')
-
-            if delimiters and match_str.endswith(delimiters[-1]):
-                captures['delimiters'] = captures['delimiters'][:-1]
-
-            if strict:
-                complete = False
-                ## 12-05-2015
-                if len(digits) == 3:
-                    complete = True
-                    ## 19 February 2013 year 09:10
-                elif (len(months) == 1) and (len(digits) == 2):
-                    complete = True
-
-                if not complete:
-                    continue
-
-            ## sanitize date string
-            ## replace unhelpful whitespace characters with single whitespace
-            match_str = re.sub(r'[\n\t\s\xa0]+', ' ', match_str)
-            match_str = match_str.strip(self.STRIP_CHARS)
-
-            ## Save sanitized source string
-            yield match_str, indices, captures
+        for match_str, indices, captures in self.extract_date_strings(text, strict=strict):
+            yield match_str, (indices[0] + text_start, indices[1] + text_start), captures
 
-    @staticmethod
-    def split_date_range(text: str) -> List[Tuple[str, Tuple[int, int]]]:
-        st_matches = DateFinder.RANGE_SPLIT_REGEX.finditer(text)
-        start = 0
-        parts = []  # List[Tuple[str, Tuple[int, int]]]
+    def get_fragment_date_string(self, frag: DateFragment, strict=False) \
+            -> Optional[Tuple[str, Tuple[int, int], Dict[str, List[str]]]]:
+        """
+        Sanitize fragment text and captures, return None if strict and date is incomplete
+        """
+        match_str = frag.match_str
+
+        ## Get individual group matches
+        captures = frag.captures
+        digits = captures.get('digits')
+        months = captures.get('months')
+        delimiters = captures.get('delimiters')
+
+        if delimiters and match_str.endswith(delimiters[-1]):
+            captures['delimiters'] = captures['delimiters'][:-1]
+
+        if strict:
+            complete = False
+            ## 12-05-2015
+            if len(digits) == 3:
+                complete = True
+                ## 19 February 2013 year 09:10
+            elif (len(months) == 1) and (len(digits) == 2):
+                complete = True
+
+            if not complete:
+                return None
 
-        for match in st_matches:
+        ## sanitize date string
+        ## replace unhelpful whitespace characters with single whitespace
+        match_str = self.WHITESPACE_REGEX.sub(' ', match_str)
+        match_str = match_str.strip(self.STRIP_CHARS)
+
+        ## Save sanitized source string
+        return match_str, frag.indices, captures
+
+    @classmethod
+    def iter_date_range_spans(cls, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (start, end) of text parts between range separators ("to", "through")
+        """
+        start = 0
+        for match in cls.RANGE_SPLIT_REGEX.finditer(text):
             match_start = match.start()
             if match_start > start:
-                parts.append((text[start:match_start], (start, match_start)))
+                yield start, match_start
             start = match.end()
 
         if start < len(text):
-            parts.append((text[start:], (start, len(text))))
+            yield start, len(text)
 
-        return parts
+    @staticmethod
+    def split_date_range(text: str) -> List[Tuple[str, Tuple[int, int]]]:
+        return [(text[start:end], (start, end)) for start, end in DateFinder.iter_date_range_spans(text)]
 
     def find_dates(self, text, source=False, index=False, strict=False):
 
@@ -378,20 +497,9 @@ class DateFinder(object):
         :param date_string:
         :return: date_string, tz_string
         """
-        # add timezones to replace
-        cloned_replacements = copy.copy(self.REPLACEMENTS)  # don't mutate
-        for tz_string in captures.get('timezones', []):
-            cloned_replacements.update({tz_string: ' '})
-
         date_string = date_string.lower()
-        for key, replacement in cloned_replacements.items():
-            # we really want to match all permutations of the key surrounded by whitespace chars except one
-            # for example: consider the key = 'to'
-            # 1. match 'to '
-            # 2. match ' to'
-            # 3. match ' to '
-            # but never match r'(\s|)to(\s|)' which would make 'october' > 'ocber'
-            date_string = re.sub(r'(^|\s)' + key + r'(\s|$)', replacement, date_string, flags=re.IGNORECASE)
+        for key_re, replacement in self.config.get_replacement_regexes(captures.get('timezones', [])):
+            date_string = key_re.sub(replacement, date_string)
 
         return date_string, self._pop_tz_string(sorted(captures.get('timezones', [])))
 
@@ -400,11 +508,14 @@ class DateFinder(object):
             tz_string = list_of_timezones.pop()
             # make sure it's not a timezone we
             # want replaced with better abbreviation
-            return self.TIMEZONE_REPLACEMENTS.get(tz_string, tz_string)
+            return self.config.timezone_replacements.get(tz_string, tz_string)
         except IndexError:
             return ''
 
 
+DEFAULT_DATE_FINDER_CONFIG = DateFinderConfig(DateFinder.REPLACEMENTS, DateFinder.TIMEZONE_REPLACEMENTS)
+
+
 def find_dates(
         text,
         source=False,
@@ -437,5 +548,5 @@ def find_dates(
     :return: Returns a generator that produces :mod:`datetime.datetime` objects,
         or a tuple with the source text and index, if requested
     """
-    date_finder = DateFinder(base_date=base_date)
+    date_finder = DateFinder(base_date=base_date, config=DEFAULT_DATE_FINDER_CONFIG)
     return date_finder.find_dates(text, source=source, index=index, strict=strict)
@@ -5,11 +5,13 @@ Dates parser based on dateparser package
 # pylint: disable=bare-except,broad-except,unused-argument
 
 import re
-import pandas as pd
 import string
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
 
+import numpy as np
 from dateparser.search import search_dates
-from lexnlp.extract.en.date_model import MODEL_DATE, get_date_features
+from lexnlp.extract.en.date_model import MODEL_DATE, get_date_feature_extractor
 
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -20,6 +22,137 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
+class DateScorer(ABC):
+    """
+    Base class for DateParser candidate scorers.
+    A scorer gets the whole text and all candidate spans at once
+    and returns the probability of each candidate being a date.
+    """
+
+    @abstractmethod
+    def score(self, text: str, spans: List[Tuple[int, int]]) -> np.ndarray:
+        pass
+
+
+class ClassifierDateScorer(DateScorer):
+    """
+    Score candidates with a pre-trained classifier model, one predict_proba call per batch
+    """
+    BATCH_SIZE = 1000
+
+    def __init__(self, model=None, batch_size=None):
+        """
+        :param model: obj - classifier with "columns" attribute, MODEL_DATE by default
+        :param batch_size: int - candidates per predict_proba call, None or 0 for the whole text
+        """
+        self.model = model if model is not None else MODEL_DATE
+        self.batch_size = batch_size if batch_size is not None else self.BATCH_SIZE
+
+    def score(self, text, spans):
+        spans = list(spans)
+        if not spans:
+            return np.zeros(0, dtype=float)
+        extractor = get_date_feature_extractor()
+        batch_size = self.batch_size or len(spans)
+        scores = []
+        for batch_start in range(0, len(spans), batch_size):
+            feature_matrix = extractor.get_feature_matrix(
+                text, spans[batch_start:batch_start + batch_size], columns=self.model.columns)
+            scores.append(self.model.predict_proba(feature_matrix)[:, 1])
+        return np.concatenate(scores)
+
+
+class RuleDateScorer(DateScorer):
+    """
+    Cheap rule-only scorer: a candidate scores 1.0 if it matches REQUIRED_RE, 0.0 otherwise.
+    Trades classifier precision for throughput.
+    """
+    REQUIRED_RE = re.compile(r'\d')
+
+    def __init__(self, required_re=None):
+        """
+        :param required_re: compiled regex a date source should contain, a digit by default
+        """
+        self.required_re = required_re or self.REQUIRED_RE
+
+    def score(self, text, spans):
+        return np.array([1.0 if self.required_re.search(text[start:end]) else 0.0
+                         for start, end in spans], dtype=float)
+
+
+class DeferredDateScorer(DateScorer):
+    """
+    Don't filter candidates; attach a LazyDateScore to each of them instead.
+    Scores of all candidates in a text are computed together on first access.
+    """
+
+    def __init__(self, scorer=None):
+        """
+        :param scorer: DateScorer - scorer used when a score is requested,
+            DateParser uses the classifier scorer of its CLASSIFIER_MODEL if None
+        """
+        self.scorer = scorer
+
+    def score(self, text, spans):
+        return (self.scorer or ClassifierDateScorer()).score(text, spans)
+
+
+class LazyDateScore:
+    """
+    Date probability computed on first access to "value" (or float())
+    """
+
+    def __init__(self, scores: 'DeferredDateScores', index: int):
+        self.scores = scores
+        self.index = index
+
+    @property
+    def value(self) -> float:
+        return float(self.scores.get_scores()[self.index])
+
+    def __float__(self):
+        return self.value
+
+    def __repr__(self):
+        return 'LazyDateScore({})'.format(self.value if self.scores.scores is not None else '?')
+
+
+class DeferredDateScores:
+    """
+    Scores of all candidates found in one text, computed in one scorer call when first needed
+    """
+
+    def __init__(self, scorer: DateScorer, text: str, spans: List[Tuple[int, int]]):
+        self.scorer = scorer
+        self.text = text
+        self.spans = spans
+        self.scores = None
+
+    def get_scores(self) -> np.ndarray:
+        if self.scores is None:
+            self.scores = self.scorer.score(self.text, self.spans)
+        return self.scores
+
+
+DATE_SCORERS = {
+    'classifier': ClassifierDateScorer,
+    'rules': RuleDateScorer,
+    'defer': DeferredDateScorer,
+}
+
+
+def get_date_scorer(scorer: Union[str, DateScorer, None]) -> Union[DateScorer, None]:
+    """
+    Resolve scorer name ("classifier", "rules", "defer") or instance to a DateScorer
+    """
+    if isinstance(scorer, str):
+        if scorer not in DATE_SCORERS:
+            raise ValueError('Unknown date scorer "{}", use one of: {}'.format(
+                scorer, ', '.join(DATE_SCORERS)))
+        return DATE_SCORERS[scorer]()
+    return scorer
+
+
 class DateParser(object):
     """
     Dates parser based on dateparser package
@@ -31,14 +164,19 @@ class DateParser(object):
     BAD_PARTIAL_RE = re.compile('[%s]' % re.escape(re.sub('[.,-:]', '', string.punctuation)))
     DATEPARSER_SETTINGS = {'PREFER_DAY_OF_MONTH': 'first', 'STRICT_PARSING': False}
 
+    SCORER = None
+
     def __init__(self, text=None, language='en', dateparser_settings=None,
-                 enable_classifier_check=None, classifier_model=None, classifier_threshold=None):
+                 enable_classifier_check=None, classifier_model=None, classifier_threshold=None,
+                 scorer=None):
         """
         :param language: str - two-letters language definition
         :param enable_classifier_check: bool - enable date check using classifier model
         :param classifier_model: obj - classifier itself
         :param classifier_threshold: float 0<x<1 - min value to predict date
         :param dateparser_settings: dict - settings for dateparser
+        :param scorer: DateScorer or "classifier" / "rules" / "defer" - candidate scorer,
+            overrides enable_classifier_check
         """
         self.LANGUAGE = language
         self.TEXT = text
@@ -48,6 +186,8 @@ class DateParser(object):
         self.CLASSIFIER_MODEL = classifier_model or self.CLASSIFIER_MODEL
         self.CLASSIFIER_THRESHOLD = classifier_threshold or self.CLASSIFIER_THRESHOLD
         self.DATEPARSER_SETTINGS = dateparser_settings or self.DATEPARSER_SETTINGS
+        self._classifier_scorer = None
+        self.SCORER = self.resolve_scorer(scorer or self.SCORER)
 
     def get_dateparser_dates(self, text=None):
         """
@@ -72,18 +212,57 @@ class DateParser(object):
         """
         return not (self.BAD_FULL_RE.fullmatch(date_str) or self.BAD_PARTIAL_RE.search(date_str))
 
+    def get_scorer(self) -> Union[DateScorer, None]:
+        """
+        Get scorer to filter possible dates with: SCORER if set, classifier scorer
+        if ENABLE_CLASSIFIER_CHECK, None to skip scoring
+        """
+        if self.SCORER is not None:
+            return self.SCORER
+        if not self.ENABLE_CLASSIFIER_CHECK:
+            return None
+        return self.get_classifier_scorer()
+
+    def resolve_scorer(self, scorer: Union[str, DateScorer, None]) -> Union[DateScorer, None]:
+        """
+        Resolve scorer name or instance to a DateScorer, "classifier" uses CLASSIFIER_MODEL
+        """
+        if scorer == 'classifier':
+            return self.get_classifier_scorer()
+        return get_date_scorer(scorer)
+
+    def get_classifier_scorer(self) -> ClassifierDateScorer:
+        """
+        Get scorer using CLASSIFIER_MODEL
+        """
+        if self._classifier_scorer is None or self._classifier_scorer.model is not self.CLASSIFIER_MODEL:
+            self._classifier_scorer = ClassifierDateScorer(self.CLASSIFIER_MODEL)
+        return self._classifier_scorer
+
+    def get_deferred_scorer(self, scorer: DeferredDateScorer) -> DateScorer:
+        """
+        Get scorer computing the scores of a DeferredDateScorer, classifier scorer of CLASSIFIER_MODEL if not set
+        """
+        return scorer.scorer or self.get_classifier_scorer()
+
     def passed_classifier_check(self, location_start, location_end):
         """
         Use pre-trained classifier model to predict whether a date has right format
-        Should be pluggable as it takes 90% parsing time
+        Scores a single match; get_dates scores all matches of a text in one batch
         """
-        row_df = pd.DataFrame.from_records(
-            [get_date_features(self.TEXT, location_start, location_end)])
-        date_score = self.CLASSIFIER_MODEL.predict_proba(
-            row_df.loc[:, self.CLASSIFIER_MODEL.columns])
-        return date_score[0, 1] > self.CLASSIFIER_THRESHOLD
+        scorer = self.get_scorer() or self.get_classifier_scorer()
+        if isinstance(scorer, DeferredDateScorer):
+            scorer = self.get_deferred_scorer(scorer)
+        date_score = scorer.score(self.TEXT, [(location_start, location_end)])
+        return date_score[0] > self.CLASSIFIER_THRESHOLD
 
-    def get_dates(self, text=None, language=None):
+    def get_dates(self, text=None, language=None, scorer=None):
+        """
+        :param text: str - text to search dates in
+        :param language: str - two-letters language definition
+        :param scorer: DateScorer or "classifier" / "rules" / "defer" - candidate scorer for this call,
+            the scorer of the parser (see get_scorer) if None
+        """
         self.TEXT = text or self.TEXT
         self.LANGUAGE = language or self.LANGUAGE
 
@@ -101,6 +280,7 @@ class DateParser(object):
         self.get_extra_dates()
 
         positions = []
+        candidates = []
         for date_str, date in sorted(self.DATES, key=lambda i: -len(i[0])):
 
             # if possible date has weird format or unwanted symbols
@@ -114,16 +294,29 @@ class DateParser(object):
                 if any([1 for i, j in positions if location_start>=i and location_end<=j]):
                     continue
                 positions.append(match.span())
+                candidates.append((location_start, location_end, date))
 
-                # filter out possible dates using classifier
-                if self.ENABLE_CLASSIFIER_CHECK and \
-                        not self.passed_classifier_check(location_start, location_end):
-                    continue
+        text = self.TEXT
+        scorer = self.resolve_scorer(scorer) if scorer is not None else self.get_scorer()
+        spans = [(location_start, location_end) for location_start, location_end, _ in candidates]
+        deferred_scores = date_scores = None
+        if isinstance(scorer, DeferredDateScorer):
+            deferred_scores = DeferredDateScores(self.get_deferred_scorer(scorer), text, spans)
+        elif scorer is not None:
+            # filter out possible dates using scorer, all candidates at once
+            date_scores = scorer.score(text, spans)
+
+        for index, (location_start, location_end, date) in enumerate(candidates):
+            if date_scores is not None and not date_scores[index] > self.CLASSIFIER_THRESHOLD:
+                continue
 
-                yield {'location_start': location_start,
-                       'location_end': location_end,
-                       'value': date,
-                       'source': self.TEXT[location_start:location_end]}
+            result = {'location_start': location_start,
+                      'location_end': location_end,
+                      'value': date,
+                      'source': text[location_start:location_end]}
+            if deferred_scores is not None:
+                result['score'] = LazyDateScore(deferred_scores, index)
+            yield result
 
     def get_date_list(self, *args, **kwargs):
         return list(self.get_dates(*args, **kwargs))
@@ -1,3 +1,5 @@
+from typing import List
+
 from lexnlp.extract.common.annotations.text_annotation import TextAnnotation
 from lexnlp.extract.common.pattern_found import PatternFound
 from lexnlp.extract.common.text_pattern_collector import TextPatternCollector
@@ -27,9 +29,18 @@ class UniversalDefinitionsParser(TextPatternCollector):
             text=phrase.text[ptrn.start: ptrn.end],
             locale=locale)
 
-    def get_definition_dictionaries(self):
+    def get_definition_dictionaries(self, annotations: List[TextAnnotation] = None) -> List[dict]:
+        """
+        :param annotations: annotations returned by parse(), the result of the last parse() call if None.
+            Deprecated: pass the annotations, the last parse() result is not thread-safe
+            (see ParsingContext)
+        """
+        return self.definitions_to_dictionaries(self.annotations if annotations is None else annotations)
+
+    @staticmethod
+    def definitions_to_dictionaries(annotations: List[TextAnnotation]) -> List[dict]:
         dfs = []
-        for ant in self.annotations:
+        for ant in annotations:
             dfs.append({
                     "attrs": {
                         "start": ant.coords[0],
@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable, List
+
+from lexnlp.extract.common.annotations.text_annotation import TextAnnotation
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class ParsingContext:
+    """
+    State of a single parse() call: locale of the text and annotations found so far.
+
+    Parsers keep only their (read-only) configuration in their own attributes and pass
+    the context through the methods called by parse(). So one parser instance - e.g. the module-level
+    "parser" of lexnlp.extract.en.courts - can be used by several threads at once.
+
+    The only exception is the legacy "annotations" attribute of TextPatternCollector and RegulationsParser:
+    parse() stores its result there for get_annotations_as_dictionaries() / get_definition_dictionaries()
+    called without arguments. It is last-call-wins and not thread-safe - with several threads it holds
+    the result of whichever parse() call finished last. Deprecated: use the list returned by parse().
+    """
+    __slots__ = ['locale', 'annotations']
+
+    def __init__(self, locale: str = None):
+        self.locale = locale
+        self.annotations = []  # type: List[TextAnnotation]
+
+
+# parse function of the current worker process, see parse_many()
+_WORKER_PARSE_FUNC = None  # type: Callable[[str, str], List[TextAnnotation]]
+
+
+def _init_worker_parse_func(parser, method_name: str) -> None:
+    """
+    Process pool initializer: keep the parser sent to the worker once for all texts it parses.
+    """
+    global _WORKER_PARSE_FUNC
+    _WORKER_PARSE_FUNC = getattr(parser, method_name) if method_name else parser
+
+
+def _worker_parse(text: str, locale: str) -> List[TextAnnotation]:
+    return _WORKER_PARSE_FUNC(text, locale)
+
+
+def get_chunksize(texts: Iterable[str], workers: int) -> int:
+    """
+    Number of texts sent to a worker process at once: about 4 chunks per worker,
+    1 if the number of texts is unknown.
+    """
+    try:
+        return max(1, len(texts) // (workers * 4))
+    except TypeError:
+        return 1
+
+
+def parse_many(parse_func: Callable[[str, str], List[TextAnnotation]],
+               texts: Iterable[str],
+               locale: str = None,
+               workers: int = 1,
+               use_processes: bool = False,
+               chunksize: int = None) -> List[List[TextAnnotation]]:
+    """
+    Call parse_func(text, locale) for each of the texts using a thread or process pool.
+    In a process pool the parser (parse_func.__self__ for a bound method) is pickled once per worker process
+    by the pool initializer, not once per text.
+    :param parse_func: parse() method of a parser, for example: lexnlp.extract.de.courts.parser.parse
+    :param texts: texts to parse
+    :param locale: locale passed to each parse_func() call
+    :param workers: number of threads / processes, texts are parsed in the current thread if it is 1 or less
+    :param use_processes: use process pool instead of thread pool. The parser should be picklable then.
+    :param chunksize: number of texts sent to a worker process at once, see get_chunksize() if None
+    :return: list of annotation lists in the order of the texts. Use them instead of the parser's
+        "annotations" attribute: it is overwritten by each parse() call of the threads (and isn't
+        updated at all by the worker processes)
+    """
+    if not workers or workers <= 1:
+        return [parse_func(text, locale) for text in texts]
+    if use_processes:
+        parser = getattr(parse_func, '__self__', None)
+        initargs = (parser, parse_func.__name__) if parser is not None else (parse_func, None)
+        chunksize = chunksize or get_chunksize(texts, workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_parse_func,
+                                 initargs=initargs) as executor:
+            return list(executor.map(_worker_parse, texts, repeat(locale), chunksize=chunksize))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_func, texts, repeat(locale)))
@@ -3,7 +3,7 @@ import datetime
 import os
 import time
 from unittest import TestCase
-from lexnlp.extract.common.date_parsing.datefinder import DateFinder
+from lexnlp.extract.common.date_parsing.datefinder import DateFinder, DEFAULT_DATE_FINDER_CONFIG
 
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -43,4 +43,42 @@ class TestDateFinder(TestCase):
         _ = [(date_string, index, date_props) for date_string, index, date_props in
                           date_finder.extract_date_strings(text, strict=False)]
         d1 = time.time() - t1
-        self.assertLess(d1, 15)
\ No newline at end of file
+        self.assertLess(d1, 15)
+
+    def test_shared_config(self):
+        replacements = dict(DateFinder.REPLACEMENTS)
+        config = DEFAULT_DATE_FINDER_CONFIG.extend({'until': ' '})
+        self.assertEqual(replacements, dict(DateFinder.REPLACEMENTS))
+        self.assertEqual(replacements, dict(DEFAULT_DATE_FINDER_CONFIG.replacements))
+        self.assertEqual(' ', config.replacements['until'])
+        with self.assertRaises(TypeError):
+            config.replacements['until'] = ''
+
+        captures = {'timezones': ['EST']}
+        date_string, tz_string = DateFinder(config=config)._find_and_replace('due until May 5 EST', captures)
+        self.assertEqual('May 5', ' '.join(date_string.split()).title())
+        self.assertEqual('EST', tz_string)
+        date_string, _ = DateFinder()._find_and_replace('due until May 5', {})
+        self.assertIn('until', date_string)
+
+    def datefinder_speed(self):
+        """
+        Not named as test_XXX: micro-benchmark of streaming extract_date_strings
+        against tokenize_string + merge_tokens on a 100x long text
+        """
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        file_path = dir_path + '/../../../../test_data/long_parsed_text.txt'
+        with codecs.open(file_path, 'r', encoding='utf-8') as fr:
+            text = fr.read() * 100
+
+        date_finder = DateFinder()
+        t1 = time.time()
+        fragments = date_finder.merge_tokens(date_finder.tokenize_string(text))
+        d_tokens = time.time() - t1
+
+        t1 = time.time()
+        streamed = list(date_finder.iter_fragments(text))
+        d_stream = time.time() - t1
+
+        self.assertEqual(len(fragments), len(streamed))
+        print('tokenize + merge: {:.3f}s, streaming: {:.3f}s'.format(d_tokens, d_stream))
@@ -83,3 +83,11 @@ class TestDateTokenizer(TestCase):
 
         # tokenizers has slightly different logic
         self.assertGreaterEqual(len(dstrs), len(ostrs))
+
+    def test_iter_fragments(self):
+        text = "At 1997, 20 FEB here, in March 20, 2015 3:30 pm GMT or 4/5/98"
+        dtok = DateFinder()
+        merged = dtok.merge_tokens(dtok.tokenize_string(text))
+        streamed = list(dtok.iter_fragments(text))
+        self.assertEqual([(m.match_str, m.indices, m.captures) for m in merged],
+                         [(f.match_str, f.indices, f.captures) for f in streamed])
@@ -5,7 +5,11 @@ Multi-language unit tests for Dates.
 """
 
 import datetime
-from lexnlp.extract.common.dates import get_date_list
+
+import numpy as np
+
+from lexnlp.extract.common.dates import get_date_list, DateParser, DeferredDateScorer, RuleDateScorer
+from lexnlp.extract.de.dates import get_date_list as get_de_date_list
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -64,3 +68,40 @@ zuletzt geändert durch Art. 39 G v. 29.3.2017 I 626"""
                              'value': datetime.datetime(2017, 3, 29, 0, 0),
                              'source': '29.3.2017'}])
     assert extracted_dates == expected_dates
+
+
+def test_date_scorers():
+    text = "Ausfertigungsdatum: 23.05.1975, geändert am 29. März 2017 oder heute"
+    unchecked_dates = DateParser(language='de', enable_classifier_check=False).get_date_list(text)
+
+    rule_dates = DateParser(language='de', scorer='rules').get_date_list(text)
+    assert all(any(c.isdigit() for c in d['source']) for d in rule_dates)
+    assert [d for d in unchecked_dates if any(c.isdigit() for c in d['source'])] == rule_dates
+
+    deferred_dates = DateParser(language='de', scorer=DeferredDateScorer(RuleDateScorer())).get_date_list(text)
+    assert [{k: v for k, v in d.items() if k != 'score'} for d in deferred_dates] == unchecked_dates
+    assert [float(d['score']) for d in deferred_dates] == \
+           [1.0 if any(c.isdigit() for c in d['source']) else 0.0 for d in deferred_dates]
+
+    assert get_de_date_list(text, scorer='rules') == rule_dates
+
+
+class ConstantDateModel:
+    columns = ['char_a', 'char_b']
+
+    def predict_proba(self, feature_matrix):
+        return np.tile([0.75, 0.25], (len(feature_matrix), 1))
+
+
+def test_deferred_scorer_model():
+    text = "Ausfertigungsdatum: 23.05.1975, geändert am 29. März 2017 oder heute"
+    deferred_dates = DateParser(language='de', classifier_model=ConstantDateModel(),
+                                scorer=DeferredDateScorer()).get_date_list(text)
+    assert deferred_dates
+    assert [float(d['score']) for d in deferred_dates] == [0.25] * len(deferred_dates)
+
+    parser = DateParser(language='de', classifier_model=ConstantDateModel(), scorer='defer')
+    parser.TEXT = text
+    assert not parser.passed_classifier_check(20, 30)
+    parser.CLASSIFIER_THRESHOLD = 0.2
+    assert parser.passed_classifier_check(20, 30)
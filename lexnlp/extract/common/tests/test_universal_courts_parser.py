@@ -50,6 +50,15 @@ class TestUniversalCourtsParser(TestCase):
         __ = (time.time() - start)
         self.assertEqual(3, len(ret_l))
 
+    def test_court_indexes(self):
+        from lexnlp.extract.de.courts import parser
+        self.assertEqual(len(parser.courts), len(parser.court_records))
+        self.assertEqual(len(parser.courts), sum(len(c) for c in parser.courts_by_type.values()))
+        court = parser.courts_by_name['Bundesverfassungsgericht'][0]
+        self.assertEqual('Verfassungsgericht', court.court_type)
+        self.assertEqual('Federal', court.jurisdiction)
+        self.assertIn(court, parser.courts_by_type_and_jurisdiction[('Verfassungsgericht', 'Federal')])
+
     def parse_courts_legacy_function(self, text: str):
         court_df = pandas \
             .read_csv(
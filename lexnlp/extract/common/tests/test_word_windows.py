@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+Unit tests for word windows used by the amount extractors.
+"""
+
+from nose.tools import assert_equal
+
+from lexnlp.extract.common.word_windows import get_next_words, get_prev_words
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+def test_unit_window():
+    """
+    Test bounded text windows used for amount unit detection.
+    :return:
+    """
+    text = 'Pay $25,400 to  the holder of 1 million shares of Common Stock.'
+    assert_equal('to  the holder', get_next_words(text, 12, 3))
+    assert_equal('Common Stock.', get_next_words(text, 50, 20))
+    assert_equal(text[12:], get_next_words(text, 12, None))
+    assert_equal('$', get_prev_words(text, 5, 1))
+    assert_equal('holder of ', get_prev_words(text, 30, 2))
+    assert_equal(text[:30], get_prev_words(text, 30, 20))
+    assert_equal(text[:30], get_prev_words(text, 30, None))
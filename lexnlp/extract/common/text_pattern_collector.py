@@ -1,6 +1,7 @@
 from itertools import groupby
-from typing import Callable, List
+from typing import Callable, List, Iterable
 from lexnlp.extract.common.annotations.text_annotation import TextAnnotation
+from lexnlp.extract.common.parsing_context import parse_many
 from lexnlp.extract.common.pattern_found import PatternFound
 from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams, LineOrPhrase
 
@@ -26,7 +27,9 @@ class TextPatternCollector:
         :param split_params: text-to-sentences splitting params
         """
         self.parsing_functions = parsing_functions
-        self.annotations = [] # type: List[TextAnnotation]
+        # deprecated, use the list returned by parse(): result of the last parse() call,
+        # last-call-wins and not thread-safe; parse() itself keeps its annotations in a local list
+        self.annotations = []  # type: List[TextAnnotation]
         self.split_params = split_params
         self.proc = LineProcessor()
         self.prohibited_words = {} # words that are Not definitions per se
@@ -39,7 +42,7 @@ class TextPatternCollector:
                 "Extracted Entity Definition Name": "Software",
                 "Extracted Entity Text": ""Software" se refiere a: (i) el programa informático"} }
         """
-        self.annotations = []  # type: List[TextAnnotation]
+        annotations = []  # type: List[TextAnnotation]
         for phrase in self.proc.split_text_on_line_with_endings(text, self.split_params):
             matches = []
             for f in self.parsing_functions:
@@ -55,8 +58,24 @@ class TextPatternCollector:
             for match in matches:
                 ant = self.make_annotation_from_pattrn(locale, match, phrase)
                 ant.coords = (ant.coords[0] + phrase.start, ant.coords[1] + phrase.start)
-                self.annotations.append(ant)
-        return self.annotations
+                annotations.append(ant)
+        self.annotations = annotations
+        return annotations
+
+    def parse_many(self, texts: Iterable[str], locale: str = None,
+                   workers: int = 1, use_processes: bool = False,
+                   chunksize: int = None) -> List[List[TextAnnotation]]:
+        """
+        Parse each of the texts, see parse() and parsing_context.parse_many()
+        :param texts: texts being processed
+        :param locale: 'En', 'De', 'Es', ...
+        :param workers: number of threads (processes) parsing the texts
+        :param use_processes: use process pool instead of thread pool
+        :param chunksize: number of texts sent to a worker process at once
+        :return: list of annotation lists in the order of the texts
+        """
+        return parse_many(self.parse, texts, locale, workers=workers, use_processes=use_processes,
+                          chunksize=chunksize)
 
     # pylint: disable=unused-argument
     def make_annotation_from_pattrn(self, locale: str,
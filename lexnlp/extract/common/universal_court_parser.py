@@ -1,10 +1,17 @@
 # pylint: disable=unused-import
 
+import hashlib
+import inspect
+import os
+import pickle
 import re
+import threading
+import weakref
 import pandas as pd
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Iterable, Callable
 
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
+from lexnlp.extract.common.parsing_context import ParsingContext, parse_many
 from lexnlp.utils.lines_processing.line_processor import LineProcessor, LineSplitParams, LineOrPhrase
 from lexnlp.utils.lines_processing.phrase_finder import PhraseFinder, PhraseMatch
 
@@ -34,8 +41,24 @@ class ParserInitParams:
         self.key_word_preproc_func = None  # def (text:str) -> str
 
 
+class CourtRecord:
+    """
+    Court attributes used by UniversalCourtsParser - a row of the courts dataframe.
+    """
+    __slots__ = ['name', 'court_type', 'jurisdiction', 'alias']
+
+    def __init__(self, name: str, court_type: str, jurisdiction: str, alias: str = ''):
+        self.name = name
+        self.court_type = court_type
+        self.jurisdiction = jurisdiction
+        self.alias = alias
+
+    def __repr__(self):
+        return 'CourtRecord({0}, {1}, {2})'.format(self.name, self.court_type, self.jurisdiction)
+
+
 class MatchFound:
-    def __init__(self, subset, entry_start: int, entry_end: int, text: str):
+    def __init__(self, subset: Tuple[CourtRecord, ...], entry_start: int, entry_end: int, text: str):
         self.subset = subset
         self.is_exact = len(subset) == 1
         self.court_name = None
@@ -73,7 +96,9 @@ class UniversalCourtsParser:
       - court's jurisdiction ...
 
     In order to parse the text you are supposed to create your locale (or region) specific instance of
-    UniversalCourtsParser. See the constructor below:
+    UniversalCourtsParser. See the constructor below.
+
+    The parser doesn't change its state while parsing (see ParsingContext) and can be shared between threads.
     """
 
     def __init__(self, ptrs: ParserInitParams):
@@ -125,23 +150,30 @@ class UniversalCourtsParser:
         self.jurisdiction_column = ptrs.column_names['jurisdiction']
         self.proc = LineProcessor()
         self.phrase_split_ptrs = ptrs.split_ptrs
-        self.annotations = []  # type: List[CourtAnnotation]
+        self.dataframe_paths = list(ptrs.dataframe_paths)
         self.courts = None
         self.load_courts(ptrs.dataframe_paths)
-        self.locale = None
+
+        # court lookup tables: key column value(s) -> court records in the dataframe order
+        self.court_records = []  # type: List[CourtRecord]
+        self.courts_by_name = {}  # type: Dict[str, Tuple[CourtRecord, ...]]
+        self.courts_by_alias = {}  # type: Dict[str, Tuple[CourtRecord, ...]]
+        self.courts_by_type = {}  # type: Dict[str, Tuple[CourtRecord, ...]]
+        self.courts_by_type_and_jurisdiction = {}  # type: Dict[Tuple[str, str], Tuple[CourtRecord, ...]]
+        self.build_court_indexes()
 
         # unique columns
         self.finder_court_name = PhraseFinder(UniversalCourtsParser.get_unique_col_values(
-            self.courts[self.court_name_column]), ptrs.key_word_preproc_func)
+            self.courts_by_name), ptrs.key_word_preproc_func)
         self.finder_court_alias = None if len(self.court_alias_column) == 0 else \
             PhraseFinder(UniversalCourtsParser.get_unique_col_values(
-                self.courts[self.court_alias_column]), ptrs.key_word_preproc_func)
+                self.courts_by_alias), ptrs.key_word_preproc_func)
 
         # non-unique columns
         self.finder_court_type = PhraseFinder(UniversalCourtsParser.get_unique_col_values(
-            self.courts[self.court_type_column]), ptrs.key_word_preproc_func)
+            self.courts_by_type), ptrs.key_word_preproc_func)
         self.finder_jur = PhraseFinder(UniversalCourtsParser.get_unique_col_values(
-            self.courts[self.jurisdiction_column]), ptrs.key_word_preproc_func)
+            dict.fromkeys(c.jurisdiction for c in self.court_records)), ptrs.key_word_preproc_func)
 
     def parse(self, text: str, locale: str = None) -> List[CourtAnnotation]:
         """
@@ -158,23 +190,37 @@ class UniversalCourtsParser:
             'Extracted Entity Court Type': 'Verfassungsgericht',
             'Extracted Entity Court Jurisdiction': 'Sachsen'}
         """
-        self.annotations = []
-        self.locale = locale
-        self.find_courts_by_alias_in_whole_text(text)
+        ctx = ParsingContext(locale)
+        self.find_courts_by_alias_in_whole_text(text, ctx)
 
         # if the whole text doesn't contain the key word (gericht) - skip all the following
         if self.phrase_match_pattern is not None:
             if self.phrase_match_pattern.search(text, re.IGNORECASE) is None:
-                return self.annotations
+                return ctx.annotations
 
         for phrase in self.proc.split_text_on_line_with_endings(text, self.phrase_split_ptrs):
             # if the phrase doesn't contain the key word (e.g., gericht for deutsche) - skip the phrase
             if self.phrase_match_pattern is not None:
                 if self.phrase_match_pattern.search(phrase.text, re.IGNORECASE) is None:
                     continue
-            self.find_court_by_any_key(phrase)
+            self.find_court_by_any_key(phrase, ctx)
 
-        return self.annotations
+        return ctx.annotations
+
+    def parse_many(self, texts: Iterable[str], locale: str = None,
+                   workers: int = 1, use_processes: bool = False,
+                   chunksize: int = None) -> List[List[CourtAnnotation]]:
+        """
+        Parse each of the texts, see parse() and parsing_context.parse_many()
+        :param texts: texts being processed
+        :param locale: 'En', 'Es', ...
+        :param workers: number of threads (processes) parsing the texts
+        :param use_processes: use process pool instead of thread pool
+        :param chunksize: number of texts sent to a worker process at once
+        :return: list of annotation lists in the order of the texts
+        """
+        return parse_many(self.parse, texts, locale, workers=workers, use_processes=use_processes,
+                          chunksize=chunksize)
 
     def load_courts(self, dataframe_paths: List[str]):
         frames = []
@@ -190,16 +236,40 @@ class UniversalCourtsParser:
             frames.append(frame)
         self.courts = pd.concat(frames)
 
-    def find_courts_by_alias_in_whole_text(self, text: str) -> None:
+    def build_court_indexes(self) -> None:
+        """
+        Convert the courts dataframe to CourtRecord-s and build hash indexes by court name, alias,
+        type and (type, jurisdiction) so that parsing doesn't need to filter the dataframe.
+        """
+        names = self.courts[self.court_name_column].values
+        types = self.courts[self.court_type_column].values
+        jurisdictions = self.courts[self.jurisdiction_column].values
+        aliases = self.courts[self.court_alias_column].values if self.court_alias_column else [''] * len(names)
+        self.court_records = [CourtRecord(*row) for row in zip(names, types, jurisdictions, aliases)]
+
+        by_name, by_alias, by_type, by_type_jur = {}, {}, {}, {}
+        for court in self.court_records:
+            by_name.setdefault(court.name, []).append(court)
+            by_type.setdefault(court.court_type, []).append(court)
+            by_type_jur.setdefault((court.court_type, court.jurisdiction), []).append(court)
+            if self.court_alias_column:
+                by_alias.setdefault(court.alias, []).append(court)
+
+        self.courts_by_name = {k: tuple(v) for k, v in by_name.items()}
+        self.courts_by_alias = {k: tuple(v) for k, v in by_alias.items()}
+        self.courts_by_type = {k: tuple(v) for k, v in by_type.items()}
+        self.courts_by_type_and_jurisdiction = {k: tuple(v) for k, v in by_type_jur.items()}
+
+    def find_courts_by_alias_in_whole_text(self, text: str, ctx: ParsingContext) -> None:
         if self.finder_court_alias is None:
             return
         for m in self.finder_court_alias.find_word(text):
             alias = m[0]
-            rows = self.courts.loc[self.courts[self.court_alias_column] == alias]
+            rows = self.courts_by_alias.get(alias, ())
             match_found = MatchFound(rows, m[1], m[2], text[m[1]:m[2]])
-            self.add_annotation(match_found)
+            self.add_annotation(match_found, ctx)
 
-    def find_court_by_any_key(self, phrase: LineOrPhrase):
+    def find_court_by_any_key(self, phrase: LineOrPhrase, ctx: ParsingContext):
         # find by court names
         matches = []
         matches += self.find_court_by_name(phrase)
@@ -209,11 +279,11 @@ class UniversalCourtsParser:
             return
         # find the best match
         matches.sort(key=lambda m: m.make_sort_key())
-        self.add_annotation(matches[0])
+        self.add_annotation(matches[0], ctx)
 
     def find_court_by_name(self, phrase: LineOrPhrase) -> List[MatchFound]:
         match = self.find_court_by_key_column(phrase, self.finder_court_name,
-                                                self.court_name_column)
+                                                self.courts_by_name)
         if match is None:
             return []
 
@@ -222,11 +292,12 @@ class UniversalCourtsParser:
 
     def find_court_by_key_column(self, phrase: LineOrPhrase,
                                  phrase_finder: PhraseFinder,
-                                 column: str) -> Tuple[MatchFound, List[PhraseMatch]]:
+                                 courts_by_key: Dict[str, Tuple[CourtRecord, ...]]) \
+            -> Tuple[MatchFound, List[PhraseMatch]]:
         found_substrings = phrase_finder.find_word(phrase.text, True)
         if len(found_substrings) == 0:
             return None
-        subset = self.courts.loc[self.courts[column] == found_substrings[0][0]]
+        subset = courts_by_key.get(found_substrings[0][0], ())
         if len(subset) == 0:
             return None
 
@@ -249,7 +320,7 @@ class UniversalCourtsParser:
             # (without commas or conjuctions)
             matches = []
             for ct in court_types:
-                m = MatchFound([],
+                m = MatchFound((),
                                phrase.start + ct[1],
                                phrase.start + ct[2],
                                phrase.text[ct[1]:ct[2]])
@@ -259,10 +330,9 @@ class UniversalCourtsParser:
             return matches
 
         if len(court_jurs) == 0:
-            subset = self.courts.loc[self.courts[self.court_type_column] == court_types[0][0]]
+            subset = self.courts_by_type.get(court_types[0][0], ())
         else:
-            subset = self.courts.loc[(self.courts[self.court_type_column] == court_types[0][0]) &
-                                     (self.courts[self.jurisdiction_column] == court_jurs[0][0])]
+            subset = self.courts_by_type_and_jurisdiction.get((court_types[0][0], court_jurs[0][0]), ())
 
         match = MatchFound(subset,
                            phrase.start,
@@ -273,30 +343,204 @@ class UniversalCourtsParser:
             match.court_type = court_types[0][0]
         return [match]
 
-    def add_annotation(self, match: MatchFound):
+    def add_annotation(self, match: MatchFound, ctx: ParsingContext):
         mlen = len(match.subset)
 
-        name = match.subset[self.court_name_column].values[0] \
+        name = match.subset[0].name \
             if match.is_exact else \
             match.court_name if match.court_name is not None else \
-            match.subset[self.court_name_column].values[0] if mlen > 0 else ''
+            match.subset[0].name if mlen > 0 else ''
 
-        court_type = match.subset[self.court_type_column].values[0] \
+        court_type = match.subset[0].court_type \
             if match.is_exact else \
             match.court_type if match.court_type is not None else \
-            match.subset[self.court_type_column].values[0] if mlen > 0 else ''
+            match.subset[0].court_type if mlen > 0 else ''
 
-        jurisdiction = match.subset[self.jurisdiction_column].values[0] \
+        jurisdiction = match.subset[0].jurisdiction \
             if match.is_exact else \
             match.jurisdiction if match.jurisdiction is not None else \
-                match.subset[self.jurisdiction_column].values[0] if mlen > 0 else ''
+            match.subset[0].jurisdiction if mlen > 0 else ''
 
         ant = CourtAnnotation(name=name, coords=(match.entry_start, match.entry_end),
-                              locale=self.locale, text=match.text)
+                              locale=ctx.locale, text=match.text)
         ant.jurisdiction = jurisdiction
         ant.court_type = court_type
-        self.annotations.append(ant)
+        ctx.annotations.append(ant)
 
     @staticmethod
     def get_unique_col_values(col_values):
-        return [c for c in col_values.unique() if c]
+        """
+        Get non-empty unique values keeping the order they first appear in. Accepts a pandas column
+        or any iterable (e.g. keys of the court lookup tables).
+        """
+        values = col_values.unique() if hasattr(col_values, 'unique') else dict.fromkeys(col_values)
+        return [c for c in values if c]
+
+
+# Directory for caching prepared court parsers between process starts, caching is off if not set
+COURTS_CACHE_DIR_ENV = 'LEXNLP_COURTS_CACHE_DIR'
+
+
+class LazyCourtsParser:
+    """
+    Proxy for a module-level UniversalCourtsParser which creates the parser on first use.
+
+    Creating a parser reads the court CSV files and prepares the phrase finders, so the modules
+    exposing a court parser (lexnlp.extract.en.courts, ...) don't do it at import time.
+    Call warm_up() to create the parser explicitly - e.g. in a pre-fork server before forking workers.
+
+    If cache_dir is passed or LEXNLP_COURTS_CACHE_DIR environment variable is set the prepared parser
+    is pickled to this directory and loaded from there on the next cold start. The cache file name
+    contains a fingerprint of the lexnlp version, the source code of this module and of the setup function,
+    so the cache is rebuilt when the parser code or its setup changes, and also when any of the court
+    CSV files has changed.
+
+    Unpickling can run arbitrary code: the cache directory must be writable only by the user running
+    lexnlp. Cache files owned by another user or writable by group / others are ignored (on POSIX).
+    """
+
+    def __init__(self, setup_func: Callable[[], UniversalCourtsParser], cache_name: str = None,
+                 cache_dir: str = None):
+        """
+        :param setup_func: function creating the parser
+        :param cache_name: file name prefix of the parser in the cache directory,
+        the parser is not cached if it is not set
+        :param cache_dir: cache directory, LEXNLP_COURTS_CACHE_DIR environment variable if not set
+        """
+        self.setup_func = setup_func
+        self.cache_name = cache_name
+        self.cache_dir = cache_dir
+        self._parser = None  # type: UniversalCourtsParser
+        self._lock = threading.Lock()
+        _LAZY_COURTS_PARSERS.add(self)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._parser is not None
+
+    def get_parser(self) -> UniversalCourtsParser:
+        parser = self._parser
+        if parser is None:
+            with self._lock:
+                if self._parser is None:
+                    self._parser = self.load_parser()
+                parser = self._parser
+        return parser
+
+    def warm_up(self) -> UniversalCourtsParser:
+        """
+        Create the parser (or load it from the cache) now instead of on first use.
+        """
+        return self.get_parser()
+
+    def get_code_fingerprint(self) -> str:
+        """
+        Hash of the lexnlp version, the source code of this module and of the module defining setup_func
+        and the name of setup_func - the things which define the parser besides the court CSV files.
+        """
+        fingerprint = hashlib.sha1(__version__.encode('utf-8'))
+        setup_name = '{0}.{1}'.format(getattr(self.setup_func, '__module__', ''),
+                                      getattr(self.setup_func, '__qualname__', repr(self.setup_func)))
+        fingerprint.update(setup_name.encode('utf-8'))
+        source_paths = [__file__]
+        try:
+            source_paths.append(inspect.getsourcefile(self.setup_func))
+        except TypeError:
+            # built-in or C function
+            pass
+        for path in source_paths:
+            if path and os.path.isfile(path):
+                with open(path, 'rb') as source_file:
+                    fingerprint.update(source_file.read())
+        return fingerprint.hexdigest()
+
+    def get_cache_path(self) -> str:
+        cache_dir = self.cache_dir or os.environ.get(COURTS_CACHE_DIR_ENV)
+        if not cache_dir or not self.cache_name:
+            return None
+        return os.path.join(cache_dir, '{0}_{1}_{2}.pickle'.format(
+            self.cache_name, __version__, self.get_code_fingerprint()[:16]))
+
+    @staticmethod
+    def get_sources_signature(dataframe_paths: List[str]) -> List[Tuple[str, float, int]]:
+        signature = []
+        for path in dataframe_paths:
+            try:
+                stat = os.stat(path)
+                signature.append((os.path.abspath(path), stat.st_mtime, stat.st_size))
+            except OSError:
+                # not a local file (URL)
+                signature.append((path, 0, 0))
+        return signature
+
+    @staticmethod
+    def is_trusted_cache_file(cache_path: str) -> bool:
+        """
+        Check that the cache file is owned by the current user and is not writable by group or others.
+        """
+        if not hasattr(os, 'getuid'):
+            return True
+        stat = os.stat(cache_path)
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def load_parser(self) -> UniversalCourtsParser:
+        cache_path = self.get_cache_path()
+        if cache_path and os.path.isfile(cache_path):
+            try:
+                if self.is_trusted_cache_file(cache_path):
+                    with open(cache_path, 'rb') as cache_file:
+                        fingerprint, signature, parser = pickle.load(cache_file)
+                    if fingerprint == self.get_code_fingerprint() and \
+                            signature == self.get_sources_signature(parser.dataframe_paths):
+                        return parser
+            except Exception:
+                # broken or incompatible cache file - rebuild it
+                pass
+
+        parser = self.setup_func()
+        if cache_path:
+            self.save_parser(parser, cache_path)
+        return parser
+
+    def save_parser(self, parser: UniversalCourtsParser, cache_path: str) -> None:
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(cache_path), mode=0o700, exist_ok=True)
+            tmp_path = '{0}.{1}.tmp'.format(cache_path, os.getpid())
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as cache_file:
+                pickle.dump((self.get_code_fingerprint(), self.get_sources_signature(parser.dataframe_paths),
+                             parser),
+                            cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except Exception:
+            # caching is an optimization only
+            pass
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.get_parser(), name)
+
+
+# all LazyCourtsParser instances: their locks are re-created in the child process after fork
+# because a lock could be held by another thread of the parent process at the moment of fork
+_LAZY_COURTS_PARSERS = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _reset_lazy_courts_parser_locks():
+    for lazy_parser in list(_LAZY_COURTS_PARSERS):
+        lazy_parser._reset_lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_lazy_courts_parser_locks)
@@ -0,0 +1,65 @@
+"""Word windows around a position in text.
+
+Language-neutral helpers used by the amount extractors to look for the unit after an amount
+("25 shares of Common Stock") and the currency prefix before it ("CHF 25").
+
+Todo:
+"""
+
+# Imports
+from typing import Optional
+
+import regex as re
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+NON_SPACE_RE = re.compile(r'\S+')
+
+# Number of words after an amount searched for its unit ("25 shares of Common Stock")
+# and before an amount searched for its currency prefix ("CHF 25")
+AMOUNT_UNIT_WINDOW = 20
+
+
+def get_next_words(text: str, start: int, window: Optional[int] = AMOUNT_UNIT_WINDOW) -> str:
+    """
+    Get text starting at the position and containing up to "window" whitespace-separated words.
+    :param text: text
+    :param start: start position
+    :param window: number of words, the whole rest of the text is returned if None
+    :return: text[start:end]
+    """
+    if window is None:
+        return text[start:]
+    end = start
+    for i, word in enumerate(NON_SPACE_RE.finditer(text, start)):
+        end = word.end()
+        if i + 1 >= window:
+            return text[start:end]
+    return text[start:]
+
+
+def get_prev_words(text: str, end: int, window: Optional[int] = AMOUNT_UNIT_WINDOW) -> str:
+    """
+    Get text ending at the position and containing up to "window" whitespace-separated words.
+    :param text: text
+    :param end: end position
+    :param window: number of words, the whole text before the position is returned if None
+    :return: text[start:end]
+    """
+    if window is None:
+        return text[:end]
+    start = end
+    for _ in range(window):
+        while start > 0 and text[start - 1].isspace():
+            start -= 1
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        if start == 0:
+            break
+    return text[start:end]
@@ -8,12 +8,17 @@ Todo:
 # pylint: disable=broad-except
 
 import string
-from typing import Generator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Generator, Iterable, List, Optional
 
 import nltk
 import regex as re
 from num2words import num2words, CONVERTER_CLASSES
 
+from lexnlp.extract.common.word_windows import AMOUNT_UNIT_WINDOW, get_next_words, get_prev_words
+from lexnlp.extract.en.utils import pos_tagger, get_chunker, WORD_TOKENIZER
+
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -50,83 +55,95 @@ grammar = r"""
         {<NBAR>}
         {<NBAR><IN><NBAR>}  # Above, connected with in/of/etc...
 """
-chunker = nltk.RegexpParser(grammar)
+chunker = get_chunker(grammar)
 
 
 def get_np(text) -> Generator:
-    tokens = nltk.word_tokenize(text)
-    pos_tokens = nltk.tag.pos_tag(tokens)
-    chunks = chunker.parse(pos_tokens)
+    chunks = pos_tagger.chunk(text, chunker, WORD_TOKENIZER)
     for subtree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
         np = ' '.join([i[0] for i in subtree.leaves()])
         yield np
 
 
-class AmountParserDE(object):
-    QUARTER = 'viertel'
-
-    def __init__(self):
-
-        self.language = 'de'
-
-        N2W_CONFIG = CONVERTER_CLASSES[self.language]
-
-        self.BIG_NUMBERS_EXPONENT = [3, 6, 9, 12]
-        self.ONE = N2W_CONFIG.low_numwords[-2]
-        self.HUNDRED = dict(N2W_CONFIG.mid_numwords)[100]
-
-        UNIQUE_NUMBERS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19,
-                          20, 30, 40, 50, 60, 70, 80, 90,
-                          100, 1000, 1000000, 1000000000, 1000000000000]
-        UNIQUE_NUMBERS_MAP = {num2words(n, ordinal=True, lang=self.language).replace('eine ', ''): n
-                              for n in UNIQUE_NUMBERS}
-        UNIQUE_NUMBERS_MAP.update(
-            {num2words(n, lang=self.language).replace('eine ', ''): n for n in UNIQUE_NUMBERS})
-        UNIQUE_NUMBERS_MAP.update(
-            {'ein': 1,
-             'eine': 1,
-             'einen': 1,
-             'einhalb': 0.5,
-             'millionen': 1000000,
-             'millionenste': 1000000,
-             'milliarden': 1000000000,
-             'milliardenste': 1000000000})
-
-        self.UNIQUE_NUMBERS_MAP = UNIQUE_NUMBERS_MAP
-
-        self.MAGNITUDE_MAP = {num2words(10 ** n, lang=self.language).replace('eine ', ''): 10 ** n
-                              for n in self.BIG_NUMBERS_EXPONENT}
-        self.MAGNITUDE_MAP.update(
-            {'millionen': 1000000,
-             'millionenste': 1000000,
-             'milliarden': 1000000000,
-             'milliardenste': 1000000000,
-             'halbe': 0.5,
-             'k': 1000,
-             'm': 1000000,
-             'b': 1000000000})
-
-        unique_number_list = list(self.UNIQUE_NUMBERS_MAP.keys())
-        unique_number_list.sort(key=len, reverse=True)
-        self.UNIQUE_NUMBER_SPLIT_RE = re.compile(r'({}|\s+)'.format('|'.join(unique_number_list)))
-
-        self.NUM_PTN = r"""
+LANGUAGE = 'de'
+
+N2W_CONFIG = CONVERTER_CLASSES[LANGUAGE]
+
+BIG_NUMBERS_EXPONENT = [3, 6, 9, 12]
+
+UNIQUE_NUMBERS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19,
+                  20, 30, 40, 50, 60, 70, 80, 90,
+                  100, 1000, 1000000, 1000000000, 1000000000000]
+UNIQUE_NUMBERS_MAP = {num2words(n, ordinal=True, lang=LANGUAGE).replace('eine ', ''): n
+                      for n in UNIQUE_NUMBERS}
+UNIQUE_NUMBERS_MAP.update(
+    {num2words(n, lang=LANGUAGE).replace('eine ', ''): n for n in UNIQUE_NUMBERS})
+UNIQUE_NUMBERS_MAP.update(
+    {'ein': 1,
+     'eine': 1,
+     'einen': 1,
+     'einhalb': 0.5,
+     'millionen': 1000000,
+     'millionenste': 1000000,
+     'milliarden': 1000000000,
+     'milliardenste': 1000000000})
+
+MAGNITUDE_MAP = {num2words(10 ** n, lang=LANGUAGE).replace('eine ', ''): 10 ** n
+                 for n in BIG_NUMBERS_EXPONENT}
+MAGNITUDE_MAP.update(
+    {'millionen': 1000000,
+     'millionenste': 1000000,
+     'milliarden': 1000000000,
+     'milliardenste': 1000000000,
+     'halbe': 0.5,
+     'k': 1000,
+     'm': 1000000,
+     'b': 1000000000})
+
+UNIQUE_NUMBER_LIST = list(UNIQUE_NUMBERS_MAP.keys())
+UNIQUE_NUMBER_LIST.sort(key=len, reverse=True)
+UNIQUE_NUMBER_SPLIT_RE = re.compile(r'({}|\s+)'.format('|'.join(UNIQUE_NUMBER_LIST)))
+
+NUM_PTN = r"""
         (?:
         (?:[\.\d][\d\.,]*\s+|\W|^)
         (?:(?:(?:in)?viertel|halbe|{written_unique_numbers}|und)\s?)+(?:\W|$)|
         (?:[\.\d][\d\.,\s]*)
         )
-        """.format(written_unique_numbers='|'.join(unique_number_list))
-        self.NUM_PTN_RE = re.compile(self.NUM_PTN,
-                                     re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
+        """.format(written_unique_numbers='|'.join(UNIQUE_NUMBER_LIST))
+NUM_PTN_RE = re.compile(NUM_PTN, re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
+
+NON_WRIT_RE = re.compile(r'[\d\.,\s]+')
+
+MIXED_WRIT_RE = re.compile(r'(^[\d\.]*)(.+)', re.DOTALL)
 
-        self.NON_WRIT_RE = re.compile(r'[\d\.,\s]+')
+QUARTER_RE = re.compile(r'(?:\s*und\s+)?(ein|eine|zwei|drei)\s*viertel')
 
-        self.MIXED_WRIT_RE = re.compile(r'(^[\d\.]*)(.+)', re.DOTALL)
+WRONG_FULLMATCH_RE = re.compile(r'\W*und\W*|\W+', re.IGNORECASE | re.MULTILINE | re.DOTALL)
 
-        self.QUARTER_RE = re.compile(r'(?:\s*und\s+)?(ein|eine|zwei|drei)\s*viertel')
 
-        self.WRONG_FULLMATCH_RE = re.compile(r'\W*und\W*|\W+', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+class AmountParserDE(object):
+    """
+    German amounts parser. The number tables and regexes are built once on the module import
+    and shared by all the instances, the instances don't have their own state.
+    """
+    __slots__ = ()
+
+    QUARTER = 'viertel'
+
+    language = LANGUAGE
+    BIG_NUMBERS_EXPONENT = BIG_NUMBERS_EXPONENT
+    ONE = N2W_CONFIG.low_numwords[-2]
+    HUNDRED = dict(N2W_CONFIG.mid_numwords)[100]
+    UNIQUE_NUMBERS_MAP = UNIQUE_NUMBERS_MAP
+    MAGNITUDE_MAP = MAGNITUDE_MAP
+    UNIQUE_NUMBER_SPLIT_RE = UNIQUE_NUMBER_SPLIT_RE
+    NUM_PTN = NUM_PTN
+    NUM_PTN_RE = NUM_PTN_RE
+    NON_WRIT_RE = NON_WRIT_RE
+    MIXED_WRIT_RE = MIXED_WRIT_RE
+    QUARTER_RE = QUARTER_RE
+    WRONG_FULLMATCH_RE = WRONG_FULLMATCH_RE
 
     def cleanup(self, text):
         text = text.lower().replace(',', '.').replace('-', ' ').strip(string.whitespace).rstrip(
@@ -194,13 +211,16 @@ class AmountParserDE(object):
 
         return n + g + d
 
-    def parse(self, text, return_sources=False, extended_sources=True, float_digits=4) -> Generator:
+    def parse(self, text, return_sources=False, extended_sources=True, float_digits=4,
+              unit_window: Optional[int] = AMOUNT_UNIT_WINDOW) -> Generator:
         """
         Find possible amount references in the text.
         :param text: text
         :param return_sources: return amount AND source text
         :param extended_sources: return data around amount itself
         :param float_digits: round float to N digits, don't round if None
+        :param unit_window: number of words after (before) the amount searched for its unit (currency prefix)
+        for extended sources, the whole rest of the text is searched if None
         :return: list of amounts
         """
         for match in self.NUM_PTN_RE.finditer(text):
@@ -219,7 +239,7 @@ class AmountParserDE(object):
             if return_sources:
                 if extended_sources:
                     unit = ''
-                    next_text = text[match.span()[1]:]
+                    next_text = get_next_words(text, match.span()[1], unit_window)
                     if next_text:
                         for np in get_np(next_text):
                             if next_text.startswith(np):
@@ -227,7 +247,7 @@ class AmountParserDE(object):
                         if unit:
                             found_item = ' '.join([found_item.strip(), unit])
                     if not unit:
-                        prev_text = text[:match.span()[0]]
+                        prev_text = get_prev_words(text, match.span()[0], unit_window)
                         prev_text_tags = nltk.word_tokenize(prev_text)
                         if prev_text_tags and prev_text_tags[-1].lower() in allowed_prev_units:
                             sep = ' ' if text[match.span()[0] - 1] == ' ' else ''
@@ -238,8 +258,25 @@ class AmountParserDE(object):
                 yield amount
 
 
-get_amounts = AmountParserDE().parse
+amounts_parser = AmountParserDE()
+get_amounts = amounts_parser.parse
 
 
 def get_amount_list(*args, **kwargs):
     return list(get_amounts(*args, **kwargs))
+
+
+def get_amounts_many(texts: Iterable[str], workers: int = 1, chunksize: int = 16, **kwargs) -> List[List]:
+    """
+    Find amounts in each of the texts.
+    :param texts: texts to parse
+    :param workers: number of worker processes, texts are parsed in the current process if it is 1 or less
+    :param chunksize: number of texts sent to a worker process at once
+    :param kwargs: get_amounts() arguments: return_sources, extended_sources, float_digits, unit_window
+    :return: list of amount lists in the order of the texts
+    """
+    parse_func = partial(get_amount_list, **kwargs)
+    if not workers or workers <= 1:
+        return [parse_func(text) for text in texts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_func, texts, chunksize=chunksize))
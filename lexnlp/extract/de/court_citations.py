@@ -1,7 +1,8 @@
 import regex as re
-from typing import List, Tuple, Generator
+from typing import List, Tuple, Generator, Iterable
 from lexnlp.extract.common import year_parser
 from lexnlp.extract.common.annotations.court_citation_annotation import CourtCitationAnnotation
+from lexnlp.extract.common.parsing_context import ParsingContext, parse_many
 from lexnlp.extract.de.dates import get_dates
 from lexnlp.utils.lines_processing.phrase_finder import PhraseFinder
 
@@ -57,46 +58,49 @@ class CourtCitationsParser:
         reg_split_by_registry = re.compile("|".join(list(registries.keys())))
     # endregion
 
-    def __init__(self):
-        self.locale = 'de'
-        self.items = []  # List[CourtCitationAnnotation]
-        self.locale = None
-
     def parse(self, text: str, locale: str = None) -> List[CourtCitationAnnotation]:
-        self.items = []
-        self.locale = locale
-        self.find_citations_in_embraced_text(text)
-        return self.items
-
-    def find_citations_in_embraced_text(self, text: str) -> None:
+        ctx = ParsingContext(locale)
+        self.find_citations_in_embraced_text(text, ctx)
+        return ctx.annotations
+
+    def parse_many(self, texts: Iterable[str], locale: str = None,
+                   workers: int = 1, use_processes: bool = False,
+                   chunksize: int = None) -> List[List[CourtCitationAnnotation]]:
+        """
+        Parse each of the texts, see parsing_context.parse_many()
+        """
+        return parse_many(self.parse, texts, locale, workers=workers, use_processes=use_processes,
+                          chunksize=chunksize)
+
+    def find_citations_in_embraced_text(self, text: str, ctx: ParsingContext) -> None:
         fragment_start = 0
         for embraced_text in CourtCitationsParser.reg_cite_chunk.finditer(text):
             start = embraced_text.start()
 
             # process text before braces
             fragment = text[fragment_start:start]
-            self.split_chunk_and_find_citations(fragment, fragment_start)
+            self.split_chunk_and_find_citations(fragment, fragment_start, ctx)
             fragment_start = embraced_text.end() + 1
 
             # process text in braces
-            self.process_chunks_in_embraced_text(embraced_text, start)
+            self.process_chunks_in_embraced_text(embraced_text, start, ctx)
 
         fragment = text[fragment_start:-1]
-        self.split_chunk_and_find_citations(fragment, fragment_start)
+        self.split_chunk_and_find_citations(fragment, fragment_start, ctx)
 
-    def process_chunks_in_embraced_text(self, embraced_text: str, start) -> None:
+    def process_chunks_in_embraced_text(self, embraced_text: str, start, ctx: ParsingContext) -> None:
         parts = embraced_text.group().split(';')
         for part in parts:
-            self.get_detail_from_chunk(part, start)
+            self.get_detail_from_chunk(part, start, ctx)
             start += len(part) + 1
         return
 
-    def split_chunk_and_find_citations(self, text: str, start: int) -> None:
+    def split_chunk_and_find_citations(self, text: str, start: int, ctx: ParsingContext) -> None:
         chunks = self.split_text_by_keywords(text)
         for chunk in chunks:
-            self.get_detail_from_chunk(chunk[0], chunk[1] + start)
+            self.get_detail_from_chunk(chunk[0], chunk[1] + start, ctx)
 
-    def get_detail_from_chunk(self, chunk_text: str, chunk_start: int) -> None:
+    def get_detail_from_chunk(self, chunk_text: str, chunk_start: int, ctx: ParsingContext) -> None:
         chunk_body = chunk_text.strip(r'() \t')
         dates = self.get_dates_from_text(chunk_body)
         registries = self.get_registries_from_text(chunk_body)
@@ -110,12 +114,12 @@ class CourtCitationsParser:
         ant = CourtCitationAnnotation(name=chunk_body,
                                       coords=(start, end),
                                       text=chunk_body,
-                                      locale=self.locale)
-        ant.locale = self.locale
+                                      locale=ctx.locale)
+        ant.locale = ctx.locale
         if len(registries) > 0:
             ant.name = CourtCitationsParser.registries[registries[0].value]
             ant.short_name = self.get_reference_from_registry(registries[0], chunk_body)
-        self.items.append(ant)
+        ctx.annotations.append(ant)
 
     def get_reference_from_registry(self, registry: PossibleToken,
                                     chunk_body: str) -> str:
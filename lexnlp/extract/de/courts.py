@@ -4,7 +4,8 @@ import os
 import re
 from typing import Generator, List
 from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    LazyCourtsParser
 from lexnlp.extract.de.language_tokens import DeLanguageTokens
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
 
@@ -15,10 +16,12 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-def setup_de_parser():
-    def preproc_func(text):
-        return re.sub('e$', '[e]?', text)
+def preproc_func(text):
+    # module-level function - the parser should be picklable for parse_many(use_processes=True)
+    return re.sub('e$', '[e]?', text)
+
 
+def setup_de_parser():
     ptrs = ParserInitParams()
     ptrs.key_word_preproc_func = preproc_func
     ptrs.court_pattern_checker = re.compile('gericht')
@@ -37,7 +40,15 @@ def setup_de_parser():
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_de_parser()
+# created on first use, see LazyCourtsParser
+parser = LazyCourtsParser(setup_de_parser, cache_name='de_courts')
+
+
+def warm_up() -> UniversalCourtsParser:
+    """
+    Create the German court parser now (or load it from LEXNLP_COURTS_CACHE_DIR) instead of on first use.
+    """
+    return parser.warm_up()
 
 
 def get_courts(text: str, language=None) -> Generator[dict, None, None]:
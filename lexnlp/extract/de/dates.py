@@ -13,5 +13,21 @@ parser = DateParser(enable_classifier_check=False, language='de',
                     dateparser_settings={'PREFER_DAY_OF_MONTH': 'first',
                                          'STRICT_PARSING': False,
                                          'DATE_ORDER': 'DMY'})
-get_dates = parser.get_dates
-get_date_list = parser.get_date_list
+
+
+def get_dates(text=None, language=None, scorer=None):
+    """
+    Get dates from German text
+    :param text: str - text to search dates in
+    :param language: str - two-letters language definition
+    :param scorer: DateScorer or "classifier" / "rules" / "defer" - candidate scorer,
+        no scoring if None
+    """
+    return parser.get_dates(text, language, scorer=scorer)
+
+
+def get_date_list(text=None, language=None, scorer=None):
+    """
+    Get list of dates from German text, see get_dates
+    """
+    return list(get_dates(text, language, scorer=scorer))
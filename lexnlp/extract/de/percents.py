@@ -1,7 +1,7 @@
 import regex as re
 from typing import Generator
 
-from lexnlp.extract.de.amounts import AmountParserDE
+from lexnlp.extract.de.amounts import amounts_parser
 
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -12,7 +12,6 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-amounts_parser = AmountParserDE()
 get_amounts = amounts_parser.parse
 
 
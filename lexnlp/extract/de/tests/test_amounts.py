@@ -1,6 +1,6 @@
 from unittest import TestCase
 from num2words import num2words
-from lexnlp.extract.de.amounts import get_amounts
+from lexnlp.extract.de.amounts import get_amounts, get_amounts_many, AmountParserDE, amounts_parser
 
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -85,3 +85,15 @@ class TestGetAmounts(AssertionMixin):
 
     def test_wrong_cases(self):
         self.assertSortedListEqual(list(get_amounts('...%')), [])
+
+    def test_get_amounts_many(self):
+        texts = ['Sein Volumen beträgt 10 Liter und kostet dreißig Dollar', '', 'Es sind 200 000 EURO']
+        expected = [list(get_amounts(text)) for text in texts]
+        self.assertListEqual(expected, get_amounts_many(texts))
+        self.assertListEqual(expected, get_amounts_many(texts, workers=2, chunksize=1))
+
+    def test_shared_parser(self):
+        parser = AmountParserDE()
+        self.assertIs(parser.NUM_PTN_RE, amounts_parser.NUM_PTN_RE)
+        with self.assertRaises(AttributeError):
+            parser.language = 'en'
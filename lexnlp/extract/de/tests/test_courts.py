@@ -1,3 +1,5 @@
+import os
+import tempfile
 from unittest import TestCase
 from lexnlp.extract.de.courts import get_court_list, get_courts
 from lexnlp.tests.test_utils import load_resource_document
@@ -55,3 +57,39 @@ class TestParseDeCourts(TestCase):
         self.assertEqual(2, len(ret))
         jurisdiction = ret[0]["tags"]["Extracted Entity Court Jurisdiction"]
         self.assertEqual("Federal", jurisdiction)
+
+    def test_parse_many(self):
+        from lexnlp.extract.de.courts import parser
+        texts = ["Bei dir läuft, deine Verfassungsgerichtshof des Freistaates Sachsen rauchen Joints vor der Kamera.",
+                 " vom Amtsgericht Stuttgart als zentralem Mahngericht bearbeitet, Amtsgerichte  Pforzheim",
+                 ""] * 4
+        expected = [[(a.name, a.coords, a.locale) for a in parser.parse(t, 'de')] for t in texts]
+        for use_processes in (False, True):
+            actual = parser.parse_many(texts, 'de', workers=2, use_processes=use_processes)
+            self.assertEqual(expected, [[(a.name, a.coords, a.locale) for a in ants] for ants in actual])
+        actual = parser.parse_many(texts, 'de', workers=2, use_processes=True, chunksize=5)
+        self.assertEqual(expected, [[(a.name, a.coords, a.locale) for a in ants] for ants in actual])
+
+    def test_lazy_parser_cache(self):
+        from lexnlp.extract.common.universal_court_parser import LazyCourtsParser
+        from lexnlp.extract.de.courts import setup_de_parser
+        from lexnlp.extract.es.courts import setup_es_parser
+        text = " vom Amtsgericht Stuttgart als zentralem Mahngericht bearbeitet, Amtsgerichte  Pforzheim"
+        with tempfile.TemporaryDirectory() as cache_dir:
+            lazy_parser = LazyCourtsParser(setup_de_parser, cache_name='de_courts', cache_dir=cache_dir)
+            self.assertFalse(lazy_parser.is_loaded)
+            expected = [(a.name, a.coords) for a in lazy_parser.parse(text, 'de')]
+            self.assertTrue(lazy_parser.is_loaded)
+            cache_path = lazy_parser.get_cache_path()
+            self.assertEqual([os.path.basename(cache_path)], os.listdir(cache_dir))
+            self.assertTrue(LazyCourtsParser.is_trusted_cache_file(cache_path))
+
+            cached_parser = LazyCourtsParser(setup_de_parser, cache_name='de_courts', cache_dir=cache_dir).warm_up()
+            self.assertEqual(expected, [(a.name, a.coords) for a in cached_parser.parse(text, 'de')])
+
+            # the cache key depends on the setup function
+            self.assertNotEqual(cache_path, LazyCourtsParser(setup_es_parser, cache_name='de_courts',
+                                                             cache_dir=cache_dir).get_cache_path())
+            if hasattr(os, 'getuid'):
+                os.chmod(cache_path, 0o666)
+                self.assertFalse(LazyCourtsParser.is_trusted_cache_file(cache_path))
@@ -28,12 +28,16 @@ Avoids:
 
 # Imports
 import string
-from typing import Generator
+from functools import lru_cache
+from typing import Generator, Optional, Dict, Iterable, List
 
 import nltk
 import regex as re
 from num2words import num2words
 
+from lexnlp.extract.common.word_windows import AMOUNT_UNIT_WINDOW, get_next_words, get_prev_words
+from lexnlp.extract.en.utils import pos_tagger, get_chunker, WORD_TOKENIZER
+
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
 __license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
@@ -102,6 +106,10 @@ NUM_FRACTION_SUB_RE = re.compile(r'(?:\s*and)?(?:\s+no|\s*\d{1,2})/\d{1,3}')
 HALF_RE = re.compile(r'\s*and\s+a\s+half')
 QUARTER_RE = re.compile(r'(?:\s*and\s+)?(one|two|three)[\s-]+quarters?')
 AND_RE = re.compile(r'\W*and\W*', re.IGNORECASE | re.MULTILINE | re.DOTALL)
+EDGE_AND_RE = re.compile(r'\s+and\s*$|^\s*and\s+')
+
+# Max number of written amounts kept in text2num() cache
+TEXT2NUM_CACHE_SIZE = 10000
 
 FRACTION_PTN = r"(?:(?:\W|^)" \
                r"(?:one[\s-]+(?:{writ_ord_2_90}|hundredth|thousandth|(?:{writ_20_90})[\s-]+" \
@@ -139,23 +147,56 @@ grammar = r"""
         {<NBAR>}
         {<NBAR><IN><NBAR>}  # Above, connected with in/of/etc...
 """
-chunker = nltk.RegexpParser(grammar)
+chunker = get_chunker(grammar)
+
+
+def normalize_written_number(s: str) -> str:
+    """
+    Normalize written amount before converting it: lowercase, no commas, hyphens and
+    leading/trailing punctuation and "and"-s.
+    :param s: written number, e.g.: "One Hundred Twenty-Five, "
+    :return: normalized written number, e.g.: "one hundred twenty five"
+    """
+    s = s.lower().replace(',', '').replace('-', ' ').strip(string.whitespace).rstrip(
+        string.punctuation + string.whitespace)
+    s = EDGE_AND_RE.sub('', s)
+    if not (s.startswith('.') and s[1].isdigit()):
+        s = s.lstrip(string.punctuation + string.whitespace)
+    return s
 
 
 def text2num(s, search_fraction=True):
     """
     Convert written amount into integer/float.
+    The results are cached by the normalized written amount - contracts repeat the same amounts many times.
+    Failures are not cached: the exception is raised by each call.
     :param s: written number
     :param search_fraction: extract fraction
     :return: integer/float
     """
+    return _text2num_cached(normalize_written_number(s), search_fraction)
+
+
+@lru_cache(maxsize=TEXT2NUM_CACHE_SIZE)
+def _text2num_cached(s: str, search_fraction: bool):
+    """
+    Cached _text2num(), lru_cache doesn't cache the calls raising an exception.
+    Use _text2num_cached.cache_info() / cache_clear() to inspect / reset the cache.
+    """
+    return _text2num(s, search_fraction)
+
+
+def _text2num(s: str, search_fraction: bool = True):
+    """
+    Convert normalized written amount (see normalize_written_number()) into integer/float.
+    Regexes find the numeric prefix and fractions, then the number words are processed
+    one by one accumulating the current group and the total by SMALL_NUMBERS_MAP and MAGNITUDE_MAP.
+    :param s: normalized written number
+    :param search_fraction: extract fraction
+    :return: integer/float
+    """
     n = 0
     g = 0
-    s = s.lower().replace(',', '').replace('-', ' ').strip(string.whitespace).rstrip(
-        string.punctuation + string.whitespace)
-    s = re.sub(r'\s+and\s*$|^\s*and\s+', '', s)
-    if not (s.startswith('.') and s[1].isdigit()):
-        s = s.lstrip(string.punctuation + string.whitespace)
     if s in ['k', 'm', 'b']:
         return
     # if only number or float in string
@@ -225,25 +266,38 @@ def text2num(s, search_fraction=True):
 
 
 def get_np(text) -> Generator:
-    tokens = nltk.word_tokenize(text)
-    pos_tokens = nltk.tag.pos_tag(tokens)
-    chunks = chunker.parse(pos_tokens)
+    chunks = pos_tagger.chunk(text, chunker, WORD_TOKENIZER)
     for subtree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
         np = ' '.join([i[0] for i in subtree.leaves()])
         _np = ' '.join([wnl.lemmatize(i[0]) for i in subtree.leaves()])
         yield np, _np
 
 
-def get_amounts(text, return_sources=False, extended_sources=True, float_digits=4) -> Generator:
+def get_amounts(text, return_sources=False, extended_sources=True, float_digits=4,
+                unit_window: Optional[int] = AMOUNT_UNIT_WINDOW) -> Generator:
     """
     Find possible amount references in the text.
     :param text: text
     :param return_sources: return amount AND source text
     :param extended_sources: return data around amount itself
     :param float_digits: round float to N digits, don't round if None
+    :param unit_window: number of words after (before) the amount searched for its unit (currency prefix)
+    for extended sources, the whole rest of the text is searched if None
     :return: list of amounts
     """
-    for match in NUM_PTN_RE.finditer(text):
+    yield from get_amounts_of_matches(text, NUM_PTN_RE.finditer(text), return_sources=return_sources,
+                                      extended_sources=extended_sources, float_digits=float_digits,
+                                      unit_window=unit_window)
+
+
+def get_amounts_of_matches(text, matches: Iterable, return_sources=False, extended_sources=True, float_digits=4,
+                           unit_window: Optional[int] = AMOUNT_UNIT_WINDOW) -> Generator:
+    """
+    Convert NUM_PTN_RE matches found in the text into amounts, see get_amounts().
+    :param text: text
+    :param matches: NUM_PTN_RE matches in the text
+    """
+    for match in matches:
         found_item = match.group()
         if AND_RE.fullmatch(found_item):
             continue
@@ -258,7 +312,7 @@ def get_amounts(text, return_sources=False, extended_sources=True, float_digits=
         if return_sources:
             if extended_sources:
                 unit = ''
-                next_text = text[match.span()[1]:]
+                next_text = get_next_words(text, match.span()[1], unit_window)
                 if next_text:
                     for np, _ in get_np(next_text):
                         if next_text.startswith(np):
@@ -266,7 +320,7 @@ def get_amounts(text, return_sources=False, extended_sources=True, float_digits=
                     if unit:
                         found_item = ' '.join([found_item.strip(), unit])
                 if not unit:
-                    prev_text = text[:match.span()[0]]
+                    prev_text = get_prev_words(text, match.span()[0], unit_window)
                     prev_text_tags = nltk.word_tokenize(prev_text)
                     if prev_text_tags and prev_text_tags[-1].lower() in allowed_prev_units:
                         sep = ' ' if text[match.span()[0] - 1] == ' ' else ''
@@ -275,3 +329,45 @@ def get_amounts(text, return_sources=False, extended_sources=True, float_digits=
             yield (amount, found_item.strip())
         else:
             yield amount
+
+
+class NumericTextContext:
+    """
+    Text parsed by several numeric extractors (money, percents, durations, distances, ratios).
+    The lowercase text is calculated once and each number substring captured
+    by the extractors is converted with get_amounts() once.
+    """
+    __slots__ = ['text', 'float_digits', '_text_lower', '_amounts', '_number_matches']
+
+    def __init__(self, text: str, float_digits: Optional[int] = 4):
+        self.text = text
+        self.float_digits = float_digits
+        self._text_lower = None  # type: Optional[str]
+        self._amounts = {}  # type: Dict[str, List]
+        self._number_matches = None  # type: Optional[List]
+
+    @property
+    def text_lower(self) -> str:
+        if self._text_lower is None:
+            self._text_lower = self.text.lower()
+        return self._text_lower
+
+    @property
+    def number_matches(self) -> List:
+        """
+        NUM_PTN_RE matches in the text, found once
+        """
+        if self._number_matches is None:
+            self._number_matches = list(NUM_PTN_RE.finditer(self.text))
+        return self._number_matches
+
+    def get_amount_list(self, number_text: str) -> List:
+        """
+        :param number_text: number captured by an extractor, e.g.: "twenty five"
+        :return: list(get_amounts(number_text)), the list is shared between the calls
+        """
+        amounts = self._amounts.get(number_text)
+        if amounts is None:
+            amounts = list(get_amounts(number_text, float_digits=self.float_digits))
+            self._amounts[number_text] = amounts
+        return amounts
@@ -11,7 +11,7 @@ import copy
 from typing import Generator
 
 import regex as re
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.document import as_document
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -60,7 +60,7 @@ def get_conditions(text, strict=True) -> Generator:
     """
 
     # Iterate through all potential matches
-    for sentence in get_sentence_list(text):
+    for sentence in as_document(text).sentences:
         for match in RE_CONDITION.finditer(sentence):
             # Get individual group matches
             captures = match.capturesdict()
@@ -11,7 +11,7 @@ import re
 import string
 from typing import Generator
 
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.document import as_document
 from lexnlp.extract.en.utils import NPExtractor
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -60,7 +60,7 @@ def get_copyright(text, return_sources=False) -> Generator:
     """
     # Iterate through sentences
     if COPYRIGHT_PTN_RE.search(text):
-        for sentence in get_sentence_list(text):
+        for sentence in as_document(text).sentences:
             for phrase in np_extractor.get_np(sentence):
                 cps = COPYRIGHT_PTN_RE.findall(phrase)
                 for cp_text, cp_sign, cp_date, cp_name in cps:
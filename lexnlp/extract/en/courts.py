@@ -16,7 +16,8 @@ from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_f
 import os
 import re
 
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    LazyCourtsParser
 from lexnlp.extract.en.en_language_tokens import EnLanguageTokens
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
 
@@ -31,7 +32,8 @@ __email__ = "support@contraxsuite.com"
 def get_courts(text: str,
                court_config_list: List[Tuple[int, str, int, List[Tuple[str, str, bool, int]]]],
                priority: bool = False,
-               text_languages: List[str] = None) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
+               text_languages: List[str] = None,
+               return_spans: bool = False) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
     """
     Searches for courts from the provided config list and yields tuples of (court_config, court_alias).
     Court config is: (court_id, court_name, [list of aliases])
@@ -48,11 +50,14 @@ def get_courts(text: str,
     :param text_languages: Language(s) of the source text. If a language is specified then only aliases of this
     language will be searched for. For example: this allows ignoring "Island" - a German language
      alias of Iceland for English texts.
+    :param return_spans: If True - generate (court entity, court alias, (start, end)) with the position
+     of the alias in the text.
     :return: Generates tuples: (court entity, court alias)
     """
     yield from find_dict_entities(text, court_config_list,
                                   conflict_resolving_func=conflicts_take_first_by_id if priority else None,
-                                  text_languages=text_languages)
+                                  text_languages=text_languages,
+                                  return_spans=return_spans)
 
 
 def setup_en_parser():
@@ -69,7 +74,15 @@ def setup_en_parser():
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_en_parser()
+# created on first use, see LazyCourtsParser
+parser = LazyCourtsParser(setup_en_parser, cache_name='en_courts')
+
+
+def warm_up() -> UniversalCourtsParser:
+    """
+    Create the English court parser now (or load it from LEXNLP_COURTS_CACHE_DIR) instead of on first use.
+    """
+    return parser.warm_up()
 
 
 def _get_court_list(text: str, language: str = None) -> List[CourtAnnotation]:
@@ -8,7 +8,9 @@ This module implements date extraction functionality in English.
 import itertools
 import os
 import string
+from functools import lru_cache
 
+import numpy as np
 from sklearn.externals import joblib
 
 
@@ -31,6 +33,137 @@ DATE_MODEL_CHARS.extend(string.digits)
 DATE_MODEL_CHARS.extend(["-", "/", " ", "%", "#", "$"])
 
 
+class DateFeatureExtractor:
+    """
+    Character and bigram feature extractor for date candidates.
+
+    Feature names and their column positions are computed once per character set,
+    so each candidate is counted in a single pass over its text window.
+    """
+
+    def __init__(self, characters=None, include_bigrams=True):
+        """
+        :param characters: characters to use for feature generation, DATE_MODEL_CHARS by default
+        :param include_bigrams: whether to include bigram/bicharacter features
+        """
+        self.characters = tuple(characters or DATE_MODEL_CHARS)
+        self.include_bigrams = include_bigrams
+
+        self.char_index = {}
+        for character in self.characters:
+            self.char_index.setdefault(character, len(self.char_index))
+        self.n_chars = len(self.char_index)
+
+        self.bigram_index = {}
+        if include_bigrams:
+            for bigram in itertools.permutations(self.char_index, 2):
+                self.bigram_index["".join(bigram)] = self.n_chars + len(self.bigram_index)
+
+        self.feature_names = ["char_{0}".format(c) for c in self.char_index] + \
+                             ["bigram_{0}".format(b) for b in self.bigram_index]
+        self.feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        self._column_indices = {}
+
+    def get_column_indices(self, columns) -> np.ndarray:
+        """
+        Get positions of named feature columns, e.g. MODEL_DATE.columns, in the feature row.
+        :param columns: sequence of feature names
+        :return: numpy array of indices
+        """
+        columns = tuple(columns)
+        indices = self._column_indices.get(columns)
+        if indices is None:
+            indices = np.array([self.feature_index[c] for c in columns], dtype=int)
+            self._column_indices[columns] = indices
+        return indices
+
+    def get_feature_row(self, text, start_index, end_index, window=5, norm=True, out=None) -> np.ndarray:
+        """
+        Count characters and bigrams around a date candidate into a numpy row.
+        :param text: raw text around potential date
+        :param start_index: date start index
+        :param end_index: date end index
+        :param window: window around match
+        :param norm: whether to norm, i.e., transform to proportion
+        :param out: preallocated row of len(feature_names) to fill, a new one is created if None
+        :return: numpy array of len(feature_names)
+        """
+        window_start = max(0, start_index - window)
+        window_end = min(len(text), end_index + window)
+        feature_text = text[window_start:window_end].strip()
+
+        if out is None:
+            out = np.zeros(len(self.feature_names), dtype=float)
+        else:
+            out[:] = 0
+
+        char_index = self.char_index
+        bigram_index = self.bigram_index
+        previous = None
+        for character in feature_text:
+            index = char_index.get(character)
+            if index is not None:
+                out[index] += 1
+            if bigram_index and previous is not None:
+                index = bigram_index.get(previous + character)
+                if index is not None:
+                    out[index] += 1
+            previous = character
+
+        if norm:
+            char_sum = out[:self.n_chars].sum()
+            if char_sum > 0:
+                out[:self.n_chars] /= char_sum
+            if bigram_index:
+                bigram_sum = out[self.n_chars:].sum()
+                if bigram_sum > 0:
+                    out[self.n_chars:] /= bigram_sum
+        return out
+
+    def get_feature_matrix(self, text, spans, columns=None, window=5, norm=True) -> np.ndarray:
+        """
+        Build feature matrix for a list of date candidates.
+        :param text: raw text around potential dates
+        :param spans: list of (start, end) date candidate positions
+        :param columns: feature names to select and order by, all features if None
+        :param window: window around match
+        :param norm: whether to norm, i.e., transform to proportion
+        :return: numpy array of shape (len(spans), len(columns))
+        """
+        row = np.zeros(len(self.feature_names), dtype=float)
+        indices = self.get_column_indices(columns) if columns is not None else None
+        n_columns = len(indices) if indices is not None else len(self.feature_names)
+        feature_matrix = np.zeros((len(spans), n_columns), dtype=float)
+        for row_index, (start_index, end_index) in enumerate(spans):
+            self.get_feature_row(text, start_index, end_index, window=window, norm=norm, out=row)
+            feature_matrix[row_index, :] = row[indices] if indices is not None else row
+        return feature_matrix
+
+    def get_feature_dict(self, text, start_index, end_index, window=5, norm=True) -> dict:
+        """
+        Get features as a {feature name: value} dict, as used to build a pandas.DataFrame.
+        :param text: raw text around potential date
+        :param start_index: date start index
+        :param end_index: date end index
+        :param window: window around match
+        :param norm: whether to norm, i.e., transform to proportion
+        :return: dict
+        """
+        row = self.get_feature_row(text, start_index, end_index, window=window, norm=norm)
+        return dict(zip(self.feature_names, row.tolist()))
+
+
+@lru_cache(maxsize=16)
+def get_date_feature_extractor(characters=None, include_bigrams=True) -> DateFeatureExtractor:
+    """
+    Get a shared DateFeatureExtractor for a character set.
+    :param characters: tuple of characters, DATE_MODEL_CHARS by default
+    :param include_bigrams: whether to include bigram/bicharacter features
+    :return: DateFeatureExtractor
+    """
+    return DateFeatureExtractor(characters=characters, include_bigrams=include_bigrams)
+
+
 def get_date_features(text, start_index, end_index, include_bigrams=True, window=5, characters=None,
                       norm=True):
     """
@@ -44,46 +177,5 @@ def get_date_features(text, start_index, end_index, include_bigrams=True, window
     :param norm: whether to norm, i.e., transform to proportion
     :return:
     """
-    # Check chars
-    if not characters:
-        characters = DATE_MODEL_CHARS
-
-    # Get text window
-    window_start = max(0, start_index - window)
-    window_end = min(len(text), end_index + window)
-    feature_text = text[window_start:window_end].strip()
-
-    # Build character vector
-    char_vec = {}
-    char_keys = []
-    bigram_keys = {}
-    for character in characters:
-        key = "char_{0}".format(character)
-        char_vec[key] = feature_text.count(character)
-        char_keys.append(key)
-
-    # Build character bigram vector
-    if include_bigrams:
-        bigram_set = ["".join(s) for s in itertools.permutations(characters, 2)]
-        bigram_keys = []
-        for character in bigram_set:
-            key = "bigram_{0}".format(character)
-            char_vec[key] = feature_text.count(character)
-            bigram_keys.append(key)
-
-    # Norm if requested
-    if norm:
-        # Norm by characters
-        char_sum = sum([char_vec[k] for k in char_keys])
-        if char_sum > 0:
-            for key in char_keys:
-                char_vec[key] /= float(char_sum)
-
-        # Norm by bigrams
-        if include_bigrams:
-            bigram_sum = sum([char_vec[k] for k in bigram_keys])
-            if bigram_sum > 0:
-                for key in bigram_keys:
-                    char_vec[key] /= float(bigram_sum)
-
-    return char_vec
+    extractor = get_date_feature_extractor(tuple(characters) if characters else None, include_bigrams)
+    return extractor.get_feature_dict(text, start_index, end_index, window=window, norm=norm)
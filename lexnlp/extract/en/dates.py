@@ -6,12 +6,12 @@ This module implements date extraction functionality in English.
 
 # Standard imports
 import datetime
-import itertools
 import os
 
 from typing import Generator, List
 
 # Third-party packages
+import numpy as np
 import regex as re
 import pandas as pd
 
@@ -20,9 +20,10 @@ import sklearn.pipeline
 import sklearn.feature_selection
 from sklearn.externals import joblib
 
-from lexnlp.extract.common.date_parsing.datefinder import DateFinder
-from lexnlp.extract.en.date_model import MODEL_DATE, DATE_MODEL_CHARS, MODULE_PATH
-from lexnlp.extract.common.dates import DateParser
+from lexnlp.extract.common.date_parsing.datefinder import DateFinder, DEFAULT_DATE_FINDER_CONFIG
+from lexnlp.extract.en.date_model import MODEL_DATE, MODULE_PATH, \
+    get_date_features, get_date_feature_extractor
+from lexnlp.extract.common.dates import DateParser, ClassifierDateScorer
 
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -51,63 +52,12 @@ of[\s]+?
 
 RE_AS_OF = re.compile(AS_OF_PATTERN, re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
 
+# DateFinder replacements shared by all get_raw_dates calls: extra tokens except "t" are blanked
+RAW_DATE_FINDER_CONFIG = DEFAULT_DATE_FINDER_CONFIG.extend(
+    {extra_token: ' ' for extra_token in DateFinder.EXTRA_TOKENS_PATTERN.split('|') if extra_token != 't'})
 
-def get_date_features(text, start_index, end_index, include_bigrams=True, window=5, characters=None,
-                      norm=True):
-    """
-    Get features to use for classification of date as false positive.
-    :param text: raw text around potential date
-    :param start_index: date start index
-    :param end_index: date end index
-    :param include_bigrams: whether to include bigram/bicharacter features
-    :param window: window around match
-    :param characters: characters to use for feature generation, e.g., digits only, alpha only
-    :param norm: whether to norm, i.e., transform to proportion
-    :return:
-    """
-    # Check chars
-    if not characters:
-        characters = DATE_MODEL_CHARS
-
-    # Get text window
-    window_start = max(0, start_index - window)
-    window_end = min(len(text), end_index + window)
-    feature_text = text[window_start:window_end].strip()
-
-    # Build character vector
-    char_vec = {}
-    char_keys = []
-    bigram_keys = {}
-    for character in characters:
-        key = "char_{0}".format(character)
-        char_vec[key] = feature_text.count(character)
-        char_keys.append(key)
-
-    # Build character bigram vector
-    if include_bigrams:
-        bigram_set = ["".join(s) for s in itertools.permutations(characters, 2)]
-        bigram_keys = []
-        for character in bigram_set:
-            key = "bigram_{0}".format(character)
-            char_vec[key] = feature_text.count(character)
-            bigram_keys.append(key)
-
-    # Norm if requested
-    if norm:
-        # Norm by characters
-        char_sum = sum([char_vec[k] for k in char_keys])
-        if char_sum > 0:
-            for key in char_keys:
-                char_vec[key] /= float(char_sum)
-
-        # Norm by bigrams
-        if include_bigrams:
-            bigram_sum = sum([char_vec[k] for k in bigram_keys])
-            if bigram_sum > 0:
-                for key in bigram_keys:
-                    char_vec[key] /= float(bigram_sum)
-
-    return char_vec
+# Number of date candidates scored per classifier call; None scores the whole document at once
+DATE_SCORE_BATCH_SIZE = 1000
 
 
 def get_raw_date_list(text, strict=False, base_date=None, return_source=False) -> List:
@@ -129,11 +79,7 @@ def get_raw_dates(text, strict=False, base_date=None, return_source=False) -> Ge
             day=1, month=1, hour=0, minute=0, second=0, microsecond=0)
 
     # Find potential dates
-    date_finder = DateFinder(base_date=base_date)
-
-    for extra_token in date_finder.EXTRA_TOKENS_PATTERN.split('|'):
-        if extra_token != 't':
-            date_finder.REPLACEMENTS[extra_token] = ' '
+    date_finder = DateFinder(base_date=base_date, config=RAW_DATE_FINDER_CONFIG)
 
     # Iterate through possible matches
     possible_dates = [(date_string, index, date_props) for date_string, index, date_props in
@@ -298,7 +244,32 @@ def get_dates_list(text, **kwargs) -> List:
     return list(get_dates(text, **kwargs))
 
 
-def get_dates(text, strict=False, base_date=None, return_source=False, threshold=0.50) -> Generator:
+def get_date_feature_matrix(text, spans, columns=None) -> np.ndarray:
+    """
+    Build classifier feature matrix for a list of date candidates.
+    :param text: raw text around potential dates
+    :param spans: list of (start, end) date candidate positions
+    :param columns: feature names in model order; MODEL_DATE.columns by default
+    :return: numpy array of shape (len(spans), len(columns))
+    """
+    if columns is None:
+        columns = MODEL_DATE.columns
+    return get_date_feature_extractor().get_feature_matrix(text, spans, columns=columns)
+
+
+def get_date_scores(text, spans, batch_size=DATE_SCORE_BATCH_SIZE) -> np.ndarray:
+    """
+    Score date candidates with the false positive classifier, one predict_proba call per batch.
+    :param text: raw text around potential dates
+    :param spans: list of (start, end) date candidate positions
+    :param batch_size: number of candidates per classifier call; None or 0 to score all at once
+    :return: numpy array of "is a date" probabilities, one per span
+    """
+    return ClassifierDateScorer(MODEL_DATE, batch_size=batch_size or 0).score(text, spans)
+
+
+def get_dates(text, strict=False, base_date=None, return_source=False, threshold=0.50,
+              batch_size=DATE_SCORE_BATCH_SIZE) -> Generator:
     """
     Find dates after cleaning false positives.
     :param text: raw text to search
@@ -306,15 +277,17 @@ def get_dates(text, strict=False, base_date=None, return_source=False, threshold
     :param base_date: base date to use for implied or partial matches
     :param return_source: whether to return raw text around date
     :param threshold: probability threshold to use for false positive classifier
+    :param batch_size: number of candidates per classifier call; None or 0 to score the whole text at once
     :return:
     """
     # Get raw dates
     raw_date_results = get_raw_date_list(text, strict=strict, base_date=base_date, return_source=True)
 
-    for raw_date in raw_date_results:
-        row_df = pd.DataFrame([get_date_features(text, raw_date[1][0], raw_date[1][1])])
-        date_score = MODEL_DATE.predict_proba(row_df.loc[:, MODEL_DATE.columns])
-        if date_score[0, 1] >= threshold:
+    # Score all candidates in batches
+    date_scores = get_date_scores(text, [raw_date[1] for raw_date in raw_date_results], batch_size=batch_size)
+
+    for raw_date, date_score in zip(raw_date_results, date_scores):
+        if date_score >= threshold:
             if return_source:
                 yield (raw_date[0], raw_date[1])
             else:
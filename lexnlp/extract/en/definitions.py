@@ -13,7 +13,7 @@ import regex as re
 import unidecode as unidecode
 from collections import Counter
 from typing import Generator, Pattern, List, Tuple
-from lexnlp.nlp.en.segments.sentences import get_sentence__with_coords_list
+from lexnlp.nlp.en.document import as_document
 from lexnlp.utils.lines_processing.line_processor import LineProcessor
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -329,7 +329,7 @@ def get_definition_objects_list(text, decode_unicode=True) -> List[DefinitionCau
     :return: a list of found definitions - objects of class DefinitionCaught
     """
     definitions = []
-    for sentence in get_sentence__with_coords_list(text):
+    for sentence in as_document(text).sentences_with_coords:
         definitions += get_definition_list_in_sentence(sentence, decode_unicode)
     definitions = filter_definitions_for_self_repeating(definitions)
     return definitions
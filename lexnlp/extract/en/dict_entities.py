@@ -16,10 +16,15 @@
    To avoid typos in development and utilize typization hints in IDE there are few methods in this module for operating
    tuples which represent entities and aliases. They accept named parameters lists and return tuples.
 """
+import os
 import re
+import threading
+import weakref
+from array import array
+from collections import OrderedDict, namedtuple
 from typing import Union, List, Dict, Set, Tuple, Callable, Generator
 
-from lexnlp.nlp.en.tokens import get_token_list, get_stem_list
+from lexnlp.nlp.en.tokens import get_token_list, get_stem_list, DEFAULT_STEMMER
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -28,6 +33,9 @@ __version__ = "0.2.6"
 __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
+# Max number of normalized aliases kept in the alias normalization cache, None - unbounded, 0 - no caching.
+ALIAS_NORMALIZATION_CACHE_SIZE = 100000
+
 
 def entity_config(entity_id: int,
                   name: str,
@@ -189,13 +197,16 @@ class SearchResultPosition:
     """
     Represents a position in the normalized source text at which one or more entities have been detected.
     One or more entities having equal aliases can be detected on a position in the text.
+    "end" is the end of the matched normalized alias in the normalized text (None if unknown).
     """
-    __slots__ = ('entities_dict', 'alias_text', 'start')
+    __slots__ = ('entities_dict', 'alias_text', 'start', 'end')
 
-    def __init__(self, entity: Tuple[int, str, int, List[Tuple]], alias: Tuple[str, str, bool, int], start: int):
+    def __init__(self, entity: Tuple[int, str, int, List[Tuple]], alias: Tuple[str, str, bool, int], start: int,
+                 end: int = None):
         self.entities_dict = {entity[0]: (entity, alias)}
         self.alias_text = alias[0]
         self.start = start
+        self.end = end
 
     def add_entity(self, entity: Tuple[int, str, int, List[Tuple]], alias: Tuple[str, str, bool, int]):
         if entity:
@@ -240,6 +251,201 @@ def normalize_text(text: str,
     return res
 
 
+def normalize_text_with_offsets(text: str,
+                                spaces_on_start_end: bool = True,
+                                spaces_after_dots: bool = True,
+                                lowercase: bool = True,
+                                use_stemmer: bool = False) -> Tuple[str, array]:
+    """
+    Normalizes text exactly as normalize_text() does and also returns the mapping of
+    normalized text offsets to the offsets in the source text.
+    The mapping is array('i') of len(normalized text) + 1 items: for each char of the normalized text -
+    position of the source char it came from; inserted spaces point to the next source token;
+    the last item is len(text).
+    Tokens changed by the tokenizer or stemmer ('"' -> '``', 'tables' -> 'tabl') are mapped char by char
+    into the source token and clamped to its length.
+    :return: (normalized text, offsets)
+    """
+    tokens = get_token_list(text, lowercase=False)
+
+    # Non-space chars of the normalized text in their order with their source offsets
+    norm_tokens = []
+    char_offsets = array('i')
+    pos = 0
+    text_len = len(text)
+    for token in tokens:
+        while pos < text_len and text[pos].isspace():
+            pos += 1
+        if text.startswith(token, pos):
+            token_start, token_len = pos, len(token)
+        elif token in ('``', "''") and text.startswith('"', pos):
+            token_start, token_len = pos, 1
+        else:
+            token_start = text.find(token, pos)
+            token_start, token_len = (pos, 1) if token_start < 0 else (token_start, len(token))
+        pos = min(token_start + token_len, text_len)
+
+        norm_token = token.lower() if lowercase else token
+        if use_stemmer:
+            norm_token = DEFAULT_STEMMER.stem(norm_token)
+        norm_tokens.append(norm_token)
+        if len(norm_token) == token_len:
+            char_offsets.extend(range(token_start, token_start + token_len))
+        else:
+            char_offsets.extend(token_start + min(i, token_len - 1) for i in range(len(norm_token)))
+
+    res = ' '.join(norm_tokens)
+    if spaces_on_start_end:
+        res = ' ' + res + ' '
+    if spaces_after_dots:
+        res = res.replace('.', ' . ').replace('  ', ' ')
+
+    # Tokens don't contain spaces, so the only difference between the non-space chars of "res"
+    # and "char_offsets" is in the spaces inserted around them.
+    offsets = array('i', [text_len]) * (len(res) + 1)
+    char_index = 0
+    prev_end = 0
+    for match in re.finditer(r'[^ ]+', res):
+        start, end = match.span()
+        offsets[prev_end:start] = array('i', [char_offsets[char_index]]) * (start - prev_end)
+        offsets[start:end] = char_offsets[char_index:char_index + end - start]
+        char_index += end - start
+        prev_end = end
+    return res, offsets
+
+
+AliasCacheInfo = namedtuple('AliasCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class AliasNormalizationCache:
+    """
+    Bounded LRU cache of normalized aliases keyed by (alias, lowercase, use_stemmer).
+
+    The same aliases are normalized again and again - for each entity config list, each DictEntityIndex
+    and each alias black list built of them. This cache allows doing it once per process.
+    Access is guarded with a lock so the cache can be shared by threads. The lock is re-created
+    in the child process after fork (Celery prefork workers) for every existing cache because it could be
+    held by another thread of the parent process at the moment of fork; the cached values are inherited
+    by the child.
+    """
+
+    def __init__(self, maxsize: Union[int, None] = -1):
+        """
+        :param maxsize: Max number of cached aliases, None - unbounded, 0 - no caching,
+            negative - ALIAS_NORMALIZATION_CACHE_SIZE at the moment the cache is created.
+        """
+        self.maxsize = ALIAS_NORMALIZATION_CACHE_SIZE if maxsize is not None and maxsize < 0 else maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+        _ALIAS_NORMALIZATION_CACHES.add(self)
+
+    def _reset_lock(self):
+        self._lock = threading.Lock()
+
+    def normalize(self, alias: str, lowercase: bool = True, use_stemmer: bool = False) -> str:
+        """
+        Get normalize_text(alias, lowercase=lowercase, use_stemmer=use_stemmer) from the cache
+        or calculate and cache it.
+        """
+        key = (alias, lowercase, use_stemmer)
+        with self._lock:
+            normalized = self._data.get(key)
+            if normalized is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return normalized
+            self.misses += 1
+
+        normalized = normalize_text(alias, lowercase=lowercase, use_stemmer=use_stemmer)
+        if self.maxsize == 0:
+            return normalized
+
+        with self._lock:
+            self._data[key] = normalized
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return normalized
+
+    def info(self) -> AliasCacheInfo:
+        """
+        Get cache statistics: (hits, misses, maxsize, currsize).
+        """
+        with self._lock:
+            return AliasCacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        """
+        Remove all cached aliases and reset statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, maxsize: Union[int, None]):
+        """
+        Change max size of the cache dropping the least recently used aliases if needed.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            if maxsize is not None:
+                while len(self._data) > maxsize:
+                    self._data.popitem(last=False)
+
+    def __contains__(self, key: Tuple[str, bool, bool]) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_ALIAS_NORMALIZATION_CACHES = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _reset_alias_normalization_cache_locks():
+    for cache in list(_ALIAS_NORMALIZATION_CACHES):
+        cache._reset_lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_alias_normalization_cache_locks)
+
+ALIAS_NORMALIZATION_CACHE = AliasNormalizationCache()
+
+
+def normalize_alias(alias: str, lowercase: bool = True, use_stemmer: bool = False) -> str:
+    """
+    Normalize entity alias the same way as normalize_text() does using ALIAS_NORMALIZATION_CACHE.
+    Use ALIAS_NORMALIZATION_CACHE.info() / .clear() / .resize() for inspecting and controlling the cache.
+    :param alias:
+    :param lowercase:
+    :param use_stemmer:
+    :return:
+    """
+    return ALIAS_NORMALIZATION_CACHE.normalize(alias, lowercase=lowercase, use_stemmer=use_stemmer)
+
+
+def get_source_span(normalized_text: str, offsets: array, start: int, end: int) -> Tuple[int, int]:
+    """
+    Convert [start, end) of a match in the normalized text to the span in the source text
+    using offsets returned by normalize_text_with_offsets(). Spaces around the match are ignored.
+    """
+    end = min(end, len(normalized_text))
+    while start < end and normalized_text[start] == ' ':
+        start += 1
+    while end > start and normalized_text[end - 1] == ' ':
+        end -= 1
+    if start >= end:
+        return offsets[start], offsets[start]
+    return offsets[start], offsets[end - 1] + 1
+
+
 def alias_is_blacklisted(alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]],
                          norm_alias: str,
                          alias_lang:str,
@@ -254,103 +460,184 @@ def alias_is_blacklisted(alias_black_list: Union[None, Dict[str, Tuple[List[str]
     return False
 
 
-def _find_entity_positions(normalized_text: str,
-                           normalized_text_lowercase: str,
-                           entity: Tuple[int, str, int, List[Tuple]],
-                           text_languages: Union[List[str], Tuple[str], Set[str]],
-                           context: Dict[int, SearchResultPosition] = None,
-                           use_stemmer: bool = False,
-                           abbrev_uppercase_check_range: int = 20,
-                           min_alias_len: int = None,
-                           alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]] = None):
-    """
-    Searches for all occurrences of name/alias of the specified entity in the specified text and fills the
-    provided context dict with them.
-    Operates on the provided search context - a map of alias/name positions to the SearchResultPosition entries.
-    If there is a previously found name/alias at the same position in the text - the longest name/alias is
-    stored in the context and the shorter one is dropped.
-    So after the series of execution of this method on the shared context it will be filled with the best matching
-    search results for each starting position in the text. Next these results should be ordered by start index and
-    checked for intersections - to drop entries having shorter names/aliases.
-    Alias languages are taken into account in this method - if a language of the source text is specified then
-    only aliases of this language are being searched for.
-
-    :param normalized_text Non-lowercase version of the normalized source text - to search for abbreviations.
-    :param normalized_text_lowercase: Lowercase version of the normalized source text - to search for non-abbrevs.
-    :param text_languages: If set - then only aliases of these languages will be searched for.
-    :param entity:
-    :param context: Map of alias/name positions in the source text to SearchResultPosition entries.
-    This context can be shared between multiple executions of this functions to reach the results of the overall search
-    of multiple DictEntities with the longest matching DictEntity on each position.
-    Can be None - for the case of single DictEntity search.
-    :param alias_black_list: Prepared black list of aliases to exclude from search.
-    Should be: dict of language -> tuple (list of normalized non-abbreviations, list of normalized abbreviations)
-    "None" is a key for "any" language.
-    :param abbrev_uppercase_check_range: To avoid false-positives in detecting abbreviations similar to AND, OR, IN
-    we need to ensure that it is not english words appeared in a piece of text written in uppercase.
-    For this for each abbrev we ignore it if text[position - range : position + range] == uppercase(text[...]).
-    :return:
+class DictEntityIndex:
     """
+    Search index for the list of entity configs (see entity_config()) built once and reused for any number of texts.
 
-    def abbrev_in_uppercase_block(text: str, position: int, check_range:int):
-        block = text[max(0, position - check_range): min(len(text), position + check_range)]
-        block_upper = block.upper()
-        return block == block_upper
-
-    if context is None:
-        context = dict()
+    Aliases are normalized once at build time (abbreviations - case-sensitive, other aliases - lowercase) and put
+    into two token tries: alias ' united states ' is stored as the path 'united' -> 'states'.
+    Normalized text and normalized aliases are sequences of tokens separated by single spaces and
+    starting/ending with a space, so an alias is a substring of the text exactly when its tokens
+    are a sequence of the text tokens. This allows finding all aliases of all entities in a single pass
+    over the text tokens instead of searching the text for each alias.
 
-    entity_aliases = get_entity_aliases(entity)
-    if entity_aliases:
-        for ea in entity_aliases:
+    Alias languages are stored in the index and checked at search time, min alias length and alias black list
+    are applied at build time.
 
-            alias_text = ea[0]
-            alias_lang = ea[1]
-            alias_is_abbreviation = ea[2]
-
-            if not alias_text or (
-                            text_languages and alias_lang and alias_lang not in text_languages):
-                continue
-            if min_alias_len and len(alias_text) < min_alias_len:
-                continue
-
-            if alias_is_abbreviation:
-                normalized_alias = normalize_text(alias_text, lowercase=False, use_stemmer=use_stemmer)
-                normalized_text_for_alias = normalized_text
-            else:
-                normalized_alias = normalize_text(alias_text, lowercase=True, use_stemmer=use_stemmer)
-                normalized_text_for_alias = normalized_text_lowercase
+    The index contains only lists, dicts and tuples and can be pickled to be sent to Celery workers.
+    """
 
-            if alias_is_blacklisted(alias_black_list, normalized_alias, alias_lang, alias_is_abbreviation):
-                continue
+    def __init__(self,
+                 all_possible_entities: List[Tuple[int, str, int, List[Tuple]]],
+                 use_stemmer: bool = False,
+                 min_alias_len: int = None,
+                 prepared_alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]] = None):
+        """
+        :param all_possible_entities: list of entity configs: (entity_id, name, priority, [alias, ...])
+        :param use_stemmer: Use stemmer instead of tokenizer for normalizing aliases and texts.
+        :param min_alias_len: Minimal length of alias/name to search for.
+        :param prepared_alias_black_list: Prepared black list of aliases to exclude from search -
+        see prepare_alias_blacklist_dict().
+        """
+        self.use_stemmer = use_stemmer
+        self.min_alias_len = min_alias_len
+        self.entities = list(all_possible_entities)
+        # pattern id -> (normalized alias length, [(entity index, alias index, alias language), ...])
+        self.patterns = []  # type: List[Tuple[int, List[Tuple[int, int, str]]]]
+        # token tries for abbreviations (case-sensitive) and other aliases (lowercase);
+        # None key of a trie node holds the pattern id of the alias ending at this node
+        self.abbrev_trie = {}  # type: Dict
+        self.alias_trie = {}  # type: Dict
+
+        for entity_index, entity in enumerate(self.entities):
+            for alias_index, alias in enumerate(get_entity_aliases(entity) or []):
+                alias_text, alias_lang, alias_is_abbreviation = alias[0], alias[1], alias[2]
+                if not alias_text:
+                    continue
+                if min_alias_len and len(alias_text) < min_alias_len:
+                    continue
+                normalized_alias = normalize_alias(alias_text, lowercase=not alias_is_abbreviation,
+                                                   use_stemmer=use_stemmer)
+                if alias_is_blacklisted(prepared_alias_black_list, normalized_alias, alias_lang,
+                                        alias_is_abbreviation):
+                    continue
+                if not normalized_alias.strip(' '):
+                    continue
+                node = self.abbrev_trie if alias_is_abbreviation else self.alias_trie
+                for token in normalized_alias[1:-1].split(' '):
+                    node = node.setdefault(token, {})
+                pattern_id = node.get(None)
+                if pattern_id is None:
+                    pattern_id = len(self.patterns)
+                    node[None] = pattern_id
+                    self.patterns.append((len(normalized_alias), []))
+                self.patterns[pattern_id][1].append((entity_index, alias_index, alias_lang))
+
+    def __repr__(self):
+        return 'DictEntityIndex({} entities, {} aliases)'.format(len(self.entities), len(self.patterns))
+
+    def normalize_text(self, text: str, return_offsets: bool = False):
+        """
+        Normalize the source text the same way the aliases of this index were normalized.
+        """
+        if return_offsets:
+            return normalize_text_with_offsets(text, lowercase=False, use_stemmer=self.use_stemmer)
+        return normalize_text(text, lowercase=False, use_stemmer=self.use_stemmer)
 
-            start = None
-            while True:
-                start = normalized_text_for_alias.find(normalized_alias,
-                                                       start + len(normalized_alias) - 1 if start is not None else 0)
-                if start < 0:
+    @staticmethod
+    def _iter_trie_matches(trie: Dict, normalized_text: str) -> Generator[Tuple[int, int], None, None]:
+        """
+        Walk tokens of the normalized text once and yield (start, pattern id) for each alias occurrence.
+        Start is the position of the space preceding the alias in the normalized text.
+        """
+        tokens = normalized_text.split(' ')
+        token_starts = []
+        position = 0
+        for token in tokens:
+            token_starts.append(position)
+            position += len(token) + 1
+
+        # first and last tokens are the empty strings around the starting/ending spaces
+        last_token = len(tokens) - 1
+        for first in range(1, last_token):
+            node = trie.get(tokens[first])
+            index = first
+            while node is not None:
+                pattern_id = node.get(None)
+                if pattern_id is not None:
+                    yield token_starts[first] - 1, pattern_id
+                index += 1
+                if index >= last_token:
                     break
+                node = node.get(tokens[index])
 
-                if alias_is_abbreviation and \
-                        abbrev_in_uppercase_block(normalized_text_for_alias, start, abbrev_uppercase_check_range):
+    def find_positions(self,
+                       normalized_text: str,
+                       normalized_text_lowercase: str,
+                       text_languages: Union[List[str], Tuple[str], Set[str]] = None,
+                       abbrev_uppercase_check_range: int = 20) -> Dict[int, SearchResultPosition]:
+        """
+        Searches for all occurrences of names/aliases of all entities in the normalized text.
+        Returns map of alias/name positions to the SearchResultPosition entries.
+        If there are multiple names/aliases found at the same position in the text - the longest name/alias
+        is stored and the shorter ones are dropped; entities having the same alias are stored together.
+        Next these results should be ordered by start index and checked for intersections - to drop entries
+        having shorter names/aliases.
+
+        :param normalized_text: Non-lowercase version of the normalized source text - to search for abbreviations.
+        :param normalized_text_lowercase: Lowercase version of the normalized source text - to search for
+        non-abbreviations.
+        :param text_languages: If set - then only aliases of these languages will be searched for.
+        :param abbrev_uppercase_check_range: To avoid false-positives in detecting abbreviations similar to AND, OR,
+        IN we need to ensure that it is not english words appeared in a piece of text written in uppercase.
+        For this for each abbrev we ignore it if text[position - range : position + range] is uppercase.
+        :return:
+        """
+        # start -> [(entity index, alias index, normalized alias length), ...]
+        found = {}  # type: Dict[int, List[Tuple[int, int]]]
+
+        for trie, text_for_alias, is_abbreviation in ((self.abbrev_trie, normalized_text, True),
+                                                      (self.alias_trie, normalized_text_lowercase, False)):
+            # next occurrence of an alias is searched for starting from the last char of the previous one
+            next_allowed_start = {}  # type: Dict[int, int]
+            for start, pattern_id in self._iter_trie_matches(trie, text_for_alias):
+                alias_len, alias_refs = self.patterns[pattern_id]
+                if start < next_allowed_start.get(pattern_id, 0):
                     continue
-
+                next_allowed_start[pattern_id] = start + alias_len - 1
+
+                if is_abbreviation:
+                    block = text_for_alias[max(0, start - abbrev_uppercase_check_range):
+                                           min(len(text_for_alias), start + abbrev_uppercase_check_range)]
+                    if block == block.upper():
+                        continue
+
+                for entity_index, alias_index, alias_lang in alias_refs:
+                    if text_languages and alias_lang and alias_lang not in text_languages:
+                        continue
+                    found.setdefault(start, []).append((entity_index, alias_index, alias_len))
+
+        # resolve matches at each position in the order of entities and their aliases in the config
+        context = {}  # type: Dict[int, SearchResultPosition]
+        for start, refs in found.items():
+            refs.sort()
+            for entity_index, alias_index, alias_len in refs:
+                entity = self.entities[entity_index]
+                alias = get_entity_aliases(entity)[alias_index]
                 already_found = context.get(start)
-                if already_found and len(already_found.alias_text) >= len(alias_text):
-                    already_found.add_entity(entity, ea)
+                if already_found and len(already_found.alias_text) >= len(alias[0]):
+                    already_found.add_entity(entity, alias)
                 else:
-                    context[start] = SearchResultPosition(entity, ea, start)
+                    context[start] = SearchResultPosition(entity, alias, start, start + alias_len)
+        return context
+
+    def find(self, text: str, **kwargs) -> Generator:
+        """
+        Find entities of this index in the text. See find_dict_entities() for the arguments.
+        """
+        yield from find_dict_entities(text, self, **kwargs)
 
 
 def find_dict_entities(text: str,
-                       all_possible_entities: List[Tuple[int, str, int, List[Tuple]]],
+                       all_possible_entities: Union[List[Tuple[int, str, int, List[Tuple]]], DictEntityIndex],
                        text_languages: Union[List[str], Tuple[str], Set[str]] = None,
                        conflict_resolving_func: Callable[[List[Tuple[int, str, List[Tuple]]]],
                                                          Tuple[List[Tuple[int, str, List[Tuple]]], Tuple]] = None,
                        use_stemmer: bool = False,
                        remove_time_am_pm: bool = True,
                        min_alias_len: int = None,
-                       prepared_alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]] = None)\
+                       prepared_alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]] = None,
+                       return_spans: bool = False)\
         -> Generator:
     """
     Find all entities defined in the 'all_possible_entities' list appeared in the source text.
@@ -366,14 +653,14 @@ def find_dict_entities(text: str,
 
     Algorithm of this method:
     1. Normalize the source text (we need lowercase and non-lowercase versions for abbrev searches).
-    2. Create a shared search context - a map of position -> (alias text + list of matching entities)
-    3. For each possible entity do search using the shared context:
-        3.1. For each alias of the entity:
-            3.1.1. Iteratively search for all occurrences of the alias taking into account its language, abbrev status.
-                    For each found occurrence of the alias - check if there is already found another alias and entity
-                    at this position and leave only the one having the longest alias ("Something" vs "Something Bigger")
-                    If there is already a found different entity on this position having totally equal alias with
-                    the same language - then store them both for this position in the text.
+    2. Build DictEntityIndex of the possible entities - token tries of their normalized aliases
+    (or use the prebuilt index passed instead of the entity list).
+    3. Walk the tokens of the normalized text once matching them against the tries and fill the search context -
+    a map of position -> (alias text + list of matching entities):
+        For each found occurrence of an alias - check if there is already found another alias and entity
+        at this position and leave only the one having the longest alias ("Something" vs "Something Bigger")
+        If there is already a found different entity on this position having totally equal alias with
+        the same language - then store them both for this position in the text.
     4. Now we have a map filled with: position -> (alias text + list of entities having this alias).
     After sorting the items of this dict by position we will be able to get rid of overlaping of longer and shorter
     aliases being one a substirng of another ("Bankr. E.D.N.Y." vs "E.D.N.Y.").
@@ -385,14 +672,10 @@ def find_dict_entities(text: str,
     while the longer match can start at the earlier position then the shorter match and there can be multiple aliases
     of different entities matching the same piece of text.
 
-    Another algorithm for this function can be based on the idea that or-kind regexp returns the longest matching group.
-    We could form regexps containing the possible aliases and apply them to the source text:
-    r'alias1|alias2|longer alias2|...'
-
-    TODO Compare to other algorithms for time and memory complexity
-
     :param text:
-    :param all_possible_entities: list of dict or list of DictEntity - all possible entities to search for
+    :param all_possible_entities: list of entity configs - all possible entities to search for, or
+    DictEntityIndex built of them. When an index is passed - its use_stemmer, min_alias_len and alias black list
+    are used instead of the ones passed to this function.
     :param min_alias_len: Minimal length of alias/name to search for. Can be used to ignore too short aliases like "M."
     while searching.
     :param prepared_alias_black_list: List of aliases to remove from searching. Can be used to ignore concrete aliases.
@@ -408,21 +691,28 @@ def find_dict_entities(text: str,
     "Mississippi", ...
     :param remove_time_am_pm: Remove from final results AM/PM abbreviations which look like end part of time
     strings - 11:45 am, 10:00 pm.
+    :param return_spans: If True - yield (entity, alias, (start, end)) where start and end are the positions
+    of the found alias in the source text (not in the normalized text).
     :return:
     """
 
     if not text:
         return
 
-    normalized_text = normalize_text(text, lowercase=False, use_stemmer=use_stemmer)
+    index = all_possible_entities
+    if not isinstance(index, DictEntityIndex):
+        index = DictEntityIndex(all_possible_entities, use_stemmer=use_stemmer, min_alias_len=min_alias_len,
+                                prepared_alias_black_list=prepared_alias_black_list)
+
+    offsets = None
+    if return_spans:
+        normalized_text, offsets = index.normalize_text(text, return_offsets=True)
+    else:
+        normalized_text = index.normalize_text(text)
     normalized_text_lowercase = normalized_text.lower()
 
-    search_context = dict()
-    # Search for each DictEntity occurrence adding them into the shared search context.
-    for dict_entity in all_possible_entities:
-        _find_entity_positions(normalized_text, normalized_text_lowercase, dict_entity, text_languages, search_context,
-                               use_stemmer=use_stemmer, min_alias_len=min_alias_len,
-                               alias_black_list=prepared_alias_black_list)
+    # Search for all DictEntity occurrences in a single pass over the text.
+    search_context = index.find_positions(normalized_text, normalized_text_lowercase, text_languages)
 
     # At this moment we have a map of positions in the text
     # to SearchResultPosition entries (position + appeared name/alias + DictEntity).
@@ -462,17 +752,23 @@ def find_dict_entities(text: str,
         else:
             return conflict_resolving_func(entities_at_pos) if conflict_resolving_func else entities_at_pos
 
+    def resolve_results(pos: SearchResultPosition) -> Generator:
+        if not return_spans:
+            yield from resolve_conflicts(pos)
+            return
+        span = get_source_span(normalized_text, offsets, pos.start, pos.end)
+        for entity, alias in resolve_conflicts(pos):
+            yield entity, alias, span
+
     for (_index, next_pos) in sorted(search_context.items()):
         if prev_pos and not next_pos.overlaps(prev_pos):
-            for entity, alias in resolve_conflicts(prev_pos):
-                yield entity, alias
+            yield from resolve_results(prev_pos)
             prev_pos = next_pos
         else:
             prev_pos = prev_pos if prev_pos and len(prev_pos.alias_text) >= len(next_pos.alias_text) else next_pos
 
     if prev_pos:
-        for entity, alias in resolve_conflicts(prev_pos):
-            yield entity, alias
+        yield from resolve_results(prev_pos)
 
 
 def conflicts_take_first_by_id(conflicting_entities_aliases: List[Tuple[Tuple[int, str, int, List[Tuple]], Tuple]]) \
@@ -515,7 +811,7 @@ def prepare_alias_blacklist_dict(alias_blacklist: List[Tuple[str, str, bool]], u
             lang_tuple = ([], [])
             res[lang] = lang_tuple
         if is_abbrev:
-            lang_tuple[1].append(normalize_text(alias, lowercase=False, use_stemmer=use_stemmer))
+            lang_tuple[1].append(normalize_alias(alias, lowercase=False, use_stemmer=use_stemmer))
         else:
-            lang_tuple[0].append(normalize_text(alias, lowercase=True, use_stemmer=use_stemmer))
+            lang_tuple[0].append(normalize_alias(alias, lowercase=True, use_stemmer=use_stemmer))
     return res
@@ -8,7 +8,7 @@ This module implements basic distance extraction functionality in English.
 import re
 from typing import Generator
 
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import NUM_PTN, NumericTextContext
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -41,8 +41,19 @@ DISTANCE_PTN_RE = re.compile(DISTANCE_PTN, re.IGNORECASE | re.MULTILINE | re.DOT
 
 
 def get_distances(text, return_sources=False, float_digits=4) -> Generator:
-    for source_text, number_text, distance_item in DISTANCE_PTN_RE.findall(text.lower()):
-        amount = list(get_amounts(number_text, float_digits=float_digits))
+    yield from iter_distances(NumericTextContext(text, float_digits), return_sources)
+
+
+def iter_distances(context: NumericTextContext, return_sources=False) -> Generator:
+    """
+    Get distances within the text of the context.
+    :param context: text and number conversions shared with other numeric extractors
+    :param return_sources: return source text as the last item of each tuple
+    :return: (amount, distance type[, source]) tuples
+    """
+    float_digits = context.float_digits
+    for source_text, number_text, distance_item in DISTANCE_PTN_RE.findall(context.text_lower):
+        amount = context.get_amount_list(number_text)
         if len(amount) != 1:
             continue
         distance_type = DISTANCE_SYMBOL_MAP.get(distance_item) or DISTANCE_TOKEN_MAP.get(distance_item)
@@ -10,7 +10,7 @@ from typing import Generator
 # Imports
 import regex as re
 
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import NUM_PTN, NumericTextContext
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -45,8 +45,19 @@ DURATION_PTN_RE = re.compile(DURATION_PTN, re.IGNORECASE | re.MULTILINE | re.DOT
 
 
 def get_durations(text, return_sources=False, float_digits=4) -> Generator:
-    for source_text, number_text, duration_type in DURATION_PTN_RE.findall(text.lower()):
-        amount = list(get_amounts(number_text, float_digits=float_digits))
+    yield from iter_durations(NumericTextContext(text, float_digits), return_sources)
+
+
+def iter_durations(context: NumericTextContext, return_sources=False) -> Generator:
+    """
+    Get durations within the text of the context.
+    :param context: text and number conversions shared with other numeric extractors
+    :param return_sources: return source text as the last item of each tuple
+    :return: (duration type, amount, duration in days[, source]) tuples
+    """
+    float_digits = context.float_digits
+    for source_text, number_text, duration_type in DURATION_PTN_RE.findall(context.text_lower):
+        amount = context.get_amount_list(number_text)
         if len(amount) != 1:
             continue
         amount = amount[0]
@@ -20,8 +20,7 @@ import nltk
 from lexnlp.config.en.company_types import COMPANY_TYPES, COMPANY_DESCRIPTIONS
 from lexnlp.extract.en.entities import nltk_re
 from lexnlp.extract.en.utils import strip_unicode_punctuation, NPExtractor
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
-from lexnlp.nlp.en.tokens import get_token_list
+from lexnlp.nlp.en.document import as_document
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -70,11 +69,10 @@ def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
     :param text:
     :return:
     """
+    document = as_document(text)
+    companies = None
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
-        companies = get_companies(text)
+    for sentence, sentence_pos in zip(document.sentences, document.sentence_pos_tags):
 
         # Iterate through chunks
         persons = []
@@ -113,6 +111,9 @@ def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
 
             person = strip_unicode_punctuation(person).strip(string.punctuation).strip(string.whitespace)
 
+            if companies is None:
+                # companies of the whole document, found once on the first person
+                companies = list(get_companies(document))
             if contains_companies(person, companies):
                 continue
 
@@ -137,10 +138,9 @@ def get_geopolitical(text, strict=False, return_source=False, window=2) -> Gener
     :param text:
     :return:
     """
+    document = as_document(text)
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+    for sentence, sentence_pos in zip(document.sentences, document.sentence_pos_tags):
 
         # Iterate through chunks
         gpes = []
@@ -195,10 +195,9 @@ def get_noun_phrases(text, strict=False, return_source=False, window=3, valid_pu
     :return:
     """
     valid_punctuation = valid_punctuation or VALID_PUNCTUATION
+    document = as_document(text)
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = nltk.pos_tag(get_token_list(sentence))
+    for sentence, sentence_pos in zip(document.sentences, document.sentence_pos_tags):
 
         # Iterate through chunks
         nnps = []
@@ -286,7 +285,7 @@ def get_companies(text: str,
 
     if COMPANY_TYPES_RE.search(text):
         # Iterate through sentences
-        for sentence in get_sentence_list(text):
+        for sentence in as_document(text).sentences:
             # skip if whole phrase is in uppercase
             if sentence == sentence.upper():
                 continue
@@ -19,7 +19,7 @@ from typing import Generator
 import regex as re
 
 from lexnlp.config.en.company_types import COMPANY_TYPES, COMPANY_DESCRIPTIONS
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.document import as_document
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -141,7 +141,7 @@ def get_companies(text: str,
     re_c = RE_ARTICLE_COMPANY if use_article else RE_COMPANY
 
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
+    for sentence in as_document(text).sentences:
         for match in re_c.finditer(sentence):
             captures = match.capturesdict()
             company_type = captures["company_type_of"] or \
@@ -12,13 +12,13 @@ Todo:
 import os
 import string
 
-from typing import Generator
+from typing import Generator, Iterator, List, Tuple
 
 from nltk.tag import StanfordNERTagger
 
 from lexnlp.config.stanford import STANFORD_NER_PATH
 from lexnlp.extract.en.utils import strip_unicode_punctuation
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.document import as_document
 from lexnlp.nlp.en.stanford import get_tokens_list
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -49,6 +49,16 @@ except LookupError:
     STANFORD_NER_TAGGER = None
 
 
+def get_tagged_sentences(text) -> Iterator[Tuple[str, List[Tuple[str, str]]]]:
+    """
+    Get sentences of the text with their Stanford NER tags. The sentences are tagged in one tagger call.
+    :param text:
+    :return: (sentence, [(token, tag), ...]) pairs
+    """
+    sentences = as_document(text).sentences
+    return zip(sentences, STANFORD_NER_TAGGER.tag_sents([get_tokens_list(sentence) for sentence in sentences]))
+
+
 def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
     """
     Get persons from text using Stanford libraries.
@@ -59,9 +69,7 @@ def get_persons(text, strict=False, return_source=False, window=2) -> Generator:
     :return:
     """
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = STANFORD_NER_TAGGER.tag(get_tokens_list(text))
+    for sentence, sentence_pos in get_tagged_sentences(text):
 
         # Iterate through chunks
         names = []
@@ -99,9 +107,7 @@ def get_organizations(text, strict=False, return_source=False, window=2) -> Gene
     :return:
     """
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = STANFORD_NER_TAGGER.tag(get_tokens_list(text))
+    for sentence, sentence_pos in get_tagged_sentences(text):
 
         # Iterate through chunks
         orgs = []
@@ -139,9 +145,7 @@ def get_locations(text, strict=False, return_source=False, window=2) -> Generato
     :return:
     """
     # Iterate through sentences
-    for sentence in get_sentence_list(text):
-        # Tag sentence
-        sentence_pos = STANFORD_NER_TAGGER.tag(get_tokens_list(text))
+    for sentence, sentence_pos in get_tagged_sentences(text):
 
         # Iterate through chunks
         locations = []
@@ -4,11 +4,11 @@ This module implements extraction functionality for geo entities in English, inc
 and aliases.
 
 """
-from typing import List, Tuple, Union, Dict, Generator, Any
+from typing import List, Tuple, Union, Dict, Generator, Any, Callable, Iterable, Optional
 
 from lexnlp.config.en import geoentities_config
 from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id, \
-    prepare_alias_blacklist_dict, conflicts_top_by_priority, entity_config, add_aliases_to_entity
+    prepare_alias_blacklist_dict, conflicts_top_by_priority, entity_config, add_aliases_to_entity, DictEntityIndex
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -21,13 +21,14 @@ _ALIAS_BLACK_LIST_PREPARED = prepare_alias_blacklist_dict(geoentities_config.ALI
 
 
 def get_geoentities(text: str,
-                    geo_config_list: List[Tuple[int, str, List[Tuple[str, str, bool, int]]]],
+                    geo_config_list: Union[List[Tuple[int, str, List[Tuple[str, str, bool, int]]]], DictEntityIndex],
                     priority: bool = False,
                     priority_by_id: bool = False,
                     text_languages: List[str] = None,
                     min_alias_len: int = geoentities_config.MIN_ALIAS_LEN,
                     prepared_alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]]
-                    = _ALIAS_BLACK_LIST_PREPARED) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
+                    = _ALIAS_BLACK_LIST_PREPARED,
+                    return_spans: bool = False) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
     """
     Searches for geo entities from the provided config list and yields pairs of (entity, alias).
     Entity is: (entity_id, name, [list of aliases])
@@ -38,7 +39,8 @@ def get_geoentities(text: str,
     entity_alias(), add_aliases_to_entity().
     :param text:
     :param geo_config_list: List of all possible known geo entities in the form of tuples
-    (id, name, [(alias, lang, is_abbrev, alias_id), ...]).
+    (id, name, [(alias, lang, is_abbrev, alias_id), ...]) or DictEntityIndex built of them.
+    For searching in many texts use GeoEntitySearcher which builds the index once.
     :param priority: If two entities found with the totally equal matching aliases -
     then use the one with the greatest priority field.
     :param priority_by_id: If two entities found with the totally equal matching aliases -
@@ -50,21 +52,110 @@ def get_geoentities(text: str,
     :param prepared_alias_black_list: List of aliases to exclude from searching in the form:
      dict of lang -> (list of normalized non-abbreviation aliases, list of normalized abbreviation aliases).
      Use dict_entities.prepare_alias_blacklist_dict() for preparing this dict.
+    :param return_spans: If True - generate (entity, alias, (start, end)) with the position of the alias in the text.
     :return: Generates tuples: (entity, alias)
     """
-    conflict_resolving_func = None
-
-    if priority_by_id:
-        conflict_resolving_func = conflicts_take_first_by_id
-
-    if priority:
-        conflict_resolving_func = conflicts_top_by_priority
+    conflict_resolving_func = get_conflict_resolving_func(priority, priority_by_id)
 
     yield from find_dict_entities(text, geo_config_list,
                                   conflict_resolving_func=conflict_resolving_func,
                                   text_languages=text_languages,
                                   min_alias_len=min_alias_len,
-                                  prepared_alias_black_list=prepared_alias_black_list)
+                                  prepared_alias_black_list=prepared_alias_black_list,
+                                  return_spans=return_spans)
+
+
+def get_conflict_resolving_func(priority: bool = False, priority_by_id: bool = False) -> Optional[Callable]:
+    """
+    Get the function resolving conflicts of geo entities having totally equal matching aliases.
+    :param priority: Take the entity with the greatest priority field.
+    :param priority_by_id: Take the entity with the lowest id.
+    :return: conflict resolving function or None
+    """
+    if priority:
+        return conflicts_top_by_priority
+    if priority_by_id:
+        return conflicts_take_first_by_id
+    return None
+
+
+class GeoEntitySearcher:
+    """
+    Geo entity searcher built once for the geo config and reused for any number of texts.
+
+    All aliases of the config are normalized once when the searcher is created, aliases shorter than
+    min_alias_len and the black-listed aliases are dropped at this time too. get_geoentities() does
+    all this work again for each text passed to it.
+
+    Usage:
+        searcher = GeoEntitySearcher.from_paths(entities_fn, aliases_fn, priority=True)
+        for entity, alias in searcher.search(text):
+            ...
+    """
+
+    def __init__(self,
+                 geo_config_list: List[Tuple[int, str, List[Tuple[str, str, bool, int]]]],
+                 priority: bool = False,
+                 priority_by_id: bool = False,
+                 text_languages: List[str] = None,
+                 min_alias_len: int = geoentities_config.MIN_ALIAS_LEN,
+                 prepared_alias_black_list: Union[None, Dict[str, Tuple[List[str], List[str]]]]
+                 = _ALIAS_BLACK_LIST_PREPARED):
+        """
+        :param geo_config_list: List of all possible known geo entities in the form of tuples
+        (id, name, [(alias, lang, is_abbrev, alias_id), ...]).
+        :param priority: If two entities found with the totally equal matching aliases -
+        then use the one with the greatest priority field.
+        :param priority_by_id: If two entities found with the totally equal matching aliases -
+        then use the one with the lowest id.
+        :param text_languages: Default language(s) of the source texts, can be overridden in search().
+        :param min_alias_len: Minimal length of geo entity aliases to search for.
+        :param prepared_alias_black_list: List of aliases to exclude from searching -
+        see dict_entities.prepare_alias_blacklist_dict().
+        """
+        self.index = DictEntityIndex(geo_config_list,
+                                     min_alias_len=min_alias_len,
+                                     prepared_alias_black_list=prepared_alias_black_list)
+        self.conflict_resolving_func = get_conflict_resolving_func(priority, priority_by_id)
+        self.text_languages = text_languages
+
+    @classmethod
+    def from_paths(cls, entities_fn: str, aliases_fn: str, **kwargs) -> 'GeoEntitySearcher':
+        """
+        Build the searcher of the geo entities loaded from the entities and aliases CSV files.
+        See load_entities_dict_by_path() and GeoEntitySearcher.__init__() for the arguments.
+        """
+        return cls(load_entities_dict_by_path(entities_fn, aliases_fn), **kwargs)
+
+    def search(self,
+               text: str,
+               text_languages: List[str] = None,
+               return_spans: bool = False) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
+        """
+        Search for geo entities in the text and yield pairs of (entity, alias).
+        :param text:
+        :param text_languages: Language(s) of the source text, the searcher's default languages are used if not set.
+        :param return_spans: If True - generate (entity, alias, (start, end)) with the position of the alias in the text.
+        :return: Generates tuples: (entity, alias)
+        """
+        yield from find_dict_entities(text, self.index,
+                                      conflict_resolving_func=self.conflict_resolving_func,
+                                      text_languages=text_languages or self.text_languages,
+                                      return_spans=return_spans)
+
+    def search_many(self,
+                    texts: Iterable[str],
+                    text_languages: List[str] = None,
+                    return_spans: bool = False) -> Generator[List[Tuple[Tuple, Tuple]], Any, Any]:
+        """
+        Search for geo entities in each of the texts.
+        :param texts:
+        :param text_languages: Language(s) of the source texts.
+        :param return_spans: If True - return (entity, alias, (start, end)) tuples.
+        :return: Generates list of (entity, alias) tuples for each text.
+        """
+        for text in texts:
+            yield list(self.search(text, text_languages=text_languages, return_spans=return_spans))
 
 
 def load_entities_dict_by_path(entities_fn: str, aliases_fn: str):
@@ -13,8 +13,8 @@ from collections import OrderedDict
 from typing import Generator
 
 from lexnlp.extract.en.amounts import (
-    get_amounts, NUM_PTN, CURRENCY_PREFIX_MAP,
-    CURRENCY_SYMBOL_MAP)
+    NUM_PTN, CURRENCY_PREFIX_MAP,
+    CURRENCY_SYMBOL_MAP, NumericTextContext)
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -81,13 +81,23 @@ CURRENCY_PTN_RE = re.compile(CURRENCY_PTN, re.IGNORECASE | re.MULTILINE | re.DOT
 
 
 def get_money(text, return_sources=False, float_digits=4) -> Generator:
-    for match in CURRENCY_PTN_RE.finditer(text):
+    yield from iter_money(NumericTextContext(text, float_digits), return_sources)
+
+
+def iter_money(context: NumericTextContext, return_sources=False) -> Generator:
+    """
+    Get money usages within the text of the context.
+    :param context: text and number conversions shared with other numeric extractors
+    :param return_sources: return source text as the last item of each tuple
+    :return: (amount, currency[, source]) tuples
+    """
+    for match in CURRENCY_PTN_RE.finditer(context.text):
         capture = match.capturesdict()
         if not (capture['prefix'] or capture['postfix']) and not (capture['trigger_word']):
             continue
         prefix = capture['prefix']
         postfix = capture['postfix']
-        amount = list(get_amounts(capture['amount'][0], float_digits=float_digits))
+        amount = context.get_amount_list(capture['amount'][0])
         if len(amount) != 1:
             continue
         if prefix:
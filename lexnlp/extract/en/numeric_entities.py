@@ -0,0 +1,145 @@
+"""Numeric entity extraction for English.
+
+This module extracts amounts, money, percents, durations, distances and ratios
+from a text in one call sharing the work between the extractors.
+
+Todo:
+"""
+
+# Imports
+from collections import OrderedDict
+from typing import Generator, Iterable, Tuple
+
+import regex as re
+
+from lexnlp.extract.en.amounts import get_amounts_of_matches, NumericTextContext, NUM_PTN_RE
+from lexnlp.extract.en.distances import iter_distances, DISTANCE_SYMBOL_MAP, DISTANCE_TOKEN_MAP
+from lexnlp.extract.en.durations import iter_durations, DURATION_MAP
+from lexnlp.extract.en.money import iter_money, CURRENCY_PREFIXES, CURRENCY_SYMBOL_MAP, \
+    CURRENCY_TOKEN_MAP, CURRENCY_ABBR_LIST, TRIGGER_WORDS
+from lexnlp.extract.en.percents import iter_percents, PERCENT_UNIT_LIST
+from lexnlp.extract.en.ratios import iter_ratios
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+def iter_amounts(context: NumericTextContext, return_sources=False) -> Generator:
+    yield from get_amounts_of_matches(context.text, context.number_matches, return_sources=return_sources,
+                                      float_digits=context.float_digits)
+
+
+NUMERIC_ENTITY_EXTRACTORS = OrderedDict([
+    ('amount', iter_amounts),
+    ('money', iter_money),
+    ('percent', iter_percents),
+    ('duration', iter_durations),
+    ('distance', iter_distances),
+    ('ratio', iter_ratios),
+])
+
+# Words and symbols at least one of which is found near each match of the extractor.
+# Amounts don't have such words and are always extracted.
+NUMERIC_ENTITY_TRIGGERS = {
+    'money': list(CURRENCY_PREFIXES) + list(CURRENCY_SYMBOL_MAP) + list(CURRENCY_TOKEN_MAP) +
+             list(CURRENCY_ABBR_LIST) + TRIGGER_WORDS,
+    'percent': PERCENT_UNIT_LIST,
+    'duration': list(DURATION_MAP),
+    'distance': list(DISTANCE_SYMBOL_MAP) + list(DISTANCE_TOKEN_MAP),
+}
+
+NUMERIC_ENTITY_TRIGGERS_PTN = '|'.join(
+    '(?P<{entity_type}>{triggers})'.format(
+        entity_type=entity_type,
+        triggers='|'.join(re.escape(t).replace('\\ ', '\\s+')
+                          for t in sorted(triggers, key=len, reverse=True)))
+    for entity_type, triggers in NUMERIC_ENTITY_TRIGGERS.items())
+NUMERIC_ENTITY_TRIGGERS_RE = re.compile(NUMERIC_ENTITY_TRIGGERS_PTN, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+# Number of characters before / after a number searched for the triggers: money trigger words
+# ("price", "cost") may precede the amount by 100 characters, the units follow the number.
+NUMERIC_ENTITY_CONTEXT_BEFORE = 110
+NUMERIC_ENTITY_CONTEXT_AFTER = 30
+
+# A ratio is a number followed by "to" or ":" and the second number. NUM_PTN match includes
+# the non-word character after the number, so the search starts at this character.
+RATIO_SEPARATOR_RE = re.compile(r'\s*(?:to|:)', re.IGNORECASE)
+
+
+def get_triggered_entity_types(text: str, entity_types: Iterable[str], number_matches: Iterable = None) -> set:
+    """
+    Find the numbers in the text once (NUM_PTN) and classify each of them by its context:
+    the triggers of the entity types found around the number and the ratio separator after it.
+    :param text: source text
+    :param entity_types: ['money', 'percent', ...]
+    :param number_matches: NUM_PTN_RE matches in the text if they are already found
+    :return: entity types which triggers are found near a number and the types without triggers
+    """
+    found = {t for t in entity_types if t not in NUMERIC_ENTITY_TRIGGERS and t != 'ratio'}
+    wanted = {t for t in entity_types if t not in found}
+    if not wanted:
+        return found
+
+    # context of the numbers: non-overlapping (start, end) ranges of the text around the numbers
+    context_start, context_end = None, None
+    for match in NUM_PTN_RE.finditer(text) if number_matches is None else number_matches:
+        if 'ratio' in wanted and RATIO_SEPARATOR_RE.match(text, max(match.end() - 1, 0)):
+            found.add('ratio')
+            wanted.remove('ratio')
+        start = max(match.start() - NUMERIC_ENTITY_CONTEXT_BEFORE, 0)
+        end = match.end() + NUMERIC_ENTITY_CONTEXT_AFTER
+        if context_end is not None and start <= context_end:
+            context_end = end
+            continue
+        if context_end is not None:
+            _add_triggered_types(text, context_start, context_end, found, wanted)
+        if not wanted:
+            return found
+        context_start, context_end = start, end
+    if context_end is not None:
+        _add_triggered_types(text, context_start, context_end, found, wanted)
+    return found
+
+
+def _add_triggered_types(text: str, start: int, end: int, found: set, wanted: set) -> None:
+    if not wanted - {'ratio'}:
+        return
+    for match in NUMERIC_ENTITY_TRIGGERS_RE.finditer(text, start, end):
+        entity_type = match.lastgroup
+        if entity_type in wanted:
+            found.add(entity_type)
+            wanted.remove(entity_type)
+            if not wanted - {'ratio'}:
+                return
+
+
+def get_numeric_entities(text, entity_types: Iterable[str] = None,
+                         return_sources=False, float_digits=4) -> Generator[Tuple[str, Tuple], None, None]:
+    """
+    Get amounts, money, percents, durations, distances and ratios within text.
+    The numbers of the text are found once and the extractors which units are not met
+    near any of the numbers are skipped, see get_triggered_entity_types(). The lowercase text and the amounts
+    of the captured numbers are shared between the extractors.
+    :param text: source text
+    :param entity_types: subset of NUMERIC_ENTITY_EXTRACTORS keys, all the types if None
+    :param return_sources: return source text as the last item of each entity
+    :param float_digits: round float to N digits, don't round if None
+    :return: (entity type, entity) tuples grouped by entity type in the order of entity_types,
+    entity is the item yielded by the corresponding get_...() function, e.g.: ('money', (5.0, 'USD'))
+    """
+    entity_types = list(NUMERIC_ENTITY_EXTRACTORS) if entity_types is None else list(entity_types)
+    for entity_type in entity_types:
+        if entity_type not in NUMERIC_ENTITY_EXTRACTORS:
+            raise KeyError('Unknown numeric entity type: "{}"'.format(entity_type))
+
+    context = NumericTextContext(text, float_digits)
+    found_types = get_triggered_entity_types(text, entity_types, context.number_matches)
+    for entity_type in entity_types:
+        if entity_type not in found_types:
+            continue
+        for item in NUMERIC_ENTITY_EXTRACTORS[entity_type](context, return_sources):
+            yield entity_type, item
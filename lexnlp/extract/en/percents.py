@@ -7,7 +7,7 @@ Todo:
 # Imports
 import regex as re
 from typing import Generator
-from .amounts import get_amounts, NUM_PTN
+from .amounts import NUM_PTN, NumericTextContext
 from .money import CURRENCY_SYMBOL_MAP, CURRENCY_PREFIX_MAP
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -48,11 +48,22 @@ def get_percents(text, return_sources=False, float_digits=4) -> Generator:
     :param float_digits:
     :return:
     """
+    yield from iter_percents(NumericTextContext(text, float_digits), return_sources)
+
+
+def iter_percents(context: NumericTextContext, return_sources=False) -> Generator:
+    """
+    Get percent usages within the text of the context.
+    :param context: text and number conversions shared with other numeric extractors
+    :param return_sources: return source text as the last item of each tuple
+    :return: (unit, number, value[, source]) tuples
+    """
+    float_digits = context.float_digits
     for source_text, number_text, currency_prefix, percent_item \
-            in PERCENT_PTN_RE.findall(text.lower()):
+            in PERCENT_PTN_RE.findall(context.text_lower):
         if currency_prefix:
             continue
-        number = list(get_amounts(number_text, float_digits=float_digits))
+        number = context.get_amount_list(number_text)
         if len(number) != 1:
             continue
         val = PERCENT_UNIT_MAP[percent_item] * number[0]
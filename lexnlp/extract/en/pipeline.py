@@ -0,0 +1,219 @@
+"""Extraction pipeline for English.
+
+This module runs a set of English extractors (get_amounts, get_dates, get_definitions...)
+over a stream of documents, optionally in a process pool, and reports time spent by each extractor.
+
+Example:
+    pipeline = ExtractionPipeline(['amounts', 'dates', 'definitions'])
+    for result in pipeline.run(texts, workers=4, chunksize=8):
+        print(result.index, result.results['dates'])
+    print(pipeline.timings)
+
+Todo:
+"""
+
+# Imports
+import importlib
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+from lexnlp.nlp.en.document import Document
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+# extractor name -> "module:function", the function takes the text and returns an iterable
+EXTRACTORS = OrderedDict([
+    ('acts', 'lexnlp.extract.en.acts:get_acts'),
+    ('amounts', 'lexnlp.extract.en.amounts:get_amounts'),
+    ('citations', 'lexnlp.extract.en.citations:get_citations'),
+    ('conditions', 'lexnlp.extract.en.conditions:get_conditions'),
+    ('constraints', 'lexnlp.extract.en.constraints:get_constraints'),
+    ('copyright', 'lexnlp.extract.en.copyright:get_copyright'),
+    ('courts', 'lexnlp.extract.en.courts:_get_courts'),
+    ('cusip', 'lexnlp.extract.en.cusip:get_cusip'),
+    ('dates', 'lexnlp.extract.en.dates:get_dates'),
+    ('definitions', 'lexnlp.extract.en.definitions:get_definitions'),
+    ('distances', 'lexnlp.extract.en.distances:get_distances'),
+    ('durations', 'lexnlp.extract.en.durations:get_durations'),
+    ('money', 'lexnlp.extract.en.money:get_money'),
+    ('percents', 'lexnlp.extract.en.percents:get_percents'),
+    ('pii', 'lexnlp.extract.en.pii:get_pii'),
+    ('ratios', 'lexnlp.extract.en.ratios:get_ratios'),
+    ('regulations', 'lexnlp.extract.en.regulations:get_regulations'),
+    ('trademarks', 'lexnlp.extract.en.trademarks:get_trademarks'),
+    ('urls', 'lexnlp.extract.en.urls:get_urls'),
+])
+
+
+def load_extractor(path: str) -> Tuple[Callable, Optional[Callable]]:
+    """
+    Import the extractor function.
+    :param path: "module:function", e.g.: "lexnlp.extract.en.courts:_get_courts"
+    :return: function and warm_up() function of its module if the module has one
+    """
+    module_name, func_name = path.split(':')
+    module = importlib.import_module(module_name)
+    warm_up = getattr(module, 'warm_up', None)
+    return getattr(module, func_name), warm_up if callable(warm_up) else None
+
+
+class DocumentResult:
+    """
+    Results of the extractors for one document.
+    """
+    __slots__ = ['index', 'results', 'timings', 'errors']
+
+    def __init__(self, index: int):
+        # position of the document in the texts passed to ExtractionPipeline.run()
+        self.index = index
+        # extractor name -> list of the extracted items
+        self.results = OrderedDict()  # type: Dict[str, List]
+        # extractor name -> seconds spent
+        self.timings = OrderedDict()  # type: Dict[str, float]
+        # extractor name -> error message, for the extractors that failed
+        self.errors = OrderedDict()  # type: Dict[str, str]
+
+
+class ExtractionPipeline:
+    """
+    Runs the extractors over the documents. Each document is wrapped into Document
+    so the extractors share its sentences and POS tags.
+    Models and parsers of the extractors are loaded once per process (see warm_up()).
+    """
+
+    def __init__(self,
+                 extractor_names: Iterable[str] = None,
+                 extractors: Dict[str, str] = None,
+                 raise_errors: bool = True):
+        """
+        :param extractor_names: names of the extractors to run, all the extractors if None
+        :param extractors: extractor name -> "module:function" map, EXTRACTORS by default
+        :param raise_errors: raise extractor errors or store them in DocumentResult.errors
+        """
+        self.extractors = extractors or EXTRACTORS
+        self.extractor_names = list(extractor_names or self.extractors)
+        for name in self.extractor_names:
+            if name not in self.extractors:
+                raise KeyError('Unknown extractor: "{}"'.format(name))
+        self.raise_errors = raise_errors
+        self.functions = None  # type: Optional[Dict[str, Callable]]
+        # total seconds and number of documents processed by each extractor
+        self.timings = OrderedDict((name, 0.0) for name in self.extractor_names)  # type: Dict[str, float]
+        self.document_count = 0
+
+    def warm_up(self) -> None:
+        """
+        Import the extractors and load their models / parsers.
+        """
+        if self.functions is not None:
+            return
+        functions = OrderedDict()
+        for name in self.extractor_names:
+            func, module_warm_up = load_extractor(self.extractors[name])
+            if module_warm_up:
+                module_warm_up()
+            functions[name] = func
+        self.functions = functions
+
+    def process(self, text: str, index: int = 0) -> DocumentResult:
+        """
+        Run the extractors over the text in the current process.
+        :param text: document text
+        :param index: document index stored in the result
+        :return: DocumentResult
+        """
+        self.warm_up()
+        document = Document(text)
+        result = DocumentResult(index)
+        for name, func in self.functions.items():
+            start = time.time()
+            try:
+                result.results[name] = list(func(document))
+            except Exception as e:
+                if self.raise_errors:
+                    raise
+                result.results[name] = []
+                result.errors[name] = '{}: {}'.format(type(e).__name__, e)
+            result.timings[name] = time.time() - start
+        return result
+
+    def process_chunk(self, texts: List[str], first_index: int) -> List[DocumentResult]:
+        return [self.process(text, first_index + i) for i, text in enumerate(texts)]
+
+    def run(self, texts: Iterable[str], workers: int = 1, chunksize: int = 1) -> Generator[DocumentResult, None, None]:
+        """
+        Run the extractors over the texts yielding the results in the order of the texts.
+        :param texts: document texts, may be a lazy iterable - only a few chunks per worker are read ahead
+        :param workers: number of worker processes, documents are processed in the current process if it is 1 or less
+        :param chunksize: number of documents sent to a worker process at once
+        :return: DocumentResult per document
+        """
+        if not workers or workers <= 1:
+            for index, text in enumerate(texts):
+                yield self.add_timings(self.process(text, index))
+            return
+
+        texts = iter(texts)
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=init_worker,
+                                 initargs=(self.extractor_names, self.extractors, self.raise_errors)) as executor:
+            pending = deque()
+            index = 0
+            while True:
+                while len(pending) < workers * 2:
+                    chunk = list(islice(texts, chunksize))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(process_worker_chunk, chunk, index))
+                    index += len(chunk)
+                if not pending:
+                    break
+                for result in pending.popleft().result():
+                    yield self.add_timings(result)
+
+    def add_timings(self, result: DocumentResult) -> DocumentResult:
+        for name, seconds in result.timings.items():
+            self.timings[name] += seconds
+        self.document_count += 1
+        return result
+
+
+# pipeline of the worker process, see init_worker()
+worker_pipeline = None  # type: Optional[ExtractionPipeline]
+
+
+def init_worker(extractor_names: List[str], extractors: Dict[str, str], raise_errors: bool) -> None:
+    """
+    Create and warm up the pipeline of the worker process once - before processing the documents.
+    """
+    global worker_pipeline
+    worker_pipeline = ExtractionPipeline(extractor_names, extractors, raise_errors)
+    worker_pipeline.warm_up()
+
+
+def process_worker_chunk(texts: List[str], first_index: int) -> List[DocumentResult]:
+    return worker_pipeline.process_chunk(texts, first_index)
+
+
+def run_pipeline(texts: Iterable[str],
+                 extractor_names: Iterable[str] = None,
+                 workers: int = 1,
+                 chunksize: int = 1) -> Generator[DocumentResult, None, None]:
+    """
+    Run the extractors over the texts, see ExtractionPipeline.run().
+    :param texts: document texts
+    :param extractor_names: names of the extractors (EXTRACTORS keys), all the extractors if None
+    :param workers: number of worker processes
+    :param chunksize: number of documents sent to a worker process at once
+    :return: DocumentResult per document
+    """
+    yield from ExtractionPipeline(extractor_names).run(texts, workers=workers, chunksize=chunksize)
@@ -9,7 +9,7 @@ Todo:
 import regex as re
 from typing import Generator
 
-from lexnlp.extract.en.amounts import get_amounts, NUM_PTN
+from lexnlp.extract.en.amounts import NUM_PTN, NumericTextContext
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -30,9 +30,20 @@ RATIO_PTN_RE = re.compile(RATIO_PTN, re.IGNORECASE | re.MULTILINE | re.DOTALL |
 
 
 def get_ratios(text, return_sources=False, float_digits=4) -> Generator:
-    for source_text, ratio_1_text, ratio_2_text in RATIO_PTN_RE.findall(text.lower()):
-        amount_1 = list(get_amounts(ratio_1_text, float_digits=float_digits))
-        amount_2 = list(get_amounts(ratio_2_text, float_digits=float_digits))
+    yield from iter_ratios(NumericTextContext(text, float_digits), return_sources)
+
+
+def iter_ratios(context: NumericTextContext, return_sources=False) -> Generator:
+    """
+    Get ratios within the text of the context.
+    :param context: text and number conversions shared with other numeric extractors
+    :param return_sources: return source text as the last item of each tuple
+    :return: (amount 1, amount 2, ratio[, source]) tuples
+    """
+    float_digits = context.float_digits
+    for source_text, ratio_1_text, ratio_2_text in RATIO_PTN_RE.findall(context.text_lower):
+        amount_1 = context.get_amount_list(ratio_1_text)
+        amount_2 = context.get_amount_list(ratio_2_text)
         if len(amount_1) != 1 or len(amount_2) != 1:
             continue
         amount_1 = amount_1[0]
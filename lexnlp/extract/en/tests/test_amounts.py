@@ -9,8 +9,13 @@ Todo:
 """
 
 # Imports
+import codecs
+import os
+import time
 
-from lexnlp.extract.en.amounts import get_amounts
+from nose.tools import assert_equal, assert_raises
+
+from lexnlp.extract.en.amounts import get_amounts, text2num, _text2num_cached
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -78,3 +83,37 @@ outstanding under this Agreement have been declared or have automatically become
 acceleration or otherwise)."""
     for _ in lexnlp_tests.benchmark_extraction_func(get_amounts, text):
         continue
+
+
+def test_text2num_cached():
+    """
+    Test text2num() returns the same results and errors for cached written amounts.
+    :return:
+    """
+    for _ in range(2):
+        assert_equal(125, text2num('One Hundred Twenty-Five, '))
+        assert_equal(125, text2num('one hundred twenty five'))
+        assert_equal(2.75, text2num('two and three quarters'))
+        assert_equal(1000000.0, text2num('1,000,000'))
+        assert_raises(RuntimeError, text2num, 'twenty lovely')
+
+    # failures are not cached
+    _text2num_cached.cache_clear()
+    assert_raises(RuntimeError, text2num, 'twenty lovely')
+    assert_equal(0, _text2num_cached.cache_info().currsize)
+
+
+def amounts_sources_speed():
+    """
+    Benchmark get_amounts(return_sources=True) on growing text: the time should grow linearly.
+    Not named test_XXX because it is not intended for (automatic) regression tests.
+    :return:
+    """
+    file_path = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '../../../../test_data/long_parsed_text.txt')
+    with codecs.open(file_path, 'r', encoding='utf-8') as fr:
+        text = fr.read()
+    for factor in (1, 2, 4):
+        start = time.time()
+        amounts = list(get_amounts(text * factor, return_sources=True))
+        print('x{0}: {1} amounts in {2:.2f}s'.format(factor, len(amounts), time.time() - start))
@@ -14,12 +14,14 @@ Todo:
 # Imports
 import pytest
 import datetime
+import numpy
 import random
 import string
 
 from nose.tools import assert_list_equal, assert_dict_equal, assert_equal
 
-from lexnlp.extract.en.dates import get_dates_list, get_date_features, get_raw_date_list, train_default_model
+from lexnlp.extract.en.dates import get_dates_list, get_date_features, get_raw_date_list, train_default_model, \
+    get_date_scores, get_date_feature_matrix, MODEL_DATE
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -211,6 +213,32 @@ def test_date_feature_1_bigram():
                        'char_6': 0.0, 'bigram_94': 0.0})
 
 
+def test_date_feature_matrix():
+    """
+    Test that the feature matrix matches dict features in model column order.
+    :return:
+    """
+    text = EXAMPLE_TEXT_1
+    spans = [d[1] for d in get_raw_date_list(text, return_source=True)]
+    feature_matrix = get_date_feature_matrix(text, spans)
+    for row, (start, end) in zip(feature_matrix, spans):
+        features = get_date_features(text, start, end)
+        assert_list_equal(row.tolist(), [features[column] for column in MODEL_DATE.columns])
+
+
+def test_batched_date_scores():
+    """
+    Test that batched classifier scoring matches per-candidate scoring.
+    :return:
+    """
+    text = EXAMPLE_TEXT_1 * 3
+    spans = [d[1] for d in get_raw_date_list(text, return_source=True)]
+    per_candidate_scores = [get_date_scores(text, [span])[0] for span in spans]
+    numpy.testing.assert_allclose(get_date_scores(text, spans, batch_size=None), per_candidate_scores)
+    numpy.testing.assert_allclose(get_date_scores(text, spans, batch_size=2), per_candidate_scores)
+    assert_list_equal(get_dates_list(text, batch_size=1), get_dates_list(text, batch_size=None))
+
+
 @pytest.mark.serial
 def test_build_model():
     """
@@ -4,10 +4,14 @@
 
 """
 
+import pickle
+
 from nose.tools import assert_dict_equal, assert_true, assert_false, assert_equals
 
+from lexnlp.extract.en import dict_entities
 from lexnlp.extract.en.dict_entities import find_dict_entities, entity_config, entity_alias, get_entity_name, \
-    normalize_text, prepare_alias_blacklist_dict, alias_is_blacklisted, get_entity_id, get_alias_id, get_alias_text
+    normalize_text, prepare_alias_blacklist_dict, alias_is_blacklisted, get_entity_id, get_alias_id, get_alias_text, \
+    normalize_text_with_offsets, DictEntityIndex, AliasNormalizationCache
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -205,4 +209,82 @@ def test_get_alias_id():
 
 def test_get_alias_text():
     alias = entity_alias('alias', 'lang', False, 123)
-    assert_equals('alias', get_alias_text(alias))
\ No newline at end of file
+    assert_equals('alias', get_alias_text(alias))
+
+
+def test_normalize_text_with_offsets():
+    text = 'He said  "Hello" to the U.S.A. and\nE.D.N.Y.'
+    normalized, offsets = normalize_text_with_offsets(text)
+    assert_equals(normalize_text(text), normalized)
+    assert_equals(len(normalized) + 1, len(offsets))
+    assert_equals(len(text), offsets[-1])
+    for i, c in enumerate(normalized):
+        if c.isalpha():
+            assert_equals(c, text[offsets[i]].lower())
+
+
+def test_find_dict_entities_spans():
+    usa = entity_config(1, 'United States', aliases=[entity_alias('U.S.A.', is_abbreviation=True)])
+    court = entity_config(2, 'Bankr. E.D.N.Y.', aliases=[entity_alias('E.D.N.Y.', is_abbreviation=True)])
+    text = 'Filed in   "United   States" (U.S.A.) court:\nBankr.  E.D.N.Y. now'
+
+    res = list(find_dict_entities(text, [usa, court], return_spans=True))
+    assert_equals(3, len(res))
+    assert_equals([get_entity_name(entity) for entity, _alias, _span in res],
+                  [get_entity_name(entity) for entity, _alias in find_dict_entities(text, [usa, court])])
+    assert_equals(['United   States', 'U.S.A.', 'Bankr.  E.D.N.Y.'],
+                  [text[start:end] for _entity, _alias, (start, end) in res])
+
+
+def test_dict_entity_index():
+    some_entity = entity_config(1, 'Some Entity', aliases=['Something'])
+    some_entity1 = entity_config(2, 'Some Entity One', aliases=['Something One'])
+    some_entity2 = entity_config(3, 'Some Entity Two', aliases=[entity_alias('SE2', is_abbreviation=True),
+                                                               entity_alias('Etwas', language='de')])
+    entities = [some_entity, some_entity1, some_entity2]
+    text = '"Some Entity One" and SE2 should be found in this text, Something and Etwas as well.'
+
+    index = pickle.loads(pickle.dumps(DictEntityIndex(entities)))
+    for text_languages in (None, ['en']):
+        expected = [(get_entity_name(e), a[0])
+                    for e, a in find_dict_entities(text, entities, text_languages=text_languages)]
+        actual = [(get_entity_name(e), a[0]) for e, a in index.find(text, text_languages=text_languages)]
+        assert_equals(expected, actual)
+
+    assert_equals(['Some Entity One', 'SE2', 'Something'],
+                  [a[0] for _e, a in index.find(text, text_languages=['en'])])
+
+
+def test_alias_normalization_cache():
+    cache = AliasNormalizationCache(maxsize=2)
+    assert_equals(normalize_text('U.S.A.', lowercase=False), cache.normalize('U.S.A.', lowercase=False))
+    assert_equals(normalize_text('U.S.A.'), cache.normalize('U.S.A.'))
+    assert_equals(normalize_text('U.S.A.'), cache.normalize('U.S.A.'))
+    assert_equals((1, 2, 2, 2), tuple(cache.info()))
+
+    cache.normalize('Tables', use_stemmer=True)
+    assert_equals(2, len(cache))
+    assert_false(('U.S.A.', False, False) in cache)
+    assert_true(('U.S.A.', True, False) in cache)
+
+    cache.resize(1)
+    assert_equals(1, cache.info().currsize)
+    cache.clear()
+    assert_equals((0, 0, 1, 0), tuple(cache.info()))
+
+
+def test_alias_normalization_cache_size():
+    default_size = dict_entities.ALIAS_NORMALIZATION_CACHE_SIZE
+    try:
+        dict_entities.ALIAS_NORMALIZATION_CACHE_SIZE = 10
+        assert_equals(10, AliasNormalizationCache().maxsize)
+        assert_equals(None, AliasNormalizationCache(None).maxsize)
+        assert_equals(0, AliasNormalizationCache(0).maxsize)
+    finally:
+        dict_entities.ALIAS_NORMALIZATION_CACHE_SIZE = default_size
+
+    cache = AliasNormalizationCache()
+    assert_true(cache in dict_entities._ALIAS_NORMALIZATION_CACHES)
+    lock = cache._lock
+    dict_entities._reset_alias_normalization_cache_locks()
+    assert_true(cache._lock is not lock)
@@ -9,7 +9,7 @@ import os
 
 from lexnlp.extract.en.dict_entities import get_entity_name, \
     prepare_alias_blacklist_dict
-from lexnlp.extract.en.geoentities import get_geoentities, load_entities_dict_by_path
+from lexnlp.extract.en.geoentities import get_geoentities, load_entities_dict_by_path, GeoEntitySearcher
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -20,10 +20,14 @@ __maintainer__ = "LexPredict, LLC"
 __email__ = "support@contraxsuite.com"
 
 
-def load_entities_dict():
+def get_entities_paths():
     entities_fn = os.path.join(os.path.dirname(lexnlp_tests.this_test_data_path()), 'geoentities.csv')
     aliases_fn = os.path.join(os.path.dirname(lexnlp_tests.this_test_data_path()), 'geoaliases.csv')
-    return load_entities_dict_by_path(entities_fn, aliases_fn)
+    return entities_fn, aliases_fn
+
+
+def load_entities_dict():
+    return load_entities_dict_by_path(*get_entities_paths())
 
 
 _CONFIG = list(load_entities_dict())
@@ -69,3 +73,16 @@ def test_geoentities_alias_filtering():
                                                    [get_entity_name(c[0]) for c in actual],
                                                    debug_print=True,
                                                    start_from_csv_line=6)
+
+
+def test_geoentity_searcher():
+    texts = ['And AND AND AND And',
+             'This Agreement is made in the United States of America and in Germany.',
+             'Shipped from CA to New York, US via Canada.']
+    searcher = GeoEntitySearcher.from_paths(*get_entities_paths(), priority=True)
+    actual = list(searcher.search_many(texts, text_languages='en', return_spans=True))
+    expected = [list(get_geoentities(text, geo_config_list=_CONFIG, priority=True, text_languages='en',
+                                     return_spans=True)) for text in texts]
+    assert len(actual) == 3
+    assert [[(get_entity_name(c[0]), c[1][0], c[2]) for c in res] for res in actual] == \
+        [[(get_entity_name(c[0]), c[1][0], c[2]) for c in res] for res in expected]
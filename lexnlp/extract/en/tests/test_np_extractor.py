@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Noun phrase extraction unit tests for English.
+
+This module implements unit tests for the shared POS tagging and NP chunking utilities in English.
+
+Todo:
+"""
+
+# Imports
+from nltk.tokenize import TreebankWordTokenizer
+from nose.tools import assert_equal
+
+from lexnlp.extract.en.utils import NPExtractor, PosTagger, NP_TOKENIZER, get_chunker, default_grammar
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+def test_np_tokenizer():
+    punctuation = list(TreebankWordTokenizer.PUNCTUATION)
+    tokenize = NPExtractor().get_tokenizer()
+    assert_equal(['Smith', '&', 'Jones', ',', 'Inc.'], tokenize('Smith & Jones, Inc.'))
+    # NPExtractor doesn't change the rules of the other tokenizers
+    assert_equal(punctuation, TreebankWordTokenizer.PUNCTUATION)
+    assert_equal(['Smith', '&', 'Jones', ',', 'Inc', '.'], TreebankWordTokenizer().tokenize('Smith & Jones, Inc.'))
+
+
+def test_shared_chunker():
+    assert NPExtractor().chunker is NPExtractor(grammar=default_grammar).chunker
+    assert get_chunker(default_grammar) is NPExtractor().chunker
+
+
+def test_pos_tagger_cache():
+    tagger = PosTagger()
+    sentence = 'This Agreement is made by Smith & Jones, Inc.'
+    tags = tagger.get_tagged_tokens(sentence, NP_TOKENIZER)
+    assert_equal(tagger.tag(sentence, NP_TOKENIZER), tags)
+    tagger.chunk(sentence, get_chunker(default_grammar), NP_TOKENIZER)
+    assert_equal(1, tagger.cache_info().misses)
+    assert_equal(1, tagger.cache_info().hits)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Numeric entity unit tests for English.
+
+This module implements unit tests for the combined numeric entity extraction functionality in English.
+
+Todo:
+"""
+
+# Imports
+from nose.tools import assert_equal, assert_raises
+
+from lexnlp.extract.en.amounts import NumericTextContext
+from lexnlp.extract.en.distances import get_distances
+from lexnlp.extract.en.durations import get_durations
+from lexnlp.extract.en.money import get_money
+from lexnlp.extract.en.numeric_entities import get_numeric_entities, get_triggered_entity_types
+from lexnlp.extract.en.percents import get_percents
+from lexnlp.extract.en.ratios import get_ratios
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+TEXT = 'The price is $25.50 payable within thirty days, the interest is 5.5% per annum, ' \
+       'the store is 3 miles away and the ratio is 3:1.'
+
+
+def test_numeric_entities():
+    extractors = [('money', get_money), ('percent', get_percents), ('duration', get_durations),
+                  ('distance', get_distances), ('ratio', get_ratios)]
+    for return_sources in (False, True):
+        expected = [(entity_type, item) for entity_type, func in extractors
+                    for item in func(TEXT, return_sources=return_sources)]
+        actual = list(get_numeric_entities(TEXT, [t for t, _ in extractors], return_sources=return_sources))
+        assert_equal(expected, actual)
+    assert_equal([('money', (25.5, 'USD'))], list(get_numeric_entities(TEXT, ['money'])))
+
+
+def test_numeric_entity_triggers():
+    assert_equal({'amount', 'duration'},
+                 get_triggered_entity_types('Thirty Days', ['amount', 'money', 'duration', 'ratio']))
+    assert_equal([], list(get_numeric_entities('five apples', ['money', 'percent', 'duration'])))
+    # the triggers count only near the numbers
+    assert_equal({'ratio'}, get_triggered_entity_types(
+        'The ratio is 3:1. The Seller shall deliver the goods to the Buyer at its price.', ['money', 'ratio']))
+    assert_equal(set(), get_triggered_entity_types('go to the store, 3 apples', ['distance', 'ratio']))
+    assert_raises(KeyError, lambda: list(get_numeric_entities(TEXT, ['temperature'])))
+
+
+def test_numeric_text_context():
+    context = NumericTextContext('Thirty Days')
+    assert_equal('thirty days', context.text_lower)
+    amounts = context.get_amount_list('thirty')
+    assert_equal([30], amounts)
+    assert context.get_amount_list('thirty') is amounts
+    assert_equal(['Thirty '], [m.group() for m in context.number_matches])
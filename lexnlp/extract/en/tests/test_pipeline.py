@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from lexnlp.extract.en.amounts import get_amounts
+from lexnlp.extract.en.money import get_money
+from lexnlp.extract.en.pipeline import ExtractionPipeline, run_pipeline
+from lexnlp.extract.en.urls import get_urls
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class TestExtractionPipeline(TestCase):
+    texts = ['The price is $25 payable within 10 days.',
+             'See http://example.com for the rest of the terms.',
+             'No numbers here.'] * 3
+
+    def test_pipeline(self):
+        pipeline = ExtractionPipeline(['amounts', 'money', 'urls'])
+        results = list(pipeline.run(self.texts))
+        self.assertEqual(list(range(len(self.texts))), [r.index for r in results])
+        for text, result in zip(self.texts, results):
+            self.assertEqual(list(get_amounts(text)), result.results['amounts'])
+            self.assertEqual(list(get_money(text)), result.results['money'])
+            self.assertEqual(list(get_urls(text)), result.results['urls'])
+            self.assertEqual(['amounts', 'money', 'urls'], list(result.timings))
+        self.assertEqual(len(self.texts), pipeline.document_count)
+        self.assertEqual(['amounts', 'money', 'urls'], list(pipeline.timings))
+
+    def test_pipeline_workers(self):
+        expected = [r.results for r in run_pipeline(self.texts, ['amounts', 'money'])]
+        actual = [r.results for r in run_pipeline(iter(self.texts), ['amounts', 'money'], workers=2, chunksize=2)]
+        self.assertEqual(expected, actual)
+
+    def test_unknown_extractor(self):
+        with self.assertRaises(KeyError):
+            ExtractionPipeline(['amounts', 'horoscopes'])
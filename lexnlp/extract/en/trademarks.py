@@ -10,7 +10,7 @@ Todo: -
 import re
 from typing import Generator
 
-from lexnlp.nlp.en.segments.sentences import get_sentence_list
+from lexnlp.nlp.en.document import as_document
 from lexnlp.extract.en.utils import NPExtractor
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -43,7 +43,7 @@ def get_trademarks(text) -> Generator:
     """
     # Iterate through sentences
     if TRADEMARK_PTN_RE.search(text):
-        for sentence in get_sentence_list(text):
+        for sentence in as_document(text).sentences:
             for phrase in np_extractor.get_np(sentence):
                 tms = TRADEMARK_PTN_RE.findall(phrase)
                 for tm in tms:
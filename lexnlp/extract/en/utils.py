@@ -4,7 +4,9 @@
 import re
 import string
 import unicodedata
+from functools import lru_cache
 from itertools import groupby
+from typing import Callable, Dict, List, Tuple
 
 import nltk
 
@@ -32,6 +34,82 @@ def strip_unicode_punctuation(text, valid_punctuation=None):
     return "".join(c for c in text if (c in valid_punctuation) or not unicodedata.category(c).startswith("P"))
 
 
+# Max number of (text, tokenizer) -> POS tags entries kept by PosTagger
+TAGGED_TEXT_CACHE_SIZE = 10000
+
+TaggedTokens = Tuple[Tuple[str, str], ...]
+
+
+class NPTokenizer(nltk.tokenize.TreebankWordTokenizer):
+    """
+    Treebank tokenizer used by NPExtractor. It has its own copy of the punctuation rules
+    instead of patching TreebankWordTokenizer.PUNCTUATION shared with the other tokenizers.
+    """
+    PUNCTUATION = list(nltk.tokenize.TreebankWordTokenizer.PUNCTUATION)
+    PUNCTUATION[4] = (re.compile(r'[;@#$%]', re.UNICODE), ' \\g<0> ')
+
+
+# tokenizer names accepted by PosTagger
+WORD_TOKENIZER = 'word'
+NP_TOKENIZER = 'np'
+
+
+class PosTagger:
+    """
+    Tokenizes and POS-tags texts (sentences, phrases) sharing the tags between the extractors.
+    Tags of the last cache_size texts are cached: amounts, copyrights, companies and trademarks
+    extracted from the same document tag each sentence (tokenized in the same way) once.
+    """
+
+    def __init__(self, cache_size: int = TAGGED_TEXT_CACHE_SIZE):
+        self.tokenizers = {
+            WORD_TOKENIZER: nltk.word_tokenize,
+            NP_TOKENIZER: NPTokenizer().tokenize
+        }  # type: Dict[str, Callable[[str], List[str]]]
+        self.get_tagged_tokens = lru_cache(maxsize=cache_size)(self.tag)
+
+    def tokenize(self, text: str, tokenizer: str = WORD_TOKENIZER) -> List[str]:
+        return self.tokenizers[tokenizer](text)
+
+    def tag(self, text: str, tokenizer: str = WORD_TOKENIZER) -> TaggedTokens:
+        """
+        Tokenize and POS-tag the text, see get_tagged_tokens() for the cached version.
+        :param text: sentence or phrase
+        :param tokenizer: WORD_TOKENIZER or NP_TOKENIZER
+        :return: (token, tag) tuples
+        """
+        return tuple(nltk.tag.pos_tag(self.tokenize(text, tokenizer)))
+
+    def chunk(self, text: str, chunker: nltk.RegexpParser, tokenizer: str = WORD_TOKENIZER) -> nltk.Tree:
+        """
+        Chunk the text using cached POS tags.
+        :param text: sentence or phrase
+        :param chunker: RegexpParser, see get_chunker()
+        :param tokenizer: WORD_TOKENIZER or NP_TOKENIZER
+        :return: chunk tree
+        """
+        return chunker.parse(list(self.get_tagged_tokens(text, tokenizer)))
+
+    def cache_clear(self):
+        self.get_tagged_tokens.cache_clear()
+
+    def cache_info(self):
+        return self.get_tagged_tokens.cache_info()
+
+
+pos_tagger = PosTagger()
+
+
+@lru_cache(maxsize=None)
+def get_chunker(grammar: str) -> nltk.RegexpParser:
+    """
+    Get RegexpParser compiled once per grammar.
+    :param grammar: chunk grammar
+    :return: RegexpParser
+    """
+    return nltk.RegexpParser(grammar)
+
+
 default_grammar = r"""
     NBAR:
         {<DT>?<NNP.*|JJ|\(|\)|,>*<NNP.*>}  # Nouns, Adj-s, brackets, terminated with Nouns
@@ -51,12 +129,10 @@ class NPExtractor(object):
 
     def __init__(self, grammar=None):
         grammar = grammar or default_grammar
-        self.chunker = nltk.RegexpParser(grammar)
+        self.chunker = get_chunker(grammar)
 
     def get_tokenizer(self):
-        tokenizer = nltk.tokenize.TreebankWordTokenizer
-        tokenizer.PUNCTUATION[4] = (re.compile(r'[;@#$%]', re.UNICODE), ' \\g<0> ')
-        return tokenizer().tokenize
+        return pos_tagger.tokenizers[NP_TOKENIZER]
 
     def cleanup_leaves(self, leaves):
         leaves = [l for l in
@@ -66,10 +142,7 @@ class NPExtractor(object):
         return leaves
 
     def get_np(self, text):
-        tokenizer_func = self.get_tokenizer()
-        tokens = tokenizer_func(text)
-        pos_tokens = nltk.tag.pos_tag(tokens)
-        chunks = self.chunker.parse(pos_tokens)
+        chunks = pos_tagger.chunk(text, self.chunker, NP_TOKENIZER)
 
         for tree in chunks.subtrees(filter=lambda t: t.label() == 'NP'):
             leaves = self.cleanup_leaves(tree.leaves())
@@ -11,7 +11,8 @@ from lexnlp.extract.common.annotations.court_annotation import CourtAnnotation
 from lexnlp.extract.en.dict_entities import find_dict_entities, conflicts_take_first_by_id
 import os
 import re
-from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams
+from lexnlp.extract.common.universal_court_parser import UniversalCourtsParser, ParserInitParams, \
+    LazyCourtsParser
 from lexnlp.extract.es.language_tokens import EsLanguageTokens
 from lexnlp.utils.lines_processing.line_processor import LineSplitParams
 
@@ -26,13 +27,15 @@ __email__ = "support@contraxsuite.com"
 def get_courts(text: str,
                court_config_list: List[Tuple[int, str, int, List[Tuple[str, str, bool, int]]]],
                priority: bool = False,
-               text_languages: List[str] = None) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
+               text_languages: List[str] = None,
+               return_spans: bool = False) -> Generator[Tuple[Tuple, Tuple], Any, Any]:
     """
     See lexnlp/extract/en/tests/test_courts.py
     """
     yield from find_dict_entities(text, court_config_list,
                                   conflict_resolving_func=conflicts_take_first_by_id if priority else None,
-                                  text_languages=text_languages)
+                                  text_languages=text_languages,
+                                  return_spans=return_spans)
 
 
 def setup_es_parser():
@@ -46,7 +49,15 @@ def setup_es_parser():
     return UniversalCourtsParser(ptrs)
 
 
-parser = setup_es_parser()
+# created on first use, see LazyCourtsParser
+parser = LazyCourtsParser(setup_es_parser, cache_name='es_courts')
+
+
+def warm_up() -> UniversalCourtsParser:
+    """
+    Create the Spanish court parser now (or load it from LEXNLP_COURTS_CACHE_DIR) instead of on first use.
+    """
+    return parser.warm_up()
 
 
 def _get_courts(text: str, language: str = None) -> Generator[dict, None, None]:
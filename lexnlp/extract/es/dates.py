@@ -77,5 +77,22 @@ class ESDateParser(DateParser):
         self.DATES = dates
 
 
-get_dates = ESDateParser(enable_classifier_check=False, language='es').get_dates
-get_date_list = ESDateParser(enable_classifier_check=False, language='es').get_date_list
+parser = ESDateParser(enable_classifier_check=False, language='es')
+
+
+def get_dates(text=None, language=None, scorer=None):
+    """
+    Get dates from Spanish text
+    :param text: str - text to search dates in
+    :param language: str - two-letters language definition
+    :param scorer: DateScorer or "classifier" / "rules" / "defer" - candidate scorer,
+        no scoring if None
+    """
+    return parser.get_dates(text, language, scorer=scorer)
+
+
+def get_date_list(text=None, language=None, scorer=None):
+    """
+    Get list of dates from Spanish text, see get_dates
+    """
+    return list(get_dates(text, language, scorer=scorer))
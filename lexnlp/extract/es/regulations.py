@@ -1,10 +1,11 @@
 import os
 # pylint: disable=unused-import
-from typing import List, Pattern, Generator
+from typing import List, Pattern, Generator, Iterable
 # pylint: enable=unused-import
 import regex as re
 import pandas as pd
 from lexnlp.extract.common.annotations.regulation_annotation import RegulationAnnotation
+from lexnlp.extract.common.parsing_context import ParsingContext, parse_many
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -32,8 +33,9 @@ class RegulationsParser:
         self.reg_start_triggers = []  # type: List[Pattern]
         self.load_trigger_words()
         self.setup_regexes()
+        # deprecated, use the list returned by parse(): result of the last parse() call,
+        # last-call-wins and not thread-safe; parse() itself keeps its annotations in ParsingContext
         self.annotations = []  # type: List[RegulationAnnotation]
-        self.locale = ''
 
     def setup_regexes(self) -> None:
         # read *.csv content and build regexes out of this data
@@ -58,14 +60,23 @@ class RegulationsParser:
 
     def parse(self, text: str, locale: str = None) -> List[RegulationAnnotation]:
         # find annotations in text passed and return them as a list of objects
-        self.locale = locale
-        self.annotations = []
-        self.match_start_trigger(text)
-        for ant in self.annotations:
+        ctx = ParsingContext(locale)
+        self.match_start_trigger(text, ctx)
+        for ant in ctx.annotations:
             ant.country = 'Spain'
-        return self.annotations
+        self.annotations = ctx.annotations
+        return ctx.annotations
 
-    def match_start_trigger(self, phrase: str) -> None:
+    def parse_many(self, texts: Iterable[str], locale: str = None,
+                   workers: int = 1, use_processes: bool = False,
+                   chunksize: int = None) -> List[List[RegulationAnnotation]]:
+        """
+        Parse each of the texts, see parsing_context.parse_many()
+        """
+        return parse_many(self.parse, texts, locale, workers=workers, use_processes=use_processes,
+                          chunksize=chunksize)
+
+    def match_start_trigger(self, phrase: str, ctx: ParsingContext) -> None:
         """
         :param phrase: mediante la emisión de instrumentos inscritos en el Registro Nacional de Valores, colocados
         :return: {name: 'Registro Nacional de Valores', probability: 100, ...}
@@ -76,18 +87,27 @@ class RegulationsParser:
                 coords = (match.start(), match.end())
                 ant = RegulationAnnotation(
                     name=text, coords=coords, text=text,
-                    locale=self.locale)
-                self.annotations.append(ant)
+                    locale=ctx.locale)
+                ctx.annotations.append(ant)
 
     def trim_annotations(self) -> None:
         # remove excess words from each definition
         pass
 
-    def get_annotations_as_dictionaries(self) -> List:
+    def get_annotations_as_dictionaries(self, annotations: List[RegulationAnnotation] = None) -> List:
+        """
+        :param annotations: annotations returned by parse(), the result of the last parse() call if None.
+            Deprecated: pass the annotations, the last parse() result is not thread-safe
+            (see ParsingContext)
+        """
+        return self.annotations_to_dictionaries(self.annotations if annotations is None else annotations)
+
+    @staticmethod
+    def annotations_to_dictionaries(annotations: List[RegulationAnnotation]) -> List:
         # make dictionaries like
         # { "attr": { "start": 100, "end": 162 }, "tags": {..} }
         # out of annotations
-        return [a.to_dictionary() for a in self.annotations]
+        return [a.to_dictionary() for a in annotations]
 
 
 def make_de_regulations_parser():
@@ -31,6 +31,12 @@ class TestParseSpanishLawsRegulations(TestCase):
         reg = ret[0]
         self.assertEqual('Registro Nacional de Valores', reg.name)
 
+    def test_annotations_as_dictionaries(self):
+        text = "mediante la emisión de instrumentos inscritos en el Registro Nacional de Valores, colocados"
+        ret = parser.parse(text)
+        self.assertEqual([a.to_dictionary() for a in ret], parser.get_annotations_as_dictionaries())
+        self.assertEqual([], parser.get_annotations_as_dictionaries([]))
+
     def test_parse_ley_del(self):
         text = "Para efectos de lo previsto en la presente Ley, por inversionistas institucionales se entenderá a las " +\
                "instituciones de seguros y de fianzas, únicamente cuando inviertan sus reservas técnicas; a las " +\
@@ -0,0 +1,108 @@
+"""Document analysis context for English.
+
+This module implements Document - the text of a document which lazily calculates and keeps
+its sentences, tokens and POS tags, so the extractors called for the same document share them.
+
+Todo:
+"""
+
+# Imports
+from typing import List, Tuple, Union
+
+import nltk
+
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.tokens import get_token_list
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+class Document(str):
+    """
+    Document text with its sentences, sentence spans, tokens and POS tags calculated on the first request.
+
+    Document is a str, so it can be passed to any get_...() function instead of the raw text:
+        document = Document(text)
+        definitions = list(get_definitions(document))
+        conditions = list(get_conditions(document))
+    The functions splitting the text to sentences take the sentences of the document
+    instead of splitting the text again.
+    """
+
+    def __new__(cls, text: str):
+        document = super().__new__(cls, text)
+        document._sentence_spans = None
+        document._sentences = None
+        document._sentence_tokens = None
+        document._sentence_pos_tags = None
+        document._tokens = None
+        return document
+
+    @property
+    def text(self) -> str:
+        return str(self)
+
+    @property
+    def sentence_spans(self) -> List[Tuple[int, int]]:
+        """
+        :return: (start, end) spans of the sentences, see get_sentence_span_list()
+        """
+        if self._sentence_spans is None:
+            self._sentence_spans = get_sentence_span_list(self)
+        return self._sentence_spans
+
+    @property
+    def sentences(self) -> List[str]:
+        """
+        :return: sentences, see get_sentence_list()
+        """
+        if self._sentences is None:
+            self._sentences = [self[start:end] for start, end in self.sentence_spans]
+        return self._sentences
+
+    @property
+    def sentences_with_coords(self) -> List[Tuple[str, int, int]]:
+        """
+        :return: (sentence, start, end) tuples, see get_sentence__with_coords_list()
+        """
+        return [(sentence, start, end) for sentence, (start, end) in zip(self.sentences, self.sentence_spans)]
+
+    @property
+    def sentence_tokens(self) -> List[List[str]]:
+        """
+        :return: token list of each sentence, see get_token_list()
+        """
+        if self._sentence_tokens is None:
+            self._sentence_tokens = [get_token_list(sentence) for sentence in self.sentences]
+        return self._sentence_tokens
+
+    @property
+    def sentence_pos_tags(self) -> List[List[Tuple[str, str]]]:
+        """
+        :return: (token, POS tag) list of each sentence
+        """
+        if self._sentence_pos_tags is None:
+            self._sentence_pos_tags = [nltk.pos_tag(tokens) for tokens in self.sentence_tokens]
+        return self._sentence_pos_tags
+
+    @property
+    def tokens(self) -> List[str]:
+        """
+        :return: tokens of the whole text, see get_token_list()
+        """
+        if self._tokens is None:
+            self._tokens = get_token_list(self)
+        return self._tokens
+
+
+def as_document(text: Union[str, Document]) -> Document:
+    """
+    :param text: raw text or Document
+    :return: the Document itself or a new Document for the raw text
+    """
+    return text if isinstance(text, Document) else Document(text)
@@ -0,0 +1,106 @@
+"""Document segmentation for English.
+
+This module splits a document into pages, sections, paragraphs, titles and sentences at once.
+The lines of the document and their features are calculated once and shared by the segmentation models.
+
+Example:
+    segments = segment_document(text, want={'pages', 'paragraphs'})
+    for start, end in segments['paragraphs']:
+        print(text[start:end])
+
+Todo:
+"""
+
+# Imports
+from typing import Dict, Iterable, List, Tuple
+
+from lexnlp.nlp.en.segments.pages import get_page_spans_by_breaks, predict_page_breaks
+from lexnlp.nlp.en.segments.paragraphs import get_paragraph_spans_by_breaks, predict_paragraph_breaks, \
+    splitlines_with_spans
+from lexnlp.nlp.en.segments.sections import get_section_spans_by_breaks, predict_section_breaks
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.segments.titles import get_title_spans_by_lines, predict_title_lines
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_document_line_distribution, \
+    get_line_spans, LineFeatureSet
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+SEGMENT_TYPES = ('pages', 'sections', 'paragraphs', 'titles', 'sentences')
+
+
+def segment_document(text: str,
+                     want: Iterable[str] = SEGMENT_TYPES,
+                     window_pre=3,
+                     window_post=3,
+                     score_threshold=0.5) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Get spans of the pages, sections, paragraphs, titles and sentences of the text.
+    The text is split into lines once and the line features shared by the segmentation models
+    (line lengths, character class and character counts) are calculated once.
+    Each span selects the same text as the string returned by the corresponding get_...() function
+    (get_pages(), get_sections(), get_paragraphs(), get_sentence_span_list()) except for the separators
+    between the lines: the span keeps the original line breaks. Title spans cover the title lines
+    which get_titles() joins with spaces, empty titles are skipped.
+    :param text: document text
+    :param want: subset of SEGMENT_TYPES
+    :param window_pre: number of lines before the line in the model features
+    :param window_post: number of lines after the line in the model features
+    :param score_threshold: min probability of a page / section / paragraph break or a title line
+    :return: segment type -> list of (start, end) spans
+    """
+    want = set(want)
+    for segment_type in want:
+        if segment_type not in SEGMENT_TYPES:
+            raise KeyError('Unknown segment type: "{}"'.format(segment_type))
+
+    segments = {segment_type: [] for segment_type in SEGMENT_TYPES
+                if segment_type in want}  # type: Dict[str, List[Tuple[int, int]]]
+    if 'sentences' in want:
+        segments['sentences'] = get_sentence_span_list(text)
+
+    # the character distributions are not defined for the documents without visible characters
+    if not text.strip():
+        return segments
+    line_spans = get_line_spans(text)
+    lines = [text[start:end] for start, end in line_spans]
+    features = LineFeatureSet(lines)
+    model_args = (window_pre, window_post, score_threshold)
+
+    if want & {'sections', 'paragraphs', 'titles'}:
+        line_distribution = build_document_line_distribution(text)
+
+    if 'pages' in want:
+        page_breaks = predict_page_breaks(lines, build_document_distribution(text), *model_args, features=features)
+        segments['pages'] = list(get_page_spans_by_breaks(text, line_spans, page_breaks))
+
+    if 'sections' in want:
+        section_breaks = predict_section_breaks(lines, line_distribution, *model_args, features=features)
+        segments['sections'] = list(get_section_spans_by_breaks(text, line_spans, section_breaks))
+
+    if 'paragraphs' in want:
+        # paragraphs are split by \r, \n, \r\n and \n\r only
+        paragraph_lines, paragraph_line_spans = splitlines_with_spans(text)
+        paragraph_features = features if paragraph_lines == lines else None
+        paragraph_breaks = predict_paragraph_breaks(paragraph_lines, line_distribution, *model_args,
+                                                    features=paragraph_features)
+        segments['paragraphs'] = list(get_paragraph_spans_by_breaks(text, paragraph_line_spans,
+                                                                    paragraph_breaks))
+
+    if 'titles' in want:
+        # get_titles() is wrapped with @safe_failure: it stops yielding on any error, e.g. KeyError
+        # for the chars missing in UNICODE_CHAR_TOP_CATEGORY_MAPPING or ValueError for a short document
+        # which features don't fit the model. The titles found before the error are kept the same way.
+        try:
+            title_lines = predict_title_lines(lines, line_distribution, *model_args, features=features)
+            for span in get_title_spans_by_lines(text, line_spans, title_lines):
+                segments['titles'].append(span)
+        except Exception:
+            pass
+
+    return segments
@@ -10,16 +10,17 @@ Todo:
 # Imports
 import os
 import string
-import unicodedata
 
-from typing import Generator
+from typing import Generator, List, Tuple
 
 # Packages
-import pandas
+import numpy as np
 from sklearn.externals import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_line_keyword_features, \
+    build_line_feature_matrix, get_line_category_counts, get_line_range_span, get_line_spans, normalize_line_breaks, \
+    strip_span, LineFeatureSet
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -69,12 +70,8 @@ def build_page_break_features(lines, line_id, line_window_pre, line_window_post,
         feature_vector["line_len_{0}".format(i)] = len(line)
 
         # Count characters
-        feature_vector["line_n_alpha_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("L")])
-        feature_vector["line_n_number_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("N")])
-        feature_vector["line_n_punct_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("P")])
-        feature_vector["line_n_whitespace_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("Z")])
+        for name, count in get_line_category_counts(line).items():
+            feature_vector["{0}_{1}".format(name, i)] = count
 
     # Simple checks
     line = lines[line_id]
@@ -99,9 +96,83 @@ def build_page_break_features(lines, line_id, line_window_pre, line_window_post,
     return feature_vector
 
 
-def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+PAGE_KEYWORDS = ['page', 'PAGE', 'Page']
+
+PAGE_WINDOW_FEATURES = ['line_len', 'line_n_alpha', 'line_n_number', 'line_n_punct', 'line_n_whitespace']
+
+
+def build_page_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                    include_doc=None, features: LineFeatureSet = None) \
+        -> Tuple[np.ndarray, List[str]]:
     """
-    Get pages from text.
+    Build feature matrix of all the lines: row i contains the values of
+    build_page_break_features(lines, i, ...) in the column order of the model.
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param features: line features shared with the other segmenters, calculated for the lines if None
+    :return: feature matrix and column names
+    """
+    features = features or LineFeatureSet(lines)
+    line_features = build_line_keyword_features(lines, PAGE_KEYWORDS)
+    stripped_lower = [line.strip().lower() for line in lines]
+    line_features['sw_page'] = np.array([s.startswith('page') for s in stripped_lower], dtype=np.float64)
+    line_features['sw_pg'] = np.array([s.startswith('pg') for s in stripped_lower], dtype=np.float64)
+    line_features.update(features.get_edge_features())
+    line_features.update(features.get_char_features(characters))
+    return build_line_feature_matrix(len(lines), line_window_pre, line_window_post,
+                                     features.get_base_features(PAGE_WINDOW_FEATURES), line_features, include_doc)
+
+
+def predict_page_breaks(lines, doc_distribution, window_pre=3, window_post=3, score_threshold=0.5,
+                        features: LineFeatureSet = None) -> List[int]:
+    """
+    Get ids of the lines starting new pages.
+    :param lines: lines of the document, text.splitlines()
+    :param doc_distribution: build_document_distribution() of the document text
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param features: line features shared with the other segmenters
+    :return: line ids
+    """
+    feature_matrix, _ = build_page_break_feature_matrix(lines, window_pre, window_post,
+                                                        include_doc=doc_distribution, features=features)
+    predicted_lines = PAGE_SEGMENTER_MODEL.predict_proba(feature_matrix)
+    return np.flatnonzero(predicted_lines[:, 1] >= score_threshold).tolist()
+
+
+def get_page_spans_by_breaks(text: str, line_spans: List[Tuple[int, int]], page_breaks: List[int]) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get page spans given the predicted page breaks.
+    :param text: document text
+    :param line_spans: spans of the lines of the text, see get_line_spans()
+    :param page_breaks: ids of the lines starting new pages, see predict_page_breaks()
+    :return: (start, end) spans of the pages
+    """
+    if len(page_breaks) > 0:
+        # Get first page
+        yield get_line_range_span(text, line_spans, 0, page_breaks[0])
+
+        # Iterate through page breaks
+        for i in range(len(page_breaks) - 1):
+            start, end = get_line_range_span(text, line_spans, page_breaks[i], page_breaks[i + 1])
+            if len(text[start:end].strip()) > 1:
+                yield start, end
+
+        # Yield final page
+        start, end = strip_span(text, get_line_range_span(text, line_spans, page_breaks[-1]))
+        if end - start > 1:
+            yield start, end
+
+
+def get_page_spans(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) spans of the pages in text. The spans select the pages yielded by get_pages()
+    except for the line breaks: text[start:end] keeps the original line breaks of the text.
     :param text:
     :param window_pre:
     :param window_post:
@@ -111,35 +182,22 @@ def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generat
 
     # Get document character distribution
     doc_distribution = build_document_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_page_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    line_spans = get_line_spans(text)
+    lines = [text[start:end] for start, end in line_spans]
 
     # Predict page breaks
-    test_feature_df = pandas.DataFrame(test_feature_data).fillna(-1)
-    test_predicted_lines = PAGE_SEGMENTER_MODEL.predict_proba(test_feature_df)
-    predicted_df = pandas.DataFrame(test_predicted_lines, columns=["prob_false", "prob_true"])
-    page_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
+    page_breaks = predict_page_breaks(lines, doc_distribution, window_pre, window_post, score_threshold)
+    yield from get_page_spans_by_breaks(text, line_spans, page_breaks)
 
-    if len(page_breaks) > 0:
-        # Get first break
-        pos0 = 0
-        pos1 = page_breaks[0]
-        yield "\n".join(lines[pos0:pos1])
-
-        # Iterate through paragraph breaks
-        for i in range(len(page_breaks) - 1):
-            # Get breaks
-            pos0 = page_breaks[i]
-            pos1 = page_breaks[i + 1]
-            # Get text
-            page = "\n".join(lines[pos0:pos1])
-            if len(page.strip()) > 1:
-                yield page
 
-        # Yield final page
-        page = "\n".join(lines[page_breaks[-1]:])
-        if len(page.strip()) > 1:
-            yield page.strip()
+def get_pages(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+    """
+    Get pages from text.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :return:
+    """
+    for start, end in get_page_spans(text, window_pre, window_post, score_threshold):
+        yield normalize_line_breaks(text[start:end])
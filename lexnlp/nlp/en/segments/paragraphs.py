@@ -11,14 +11,14 @@ import os
 # Imports
 import re
 import string
-import unicodedata
 from typing import Generator, List, Tuple, Union, Optional
 
 # Packages
-import pandas
+import numpy as np
 from sklearn.externals import joblib
 
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, build_line_feature_matrix, \
+    get_line_category_counts, LineFeatureSet
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -72,12 +72,8 @@ def build_paragraph_break_features(lines, line_id, line_window_pre, line_window_
         feature_vector["line_upper_case_{0}".format(i)] = line == line.upper()
 
         # Count characters
-        feature_vector["line_n_alpha_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("L")])
-        feature_vector["line_n_number_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("N")])
-        feature_vector["line_n_punct_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("P")])
-        feature_vector["line_n_whitespace_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("Z")])
+        for name, count in get_line_category_counts(line).items():
+            feature_vector["{0}_{1}".format(name, i)] = count
 
     # Simple checks
     line = lines[line_id]
@@ -97,6 +93,52 @@ def build_paragraph_break_features(lines, line_id, line_window_pre, line_window_
     return feature_vector
 
 
+def build_paragraph_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                         include_doc=None, as_int=True,
+                                         features: LineFeatureSet = None) -> Tuple[np.ndarray, List[str]]:
+    """
+    Build feature matrix of all the lines: row i contains the values of
+    build_paragraph_break_features(lines, i, ...) in the column order of the model.
+
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param as_int:
+    :param features: line features shared with the other segmenters, calculated for the lines if None
+    :return: feature matrix and column names
+    """
+    features = features or LineFeatureSet(lines)
+    line_features = features.get_edge_features()
+    line_features.update(features.get_char_features(characters))
+    return build_line_feature_matrix(len(lines), line_window_pre, line_window_post,
+                                     features.get_base_features(), line_features, include_doc, as_int)
+
+
+def predict_paragraph_breaks(lines, doc_distribution, window_pre=3, window_post=3, score_threshold=0.5,
+                             features: LineFeatureSet = None) -> List[int]:
+    """
+    Get ids of the lines starting new paragraphs.
+    :param lines: lines of the document, see splitlines_with_spans()
+    :param doc_distribution: build_document_line_distribution() of the document text
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param features: line features shared with the other segmenters
+    :return: line ids, empty list if the model can't be applied to the features
+    """
+    feature_matrix, _ = build_paragraph_break_feature_matrix(lines, window_pre, window_post,
+                                                             include_doc=doc_distribution, features=features)
+    try:
+        predicted_lines = PARAGRAPH_SEGMENTER_MODEL.predict_proba(feature_matrix)
+    except ValueError as e:
+        if 'Number of features of the model must match the input' in str(e):
+            return []
+        raise e
+    return np.flatnonzero(predicted_lines[:, 1] >= score_threshold).tolist()
+
+
 RE_NEW_LINE = re.compile(r'(?P<line>[^\r\n]*)((\r\n)|(\n\r)|\n|\r)')
 
 
@@ -132,6 +174,24 @@ def _maybe_paragraph(pos0: int, pos1: Optional[int], text: str, line_spans: List
         return None
 
 
+def get_paragraph_spans_by_breaks(text: str, line_spans: List[Tuple[int, int]], paragraph_breaks: List[int]) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get spans of the paragraphs yielded by get_paragraphs() given the predicted paragraph breaks.
+    :param text: document text
+    :param line_spans: spans of the lines with their line breaks, see splitlines_with_spans()
+    :param paragraph_breaks: ids of the lines starting new paragraphs, see predict_paragraph_breaks()
+    :return: (start, end) spans of the paragraphs
+    """
+    if len(paragraph_breaks) == 0:
+        yield 0, len(text)
+        return
+    for pos0, pos1 in zip([0] + paragraph_breaks, paragraph_breaks + [None]):
+        start, end = line_spans[pos0][0], line_spans[pos1][0] if pos1 is not None else len(text)
+        if len(text[start:end].strip()) > 0:
+            yield start, end
+
+
 def get_paragraphs(text: str, window_pre=3, window_post=3,
                    score_threshold=0.5, return_spans: bool = False) -> Generator:
     """
@@ -140,48 +200,34 @@ def get_paragraphs(text: str, window_pre=3, window_post=3,
     # Get document character distribution
     doc_distribution = build_document_line_distribution(text)
     lines, line_spans = splitlines_with_spans(text)
-    feature_data = []
 
-    for line_id in range(len(lines)):
-        feature_data.append(
-            build_paragraph_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+    # Predict paragraph breaks
+    paragraph_breaks = predict_paragraph_breaks(lines, doc_distribution, window_pre, window_post, score_threshold)
 
-    # Predict page breaks
-    feature_df = pandas.DataFrame(feature_data).fillna(-1).astype(int)
-    try:
-        predicted_lines = PARAGRAPH_SEGMENTER_MODEL.predict_proba(feature_df)
-        predicted_df = pandas.DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
-        paragraph_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
+    if len(paragraph_breaks) > 0:
+        # Get first break
+        pos0 = 0
+        pos1 = paragraph_breaks[0]
 
-        if len(paragraph_breaks) > 0:
-            # Get first break
-            pos0 = 0
-            pos1 = paragraph_breaks[0]
+        maybe_paragraph = _maybe_paragraph(pos0, pos1, text, line_spans, return_spans)
+        if maybe_paragraph is not None:
+            yield maybe_paragraph
 
+        # Iterate through section breaks
+        for i in range(len(paragraph_breaks) - 1):
+            # Get breaks
+            pos0 = paragraph_breaks[i]
+            pos1 = paragraph_breaks[i + 1]
+            # Get text
             maybe_paragraph = _maybe_paragraph(pos0, pos1, text, line_spans, return_spans)
             if maybe_paragraph is not None:
                 yield maybe_paragraph
 
-            # Iterate through section breaks
-            for i in range(len(paragraph_breaks) - 1):
-                # Get breaks
-                pos0 = paragraph_breaks[i]
-                pos1 = paragraph_breaks[i + 1]
-                # Get text
-                maybe_paragraph = _maybe_paragraph(pos0, pos1, text, line_spans, return_spans)
-                if maybe_paragraph is not None:
-                    yield maybe_paragraph
-
-            # Yield final section
-            pos0 = paragraph_breaks[-1]
-            pos1 = None
-            maybe_paragraph = _maybe_paragraph(pos0, pos1, text, line_spans, return_spans)
-            if maybe_paragraph is not None:
-                yield maybe_paragraph
-        else:
-            yield text
-    except ValueError as e:
-        if 'Number of features of the model must match the input' in str(e):
-            yield text
-        else:
-            raise e
+        # Yield final section
+        pos0 = paragraph_breaks[-1]
+        pos1 = None
+        maybe_paragraph = _maybe_paragraph(pos0, pos1, text, line_spans, return_spans)
+        if maybe_paragraph is not None:
+            yield maybe_paragraph
+    else:
+        yield text
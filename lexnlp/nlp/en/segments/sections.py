@@ -10,16 +10,17 @@ Todo:
 # Imports
 import os
 import string
-import unicodedata
 
-from typing import Generator
+from typing import Generator, List, Tuple
 
 # Packages
-import pandas
+import numpy as np
 from sklearn.externals import joblib
 
 # Project imports
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, build_line_keyword_features, \
+    build_line_feature_matrix, get_line_category_counts, get_line_range_span, get_line_spans, normalize_line_breaks, \
+    LineFeatureSet
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -73,12 +74,8 @@ def build_section_break_features(lines, line_id, line_window_pre, line_window_po
         feature_vector["line_upper_case_{0}".format(i)] = line == line.upper()
 
         # Count characters
-        feature_vector["line_n_alpha_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("L")])
-        feature_vector["line_n_number_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("N")])
-        feature_vector["line_n_punct_{0}".format(i)] = sum([1 for c in line if unicodedata.category(c).startswith("P")])
-        feature_vector["line_n_whitespace_{0}".format(i)] = sum(
-            [1 for c in line if unicodedata.category(c).startswith("Z")])
+        for name, count in get_line_category_counts(line).items():
+            feature_vector["{0}_{1}".format(name, i)] = count
 
     # Simple checks
     line = lines[line_id]
@@ -106,49 +103,110 @@ def build_section_break_features(lines, line_id, line_window_pre, line_window_po
     return feature_vector
 
 
-def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+SECTION_KEYWORDS = ['section', 'SECTION', 'Section', 'article', 'ARTICLE', 'Article']
+
+
+def build_section_break_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                                       include_doc=None, features: LineFeatureSet = None) \
+        -> Tuple[np.ndarray, List[str]]:
     """
-    Get sections from text.
-    :param text:
+    Build feature matrix of all the lines: row i contains the values of
+    build_section_break_features(lines, i, ...) in the column order of the model.
+
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param features: line features shared with the other segmenters, calculated for the lines if None
+    :return: feature matrix and column names
+    """
+    features = features or LineFeatureSet(lines)
+    line_features = build_line_keyword_features(lines, SECTION_KEYWORDS)
+    stripped_lower = [line.strip().lower() for line in lines]
+    line_features['sw_section'] = np.array([s.startswith('section') for s in stripped_lower], dtype=np.float64)
+    line_features['sw_article'] = np.array([s.startswith('article') for s in stripped_lower], dtype=np.float64)
+    line_features.update(features.get_edge_features())
+    line_features.update(features.get_char_features(characters))
+    return build_line_feature_matrix(len(lines), line_window_pre, line_window_post,
+                                     features.get_base_features(), line_features, include_doc)
+
+
+def predict_section_breaks(lines, doc_distribution, window_pre=3, window_post=3, score_threshold=0.5,
+                           features: LineFeatureSet = None) -> List[int]:
+    """
+    Get ids of the lines starting new sections.
+    :param lines: lines of the document, text.splitlines()
+    :param doc_distribution: build_document_line_distribution() of the document text
     :param window_pre:
     :param window_post:
     :param score_threshold:
-    :return:
+    :param features: line features shared with the other segmenters
+    :return: line ids
     """
+    feature_matrix, _ = build_section_break_feature_matrix(lines, window_pre, window_post,
+                                                           include_doc=doc_distribution, features=features)
+    predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(feature_matrix)
+    return np.flatnonzero(predicted_lines[:, 1] >= score_threshold).tolist()
 
-    # Get document character distribution
-    doc_distribution = build_document_line_distribution(text)
-    lines = text.splitlines()
-    test_feature_data = []
-    for line_id in range(len(lines)):
-        test_feature_data.append(
-            build_section_break_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
-
-    # Predict page breaks
-    test_feature_df = pandas.DataFrame(test_feature_data).fillna(-1)
-    test_predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(test_feature_df)
-    predicted_df = pandas.DataFrame(test_predicted_lines, columns=["prob_false", "prob_true"])
-    section_breaks = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
 
+def get_section_spans_by_breaks(text: str, line_spans: List[Tuple[int, int]], section_breaks: List[int]) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get section spans given the predicted section breaks.
+    :param text: document text
+    :param line_spans: spans of the lines of the text, see get_line_spans()
+    :param section_breaks: ids of the lines starting new sections, see predict_section_breaks()
+    :return: (start, end) spans of the non-empty sections
+    """
     if len(section_breaks) > 0:
-        # Get first break
-        pos0 = 0
-        pos1 = section_breaks[0]
-        section = "\n".join(lines[pos0:pos1])
-        if len(section.strip()) > 0:
-            yield section
+        # Get first section
+        start, end = get_line_range_span(text, line_spans, 0, section_breaks[0])
+        if len(text[start:end].strip()) > 0:
+            yield start, end
 
         # Iterate through section breaks
         for i in range(len(section_breaks) - 1):
-            # Get breaks
-            pos0 = section_breaks[i]
-            pos1 = section_breaks[i + 1]
-            # Get text
-            section = "\n".join(lines[pos0:pos1])
-            if len(section.strip()) > 0:
-                yield section
+            start, end = get_line_range_span(text, line_spans, section_breaks[i], section_breaks[i + 1])
+            if len(text[start:end].strip()) > 0:
+                yield start, end
 
         # Yield final section
-        section = "\n".join(lines[section_breaks[-1]:])
-        if len(section.strip()) > 0:
-            yield section
+        start, end = get_line_range_span(text, line_spans, section_breaks[-1])
+        if len(text[start:end].strip()) > 0:
+            yield start, end
+
+
+def get_section_spans(text, window_pre=3, window_post=3, score_threshold=0.5) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) spans of the sections in text. The spans select the sections yielded by get_sections()
+    except for the line breaks: text[start:end] keeps the original line breaks of the text.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :return:
+    """
+
+    # Get document character distribution
+    doc_distribution = build_document_line_distribution(text)
+    line_spans = get_line_spans(text)
+    lines = [text[start:end] for start, end in line_spans]
+
+    # Predict section breaks
+    section_breaks = predict_section_breaks(lines, doc_distribution, window_pre, window_post, score_threshold)
+    yield from get_section_spans_by_breaks(text, line_spans, section_breaks)
+
+
+def get_sections(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
+    """
+    Get sections from text.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :return:
+    """
+    for start, end in get_section_spans(text, window_pre, window_post, score_threshold):
+        yield normalize_line_breaks(text[start:end])
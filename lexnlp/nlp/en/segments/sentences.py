@@ -12,7 +12,7 @@ Todo:
 # Imports
 import os
 import re
-from typing import Tuple, List, Generator, Any, Union
+from typing import Tuple, List, Generator, Any, Iterable, TextIO, Union
 
 # Packages
 from nltk.tokenize.punkt import PunktTrainer, PunktSentenceTokenizer
@@ -151,6 +151,61 @@ def get_sentence_span_list(text) -> List[Tuple[int, int, str]]:
     return list(get_sentence_span(text))
 
 
+def get_sentence_span_stream(source: Union[Iterable[str], TextIO],
+                             read_size: int = 65536,
+                             max_buffer_size: int = 4194304) -> Generator[Tuple[int, int], Any, Any]:
+    """
+    Given a stream of text chunks or a file-like object, generates (start, end) spans of sentences
+    in the whole text - the same spans as get_sentence_span() for the concatenated text.
+
+    Only the text starting from the last two sentences found so far is kept in memory:
+    the boundaries around them may change with the next chunks, the sentences before them are final.
+    Sentences longer than max_buffer_size are split to keep the memory bounded.
+    :param source: iterable of text chunks or file-like object opened in text mode
+    :param read_size: min number of chars read from the source before the next tokenization
+    :param max_buffer_size: max number of chars kept between the tokenizations
+    :return: (start, end) spans, offsets are counted from the start of the stream
+    """
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(read_size), '')
+    else:
+        chunks = source
+
+    buffer = ''
+    # offset of the buffer in the stream
+    buffer_start = 0
+    new_chunks = []  # type: List[str]
+    new_size = 0
+    for chunk in chunks:
+        new_chunks.append(chunk)
+        new_size += len(chunk)
+        if new_size < read_size:
+            continue
+        buffer = ''.join([buffer] + new_chunks)
+        new_chunks = []
+        new_size = 0
+
+        spans = list(SENTENCE_SEGMENTER_MODEL.span_tokenize(buffer))
+        if len(spans) > 2:
+            keep_start = spans[-2][0]
+        elif len(buffer) > max_buffer_size:
+            keep_start = spans[-1][0] if len(spans) > 1 else len(buffer)
+        else:
+            continue
+
+        for span in spans:
+            if span[0] >= keep_start:
+                break
+            for start, end in post_process_sentence(buffer, (span[0], min(span[1], keep_start))):
+                yield buffer_start + start, buffer_start + end
+        buffer = buffer[keep_start:]
+        buffer_start += keep_start
+
+    buffer = ''.join([buffer] + new_chunks)
+    for start, end in get_sentence_span(buffer):
+        yield buffer_start + start, buffer_start + end
+
+
 def build_sentence_model(text, extra_abbrevs=None):
     """
     Build a sentence model from text with optional
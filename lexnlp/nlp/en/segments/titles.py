@@ -7,17 +7,19 @@ machine learning classifiers.
 # Imports
 import os
 import string
-from typing import Generator
+from typing import Generator, Iterable, List, Tuple
 
 # Packages
+import numpy as np
 import pandas
 import sklearn.ensemble
 from sklearn.externals import joblib
 
 # Project
-from lexnlp.nlp.en.segments.utils import build_document_line_distribution
+from lexnlp.nlp.en.segments.utils import build_document_line_distribution, build_line_keyword_features, \
+    build_line_feature_matrix, get_line_category_counts, get_line_spans, get_lookup_top_category, strip_span, \
+    LineFeatureSet
 from lexnlp.utils.decorators import safe_failure
-from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -71,22 +73,9 @@ def build_title_features(lines, line_id, line_window_pre, line_window_post, char
         feature_vector["line_title_case_" + index_str] = line == line.title()
         feature_vector["line_upper_case_" + index_str] = line.isupper()
 
-        alpha_count, number_count, punct_count, whitespace_count = 0, 0, 0, 0
-        for c in line:
-            if UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'L':
-                alpha_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'Z':
-                whitespace_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'N':
-                number_count += 1
-            elif UNICODE_CHAR_TOP_CATEGORY_MAPPING[c] == 'P':
-                punct_count += 1
-
         # Count characters
-        feature_vector["line_n_alpha_" + index_str] = alpha_count
-        feature_vector["line_n_number_" + index_str] = number_count
-        feature_vector["line_n_punct_" + index_str] = punct_count
-        feature_vector["line_n_whitespace_" + index_str] = whitespace_count
+        for name, count in get_line_category_counts(line, get_lookup_top_category).items():
+            feature_vector[name + "_" + index_str] = count
 
     # Simple checks
     line = lines[line_id]
@@ -122,22 +111,73 @@ def build_title_features(lines, line_id, line_window_pre, line_window_post, char
     return feature_vector
 
 
-def build_document_title_features(text, window_pre=3, window_post=3):
+TITLE_KEYWORDS = ['agreement', 'Agreement', 'AGREEMENT', 'contract', 'Contract', 'CONTRACT',
+                  'amendment', 'Amendment', 'AMENDMENT']
+
+
+def build_title_feature_matrix(lines, line_window_pre, line_window_post, characters=string.printable,
+                               include_doc=None, as_int=True,
+                               features: LineFeatureSet = None) -> Tuple[np.ndarray, List[str]]:
     """
-    Get a document title given file text.
+    Build feature matrix of all the lines: row i contains the values of
+    build_title_features(lines, i, ...) in the column order of the model.
+
+    :param lines:
+    :param line_window_pre:
+    :param line_window_post:
+    :param characters:
+    :param include_doc:
+    :param as_int:
+    :param features: line features shared with the other segmenters, calculated for the lines if None
+    :return: feature matrix and column names
+    """
+    features = features or LineFeatureSet(lines)
+    window_features = features.get_base_features(top_category_func=get_lookup_top_category,
+                                                 upper_case_func=str.isupper)
+    line_features = build_line_keyword_features(lines, TITLE_KEYWORDS)
+    stripped_lower = [line.strip().lower() for line in lines]
+    line_features['ew_agreement'] = np.array([s.endswith('agreement') for s in stripped_lower], dtype=np.float64)
+    line_features['sw_amendment'] = np.array([s.startswith('amendment') for s in stripped_lower], dtype=np.float64)
+    line_features.update(features.get_char_features(characters))
+    return build_line_feature_matrix(len(lines), line_window_pre, line_window_post,
+                                     window_features, line_features, include_doc, as_int)
+
+
+def predict_title_lines(lines, doc_distribution, window_pre=3, window_post=3, score_threshold=0.5,
+                        features: LineFeatureSet = None) -> List[int]:
+    """
+    Get ids of the title lines.
+    :param lines: lines of the document, text.splitlines()
+    :param doc_distribution: build_document_line_distribution() of the document text
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :param features: line features shared with the other segmenters
+    :return: line ids
+    """
+    feature_matrix, _ = build_title_feature_matrix(lines, window_pre, window_post,
+                                                   include_doc=doc_distribution, features=features)
+    predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(feature_matrix)
+    return np.flatnonzero(predicted_lines[:, 1] >= score_threshold).tolist()
+
+
+def build_document_title_feature_matrix(text, window_pre=3, window_post=3) -> Tuple[np.ndarray, List[str]]:
+    """
+    Get title feature matrix and its column names given file text.
     """
     # Get document character distribution
     doc_distribution = build_document_line_distribution(text)
+    return build_title_feature_matrix(text.splitlines(), window_pre, window_post, include_doc=doc_distribution)
 
-    # Parse all lines
-    lines = text.splitlines()
-    feature_data = []
 
-    for line_id in range(len(lines)):
-        feature_data.append(build_title_features(lines, line_id, window_pre, window_post, include_doc=doc_distribution))
+def build_document_title_features(text, window_pre=3, window_post=3):
+    """
+    Get a document title given file text.
+    """
+    feature_matrix, columns = build_document_title_feature_matrix(text, window_pre, window_post)
 
     # Get feature DF
-    feature_df = pandas.DataFrame(feature_data).fillna(-1).astype(int)
+    feature_df = pandas.DataFrame(feature_matrix, columns=columns).astype(int)
     return feature_df
 
 
@@ -205,6 +245,67 @@ def build_model(training_file_path):
     joblib.dump(model, "title_locator.pickle")
 
 
+def get_title_line_groups(lines: Iterable[str], title_lines: List[int]) -> Generator[List[int], None, None]:
+    """
+    Group the title lines: consecutive title lines - possibly separated by empty lines - make one title.
+    :param lines: lines of the document
+    :param title_lines: ids of the title lines, see predict_title_lines()
+    :return: title line ids of each title
+    """
+    title_line_set = set(title_lines)
+    group = []  # type: List[int]
+    for i, line in enumerate(lines):
+        if i in title_line_set:
+            group.append(i)
+        elif len(line.strip()) == 0:
+            continue
+        elif len(group) > 0:
+            yield group
+            group = []
+
+    if len(group) > 0:
+        yield group
+
+
+def get_title_spans_by_lines(text: str, line_spans: List[Tuple[int, int]], title_lines: List[int]) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get title spans given the predicted title lines.
+    :param text: document text
+    :param line_spans: spans of the lines of the text, see get_line_spans()
+    :param title_lines: ids of the title lines, see predict_title_lines()
+    :return: (start, end) spans from the first to the last line of each non-empty title
+    """
+    lines = (text[start:end] for start, end in line_spans)
+    for group in get_title_line_groups(lines, title_lines):
+        start, end = strip_span(text, (line_spans[group[0]][0], line_spans[group[-1]][1]))
+        if end > start:
+            yield start, end
+
+
+@safe_failure
+def get_title_spans(text, window_pre=3, window_post=3, score_threshold=0.5) \
+        -> Generator[Tuple[int, int], None, None]:
+    """
+    Get (start, end) spans of the titles in text. A span covers all the lines of the title
+    which get_titles() joins with spaces, empty titles are skipped.
+    :param text:
+    :param window_pre:
+    :param window_post:
+    :param score_threshold:
+    :return:
+    """
+
+    # Get document character distribution
+    doc_distribution = build_document_line_distribution(text)
+    line_spans = get_line_spans(text)
+    lines = [text[start:end] for start, end in line_spans]
+
+    # Predict title lines
+    title_lines = predict_title_lines(lines, doc_distribution, window_pre, window_post, score_threshold)
+    yield from get_title_spans_by_lines(text, line_spans, title_lines)
+
+
 @safe_failure
 def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5) -> Generator:
     """
@@ -216,30 +317,12 @@ def get_titles(text, window_pre=3, window_post=3, score_threshold=0.5) -> Genera
     :return:
     """
 
-    # Get features and target for model
-    feature_data = build_document_title_features(text, window_pre, window_post)
+    # Get document character distribution
+    doc_distribution = build_document_line_distribution(text)
+    lines = text.splitlines()
 
     # Predict title lines
-    predicted_lines = SECTION_SEGMENTER_MODEL.predict_proba(feature_data)
-    predicted_df = pandas.DataFrame(predicted_lines, columns=["prob_false", "prob_true"])
-    title_lines = predicted_df.loc[predicted_df["prob_true"] >= score_threshold, :].index.tolist()
-
-    # Check if results
-    if len(title_lines) > 0:
-        # Get lines
-        lines = text.splitlines()
-
-        # Iterate through lines
-        title = ""
-        for i in range(len(lines)):
-            if i in title_lines:
-                title += lines[i] + " "
-            elif len(lines[i].strip()) == 0:
-                continue
-            else:
-                if len(title) > 0:
-                    yield title.strip()
-                    title = ""
-
-        if len(title) > 0:
-            yield title.strip()
+    title_lines = predict_title_lines(lines, doc_distribution, window_pre, window_post, score_threshold)
+
+    for group in get_title_line_groups(lines, title_lines):
+        yield " ".join(lines[i] for i in group).strip()
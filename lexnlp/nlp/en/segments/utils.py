@@ -7,7 +7,17 @@ Todo:
 """
 
 # Imports
+import re
 import string
+import sys
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lexnlp.utils.unicode.unicode_lookup import UNICODE_CHAR_TOP_CATEGORY_MAPPING
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -82,3 +92,347 @@ def build_document_line_distribution(text, characters=string.printable, norm=Tru
                 feature_vector[character] = feature_vector[character] / total_startchar
 
     return feature_vector
+
+
+# Window features are calculated for the line and for the lines around it:
+# "line_len_-1" is the length of the previous line, "line_len_0" is the length of the line itself
+LINE_WINDOW_FEATURES = ['line_len', 'line_lenstrip', 'line_title_case', 'line_upper_case',
+                        'line_n_alpha', 'line_n_number', 'line_n_punct', 'line_n_whitespace']
+
+# Unicode top category -> line_n_... feature
+LINE_CATEGORY_FEATURES = {'L': 'line_n_alpha', 'N': 'line_n_number', 'P': 'line_n_punct', 'Z': 'line_n_whitespace'}
+
+# Unicode top category -> its code in the category lookup tables
+TOP_CATEGORY_CODES = {'C': 1, 'L': 2, 'M': 3, 'N': 4, 'P': 5, 'S': 6, 'Z': 7}
+# code of the chars missing in the lookup table
+UNKNOWN_CATEGORY_CODE = 0
+
+# value of the window features of the lines outside of the window (missing values of the feature DataFrame)
+MISSING_FEATURE_VALUE = -1
+
+
+# str.splitlines() line boundaries
+LINE_BREAK_RE = re.compile('\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def get_unicode_top_category(c: str) -> str:
+    return unicodedata.category(c)[0]
+
+
+def is_upper_case_line(line: str) -> bool:
+    return line == line.upper()
+
+
+def get_lookup_top_category(c: str) -> str:
+    return UNICODE_CHAR_TOP_CATEGORY_MAPPING[c]
+
+
+@lru_cache(maxsize=None)
+def get_unicode_top_category_table() -> np.ndarray:
+    """
+    Build lookup table of get_unicode_top_category(): code point -> TOP_CATEGORY_CODES value.
+    """
+    return np.array([TOP_CATEGORY_CODES[unicodedata.category(chr(code_point))[0]]
+                     for code_point in range(sys.maxunicode + 1)], dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def get_lookup_top_category_table() -> np.ndarray:
+    """
+    Build lookup table of get_lookup_top_category(): code point -> TOP_CATEGORY_CODES value,
+    UNKNOWN_CATEGORY_CODE for the chars missing in UNICODE_CHAR_TOP_CATEGORY_MAPPING.
+    """
+    table = np.full(sys.maxunicode + 1, UNKNOWN_CATEGORY_CODE, dtype=np.uint8)
+    code_points = np.fromiter((ord(c) for c in UNICODE_CHAR_TOP_CATEGORY_MAPPING), dtype=np.int64)
+    table[code_points] = [TOP_CATEGORY_CODES[category] for category in UNICODE_CHAR_TOP_CATEGORY_MAPPING.values()]
+    return table
+
+
+# char -> top category function: its lookup table builder
+TOP_CATEGORY_TABLES = {
+    get_unicode_top_category: get_unicode_top_category_table,
+    get_lookup_top_category: get_lookup_top_category_table,
+}  # type: Dict[Callable[[str], str], Callable[[], np.ndarray]]
+
+
+def get_top_category_codes(text: str, table: np.ndarray) -> np.ndarray:
+    """
+    Map all the chars of the text to their unicode top category codes at once.
+    :param text: text
+    :param table: lookup table, e.g. get_unicode_top_category_table()
+    :return: (len(text),) array of TOP_CATEGORY_CODES values
+    """
+    code_points = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype='<u4')
+    codes = table[code_points]
+    if not codes.all():
+        raise KeyError(text[int(np.argmin(codes))])
+    return codes
+
+
+def get_line_category_counts(line: str, top_category_func: Callable[[str], str] = get_unicode_top_category) \
+        -> Dict[str, int]:
+    """
+    Count letters, numbers, punctuation and whitespace of the line.
+    :param line: line
+    :param top_category_func: get_unicode_top_category or get_lookup_top_category
+    :return: line_n_alpha, line_n_number, line_n_punct and line_n_whitespace values
+    """
+    counts = np.bincount(get_top_category_codes(line, TOP_CATEGORY_TABLES[top_category_func]()),
+                         minlength=len(TOP_CATEGORY_CODES) + 1)
+    return {name: int(counts[TOP_CATEGORY_CODES[category]]) for category, name in LINE_CATEGORY_FEATURES.items()}
+
+
+def get_line_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Get (start, end) spans of text.splitlines() lines.
+    :param text: text
+    :return: spans without the line breaks
+    """
+    spans = []  # type: List[Tuple[int, int]]
+    start = 0
+    for match in LINE_BREAK_RE.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    if start < len(text):
+        spans.append((start, len(text)))
+    return spans
+
+
+def get_line_range_span(text: str, line_spans: List[Tuple[int, int]], pos0: int, pos1: int = None) -> Tuple[int, int]:
+    """
+    :param text: document text
+    :param line_spans: spans of the lines, see get_line_spans()
+    :param pos0: first line id
+    :param pos1: line id after the last line, end of the text if None
+    :return: span from the start of the first line to the end of the last line
+    """
+    pos1 = len(line_spans) if pos1 is None else pos1
+    if pos1 <= pos0:
+        start = line_spans[pos0][0] if pos0 < len(line_spans) else len(text)
+        return start, start
+    return line_spans[pos0][0], line_spans[pos1 - 1][1]
+
+
+def strip_span(text: str, span: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    :return: span without leading and trailing whitespace
+    """
+    start, end = span
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def normalize_line_breaks(text: str) -> str:
+    """
+    :return: text with the lines joined by \\n
+    """
+    return LINE_BREAK_RE.sub('\n', text)
+
+
+class LineFeatureSet:
+    """
+    Lines of a document and their features calculated once and shared by the segmentation models.
+    """
+
+    def __init__(self, lines: List[str]):
+        self.lines = lines
+        self.features = {}  # type: Dict[Any, Dict[str, np.ndarray]]
+
+    def get_features(self, key: Any, build_func: Callable[[], Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        features = self.features.get(key)
+        if features is None:
+            features = build_func()
+            self.features[key] = features
+        return dict(features)
+
+    def get_base_features(self,
+                          names: List[str] = None,
+                          top_category_func: Callable[[str], str] = get_unicode_top_category,
+                          upper_case_func: Callable[[str], bool] = is_upper_case_line) -> Dict[str, np.ndarray]:
+        """
+        :param names: subset of LINE_WINDOW_FEATURES, all the features if None
+        :param top_category_func: char -> unicode top category ("L", "N", "P", "Z"...)
+        :param upper_case_func: line -> line_upper_case feature value
+        :return: feature name -> (len(lines),) array of the feature values
+        """
+        features = self.get_features(('base', upper_case_func),
+                                     lambda: build_line_shape_features(self.lines, upper_case_func))
+        features.update(self.get_features(('categories', top_category_func),
+                                          lambda: build_line_category_features(self.lines, top_category_func)))
+        return {name: features[name] for name in names or LINE_WINDOW_FEATURES}
+
+    def get_edge_features(self) -> Dict[str, np.ndarray]:
+        return self.get_features('edge', lambda: build_line_edge_features(self.lines))
+
+    def get_char_features(self, characters=string.printable) -> Dict[str, np.ndarray]:
+        return self.get_features(('chars', characters), lambda: build_line_char_features(self.lines, characters))
+
+
+def build_line_shape_features(lines: List[str],
+                              upper_case_func: Callable[[str], bool] = is_upper_case_line) -> Dict[str, np.ndarray]:
+    """
+    :param lines: document lines
+    :param upper_case_func: line -> line_upper_case feature value
+    :return: line_len, line_lenstrip, line_title_case and line_upper_case features
+    """
+    return {
+        'line_len': np.array([len(line) for line in lines], dtype=np.float64),
+        'line_lenstrip': np.array([len(line.strip()) for line in lines], dtype=np.float64),
+        'line_title_case': np.array([line == line.title() for line in lines], dtype=np.float64),
+        'line_upper_case': np.array([upper_case_func(line) for line in lines], dtype=np.float64),
+    }
+
+
+def build_line_category_features(lines: List[str],
+                                 top_category_func: Callable[[str], str] = get_unicode_top_category) \
+        -> Dict[str, np.ndarray]:
+    """
+    Count letters, numbers, punctuation and whitespace of each line. The chars of all the lines are mapped
+    to their categories at once via the lookup table of top_category_func (see TOP_CATEGORY_TABLES)
+    and the counts of each line are taken from the prefix sums of the category flags.
+    :param lines: document lines
+    :param top_category_func: char -> unicode top category ("L", "N", "P", "Z"...)
+    :return: line_n_alpha, line_n_number, line_n_punct and line_n_whitespace features
+    """
+    if top_category_func not in TOP_CATEGORY_TABLES:
+        counts = np.zeros((len(LINE_CATEGORY_FEATURES), len(lines)), dtype=np.float64)
+        for line_id, line in enumerate(lines):
+            line_categories = Counter(top_category_func(c) for c in line)
+            for i, category in enumerate(LINE_CATEGORY_FEATURES):
+                counts[i, line_id] = line_categories.get(category, 0)
+        return {name: counts[i] for i, name in enumerate(LINE_CATEGORY_FEATURES.values())}
+
+    codes = get_top_category_codes(''.join(lines), TOP_CATEGORY_TABLES[top_category_func]())
+    line_lens = np.array([len(line) for line in lines], dtype=np.int64)
+    line_ends = np.cumsum(line_lens)
+    line_starts = line_ends - line_lens
+    features = {}  # type: Dict[str, np.ndarray]
+    for category, name in LINE_CATEGORY_FEATURES.items():
+        prefix_sums = np.concatenate([[0], np.cumsum(codes == TOP_CATEGORY_CODES[category])])
+        features[name] = (prefix_sums[line_ends] - prefix_sums[line_starts]).astype(np.float64)
+    return features
+
+
+def build_line_base_features(lines: List[str],
+                             names: List[str] = None,
+                             top_category_func: Callable[[str], str] = get_unicode_top_category,
+                             upper_case_func: Callable[[str], bool] = is_upper_case_line) \
+        -> Dict[str, np.ndarray]:
+    """
+    Calculate window features (LINE_WINDOW_FEATURES) of each line once.
+    :param lines: document lines
+    :param names: subset of LINE_WINDOW_FEATURES, all the features if None
+    :param top_category_func: char -> unicode top category ("L", "N", "P", "Z"...)
+    :param upper_case_func: line -> line_upper_case feature value
+    :return: feature name -> (len(lines),) array of the feature values
+    """
+    return LineFeatureSet(lines).get_base_features(names, top_category_func, upper_case_func)
+
+
+def build_line_edge_features(lines: List[str]) -> Dict[str, np.ndarray]:
+    """
+    :param lines: document lines
+    :return: first/last char of the stripped line is punctuation/digit features
+    """
+    stripped = [line.strip() for line in lines]
+    return {
+        'first_char_punct': np.array([bool(s) and s[0] in string.punctuation for s in stripped], dtype=np.float64),
+        'last_char_punct': np.array([bool(s) and s[-1] in string.punctuation for s in stripped], dtype=np.float64),
+        'first_char_number': np.array([bool(s) and s[0] in string.digits for s in stripped], dtype=np.float64),
+        'last_char_number': np.array([bool(s) and s[-1] in string.digits for s in stripped], dtype=np.float64),
+    }
+
+
+def build_line_keyword_features(lines: List[str], keywords: List[str]) -> Dict[str, np.ndarray]:
+    """
+    :param lines: document lines
+    :param keywords: case-sensitive keywords
+    :return: keyword -> (len(lines),) array, 1 if the line contains the keyword
+    """
+    return {keyword: np.array([keyword in line for line in lines], dtype=np.float64) for keyword in keywords}
+
+
+def build_line_char_features(lines: List[str], characters=string.printable) -> Dict[str, np.ndarray]:
+    """
+    :param lines: document lines
+    :param characters: counted characters
+    :return: "char_{c}" -> (len(lines),) array of the character counts
+    """
+    counts = np.zeros((len(characters), len(lines)), dtype=np.float64)
+    char_index = {c: i for i, c in enumerate(characters)}
+    for line_id, line in enumerate(lines):
+        for c, count in Counter(line).items():
+            i = char_index.get(c)
+            if i is not None:
+                counts[i, line_id] = count
+    return {'char_{0}'.format(c): counts[i] for i, c in enumerate(characters)}
+
+
+def get_line_window_mask(line_count: int, line_window_pre: int, line_window_post: int) -> Dict[int, np.ndarray]:
+    """
+    Get the lines having window features for each offset in the window. The window of a line
+    is limited in the same way as in build_..._features(lines, line_id, ...) functions.
+    :param line_count: number of lines
+    :param line_window_pre: number of lines before the line
+    :param line_window_post: number of lines after the line
+    :return: offset -> (line_count,) bool array, only the offsets present for some line are returned
+    """
+    line_ids = np.arange(line_count)
+    pre = np.minimum(line_window_pre, line_ids)
+    post = np.where(line_ids + line_window_post >= line_count, line_count - line_window_post - 1, line_window_post)
+    masks = {}  # type: Dict[int, np.ndarray]
+    for offset in range(-line_window_pre, line_window_post + 1):
+        mask = (offset >= -pre) & (offset <= post) & (line_ids + offset < line_count)
+        if mask.any():
+            masks[offset] = mask
+    return masks
+
+
+def build_line_feature_matrix(line_count: int,
+                              line_window_pre: int,
+                              line_window_post: int,
+                              window_features: Dict[str, np.ndarray],
+                              line_features: Dict[str, np.ndarray],
+                              doc_features: Optional[Dict[str, float]] = None,
+                              as_int: bool = False) -> Tuple[np.ndarray, List[str]]:
+    """
+    Build (line_count, n_features) feature matrix for the segmentation models.
+    The matrix is the same as pandas.DataFrame(list of build_..._features() dicts).fillna(-1):
+    columns are sorted by name - in the order the models were trained with, window features
+    of the lines outside the window are -1, document features are broadcast to all the lines.
+    :param line_count: number of lines
+    :param line_window_pre: number of lines before the line
+    :param line_window_post: number of lines after the line
+    :param window_features: feature name -> (line_count,) values, see build_line_base_features()
+    :param line_features: feature name -> (line_count,) values of the features of the line only
+    :param doc_features: document features, e.g. build_document_line_distribution()
+    :param as_int: truncate the values to integers like DataFrame.astype(int)
+    :return: feature matrix and column names
+    """
+    columns = {}  # type: Dict[str, Tuple[np.ndarray, Optional[int], Optional[np.ndarray]]]
+    for offset, mask in get_line_window_mask(line_count, line_window_pre, line_window_post).items():
+        for name, values in window_features.items():
+            columns['{0}_{1}'.format(name, offset)] = (values, offset, mask)
+    for name, values in line_features.items():
+        columns[name] = (values, None, None)
+    doc_features = doc_features or {}
+
+    names = sorted(set(columns) | set(doc_features))
+    matrix = np.empty((line_count, len(names)), dtype=np.float64)
+    for column, name in enumerate(names):
+        if name in doc_features:
+            matrix[:, column] = doc_features[name]
+            continue
+        values, offset, mask = columns[name]
+        if offset is None:
+            matrix[:, column] = values
+        else:
+            matrix[:, column] = MISSING_FEATURE_VALUE
+            line_ids = np.nonzero(mask)[0]
+            matrix[line_ids, column] = values[line_ids + offset]
+    if as_int:
+        matrix = np.trunc(matrix)
+    return matrix, names
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+# Imports
+from nose.tools import assert_equal
+
+from lexnlp.extract.en.conditions import get_conditions
+from lexnlp.extract.en.definitions import get_definitions
+from lexnlp.nlp.en.document import Document, as_document
+from lexnlp.nlp.en.segments.sentences import get_sentence_list, get_sentence__with_coords_list
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+TEXT = 'This Agreement (the "Agreement") is made on January 1, 2019.\n\n' \
+       'The payment is due unless otherwise agreed. "Buyer" shall mean Acme, Inc.'
+
+
+def test_document_sentences():
+    document = Document(TEXT)
+    assert_equal(TEXT, document)
+    assert_equal(TEXT, document.text)
+    assert_equal(get_sentence_list(TEXT), document.sentences)
+    assert_equal(get_sentence__with_coords_list(TEXT), document.sentences_with_coords)
+    assert document.sentences is document.sentences
+    assert as_document(document) is document
+    assert_equal(len(document.sentences), len(document.sentence_tokens))
+
+
+def test_document_extractors():
+    document = Document(TEXT)
+    assert_equal(list(get_definitions(TEXT)), list(get_definitions(document)))
+    assert_equal(list(get_conditions(TEXT)), list(get_conditions(document)))
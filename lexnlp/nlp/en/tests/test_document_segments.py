@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""Document segmentation unit tests for English.
+
+This module implements unit tests for segment_document() - pages, sections, paragraphs,
+titles and sentences calculated at once.
+
+Todo:
+"""
+
+# Imports
+import codecs
+import os
+
+from nose.tools import assert_equal, assert_raises, assert_true
+
+from lexnlp import get_module_path
+from lexnlp.nlp.en.segments import document_segments
+from lexnlp.nlp.en.segments.document_segments import segment_document
+from lexnlp.nlp.en.segments.pages import get_pages
+from lexnlp.nlp.en.segments.paragraphs import get_paragraphs
+from lexnlp.nlp.en.segments.sections import get_sections
+from lexnlp.nlp.en.segments.sentences import get_sentence_span_list
+from lexnlp.nlp.en.segments.titles import get_titles
+from lexnlp.nlp.en.segments.utils import normalize_line_breaks
+
+__author__ = "ContraxSuite, LLC; LexPredict, LLC"
+__copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
+__license__ = "https://github.com/LexPredict/lexpredict-lexnlp/blob/master/LICENSE"
+__version__ = "0.2.6"
+__maintainer__ = "LexPredict, LLC"
+__email__ = "support@contraxsuite.com"
+
+
+def read_sample_file():
+    base_path = get_module_path()
+    with codecs.open(os.path.join(base_path, "../test_data", "1582586_2015-08-31"), encoding='utf8') as file_handle:
+        return file_handle.read()
+
+
+def test_segment_document():
+    text = read_sample_file()
+    segments = segment_document(text)
+    assert_equal(sorted(segments), ['pages', 'paragraphs', 'sections', 'sentences', 'titles'])
+
+    assert_equal([normalize_line_breaks(text[start:end]) for start, end in segments['pages']],
+                 list(get_pages(text)))
+    assert_equal([normalize_line_breaks(text[start:end]) for start, end in segments['sections']],
+                 list(get_sections(text)))
+    assert_equal([text[start:end] for start, end in segments['paragraphs']],
+                 list(get_paragraphs(text)))
+    assert_equal([' '.join(text[start:end].split()) for start, end in segments['titles']],
+                 [' '.join(title.split()) for title in get_titles(text) if title])
+    assert_equal(segments['sentences'], get_sentence_span_list(text))
+
+
+def test_segment_document_want():
+    text = read_sample_file()
+    segments = segment_document(text, want={'sections', 'titles'})
+    assert_equal(sorted(segments), ['sections', 'titles'])
+    assert_true(len(segments['sections']) > 0)
+    assert_raises(KeyError, segment_document, text, want={'chapters'})
+
+
+def test_segment_empty_document():
+    assert_equal(segment_document(' \n \n', want={'pages', 'sections', 'paragraphs', 'titles'}),
+                 {'pages': [], 'sections': [], 'paragraphs': [], 'titles': []})
+
+
+def test_segment_document_title_failure():
+    def fail(*args, **kwargs):
+        raise ValueError('Number of features does not match the model')
+
+    text = read_sample_file()
+    predict_title_lines = document_segments.predict_title_lines
+    document_segments.predict_title_lines = fail
+    try:
+        segments = segment_document(text, want={'sections', 'titles'})
+    finally:
+        document_segments.predict_title_lines = predict_title_lines
+    assert_equal([], segments['titles'])
+    assert_true(len(segments['sections']) > 0)
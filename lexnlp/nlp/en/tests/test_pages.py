@@ -2,7 +2,8 @@
 # -*- coding: UTF-8 -*-
 
 # Imports
-from lexnlp.nlp.en.segments.pages import get_pages
+from lexnlp.nlp.en.segments.pages import get_pages, get_page_spans
+from lexnlp.nlp.en.segments.utils import normalize_line_breaks
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -24,3 +25,7 @@ def test_page_examples():
         clean_result = [remove_whitespace(p) for p in expected]
         for page in page_list:
             assert remove_whitespace(page) in clean_result
+
+        # Spans select the same pages keeping the original line breaks
+        page_spans = list(get_page_spans(text))
+        assert [normalize_line_breaks(text[start:end]) for start, end in page_spans] == page_list
@@ -3,13 +3,18 @@
 
 # Imports
 import string
+import unicodedata
 
 # Test imports
+import numpy
+import pandas
 from nose.tools import assert_dict_equal, nottest, assert_list_equal
 
 # Project imports
-from lexnlp.nlp.en.segments.paragraphs import get_paragraphs, splitlines_with_spans
-from lexnlp.nlp.en.segments.utils import build_document_distribution
+from lexnlp.nlp.en.segments.paragraphs import get_paragraphs, splitlines_with_spans, \
+    build_paragraph_break_features, build_paragraph_break_feature_matrix
+from lexnlp.nlp.en.segments.utils import build_document_distribution, build_document_line_distribution, \
+    build_line_category_features, get_line_category_counts
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -177,3 +182,28 @@ def run_paragraph_test(text, expected_paragraphs, window_pre=3, window_post=3):
 def test_paragraph_examples():
     for (_i, text, _input_args, expected) in lexnlp_tests.iter_test_data_text_and_tuple():
         run_paragraph_test(text, expected)
+
+
+def test_paragraph_break_feature_matrix():
+    text = 'SECTION 1.\n\nThis Agreement is made by\nand between (the "Parties").\n\nPage 1 of 2'
+    lines = text.splitlines()
+    doc_distribution = build_document_line_distribution(text)
+    feature_df = pandas.DataFrame([build_paragraph_break_features(lines, i, 3, 3, include_doc=doc_distribution)
+                                   for i in range(len(lines))]).fillna(-1).astype(int)
+    feature_df = feature_df[sorted(feature_df.columns)]
+
+    feature_matrix, columns = build_paragraph_break_feature_matrix(lines, 3, 3, include_doc=doc_distribution)
+    assert_list_equal(list(feature_df.columns), columns)
+    assert numpy.array_equal(feature_df.values, feature_matrix)
+
+
+def test_line_category_counts():
+    lines = ['SECTION 1.', '', 'Der Vertrag (§ 2) gilt ab 1. März — 2019\u00a0г.', '\t\u2003½ ₤5']
+    features = build_line_category_features(lines)
+    for line_id, line in enumerate(lines):
+        expected = {'line_n_alpha': sum(1 for c in line if unicodedata.category(c).startswith('L')),
+                    'line_n_number': sum(1 for c in line if unicodedata.category(c).startswith('N')),
+                    'line_n_punct': sum(1 for c in line if unicodedata.category(c).startswith('P')),
+                    'line_n_whitespace': sum(1 for c in line if unicodedata.category(c).startswith('Z'))}
+        assert_dict_equal(get_line_category_counts(line), expected)
+        assert_dict_equal({name: int(values[line_id]) for name, values in features.items()}, expected)
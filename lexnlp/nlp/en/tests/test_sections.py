@@ -16,7 +16,8 @@ import codecs
 from nose.tools import assert_equal
 
 from lexnlp import get_module_path
-from lexnlp.nlp.en.segments.sections import get_sections
+from lexnlp.nlp.en.segments.sections import get_sections, get_section_spans
+from lexnlp.nlp.en.segments.utils import normalize_line_breaks
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -82,3 +83,19 @@ def test_file_3():
         num_sections = len(sections)
 
         assert_equal(num_sections, 72)
+
+
+def test_section_spans():
+    """
+    Test section spans using sample file #3.
+    :return:
+    """
+    base_path = get_module_path()
+
+    with open(os.path.join(base_path, "../test_data", "1100644_2016-11-21"), "rb") as test_file_handle:
+        file_buffer = test_file_handle.read().decode("utf-8")
+
+        section_spans = list(get_section_spans(file_buffer))
+        assert_equal(len(section_spans), 72)
+        assert_equal([normalize_line_breaks(file_buffer[start:end]) for start, end in section_spans],
+                     list(get_sections(file_buffer)))
@@ -2,10 +2,15 @@
 # -*- coding: UTF-8 -*-
 
 # Imports
+import codecs
+import io
+import os
+
 from nose.tools import assert_equal
 
+from lexnlp import get_module_path
 from lexnlp.nlp.en.segments.sentences import get_sentence_list, build_sentence_model, \
-    pre_process_document
+    pre_process_document, get_sentence_span_list, get_sentence_span_stream
 from lexnlp.tests import lexnlp_tests
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
@@ -42,3 +47,18 @@ def test_build_sentence_model():
 
 def test_pre_process_document():
     lexnlp_tests.test_extraction_func_on_test_data(pre_process_document, actual_data_converter=lambda text: [text])
+
+
+def test_sentence_span_stream():
+    """
+    Test streaming segmentation gives the same spans as segmenting the whole text.
+    """
+    with codecs.open(os.path.join(get_module_path(), "../test_data", "1582586_2015-08-31"),
+                     encoding='utf8') as file_handle:
+        text = file_handle.read()
+    expected = get_sentence_span_list(text)
+
+    chunks = [text[i:i + 100] for i in range(0, len(text), 100)]
+    assert_equal(list(get_sentence_span_stream(chunks, read_size=500)), expected)
+    assert_equal(list(get_sentence_span_stream(io.StringIO(text), read_size=1000)), expected)
+    assert_equal(list(get_sentence_span_stream([])), [])
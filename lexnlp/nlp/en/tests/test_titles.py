@@ -5,7 +5,7 @@ import requests
 from nose.tools import assert_list_equal
 
 from lexnlp import get_module_path
-from lexnlp.nlp.en.segments.titles import get_titles
+from lexnlp.nlp.en.segments.titles import get_titles, get_title_spans
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -43,6 +43,8 @@ def test_title_2():
         file_text = file_handle.read().decode("utf-8")
         assert_list_equal(list(get_titles(file_text)),
                           ["VALIDIAN SOFTWARE LICENSE AGREEMENT"])
+        assert_list_equal([file_text[start:end] for start, end in get_title_spans(file_text)],
+                          ["VALIDIAN SOFTWARE LICENSE AGREEMENT"])
 
 
 def test_title_3():
@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Optional
 
 __author__ = "ContraxSuite, LLC; LexPredict, LLC"
 __copyright__ = "Copyright 2015-2019, ContraxSuite, LLC"
@@ -17,22 +17,95 @@ class PhraseFinder:
     The class contains a collection of short string (usually 1 or 2 or 3 words)
     PhraseFinder searches for these strings (phrases) in the text given, either
     ignoring or regarding the case
+
+    Phrases are indexed by the first KEY_PREFIX_LENGTH chars of their leading word:
+    a phrase can be found only at the start of a text word beginning with the same chars.
+    So find_word() tokenizes the text once and checks the phrase regex only for the phrases
+    whose key is met in the text and only at the positions of the words having this key -
+    instead of scanning the whole text with the regex of each phrase.
+    Phrases which regex doesn't start with a literal word (e.g. "(C.D.)") are searched in the whole text.
     """
 
+    KEY_PREFIX_LENGTH = 4
+
+    # chars re.IGNORECASE matches with another lowercase char: the key of a word uses one of them,
+    # "İ" is mapped before lower() which makes two chars of it
+    KEY_CHARS_BEFORE_LOWER = str.maketrans({'\u0130': 'i'})
+    KEY_CHARS_AFTER_LOWER = str.maketrans({
+        '\u0131': 'i', '\u017f': 's', '\u00b5': '\u03bc', '\u0345': '\u03b9', '\u1fbe': '\u03b9',
+        '\u1fd3': '\u0390', '\u1fe3': '\u03b0', '\u03d0': '\u03b2', '\u03f5': '\u03b5', '\u03d1': '\u03b8',
+        '\u03f0': '\u03ba', '\u03d6': '\u03c0', '\u03f1': '\u03c1', '\u03c2': '\u03c3', '\u03d5': '\u03c6',
+        '\u1e9b': '\u1e61', '\ufb05': '\ufb06'})
+
+    WORD_RE = re.compile(r'\w+', re.UNICODE)
+
     def __init__(self, phrase_set: List[str], extra_format_function=None):
         self.extra_format_function = extra_format_function
-        self.word_re_ig = dict((v, self.word_to_regex(v, True)) for v in phrase_set)
-        self.word_re_cs = dict((v, self.word_to_regex(v, False)) for v in phrase_set)
+        self.phrases = list(dict.fromkeys(phrase_set))
+        self.word_regexes = [self.word_to_regex_str(v) for v in self.phrases]
+        self.word_re_ig = {}  # type: Dict[int, re.Pattern]
+        self.word_re_cs = {}  # type: Dict[int, re.Pattern]
+        # lowercase key prefix -> indices of the phrases starting with it
+        self.phrases_by_key = {}  # type: Dict[str, List[int]]
+        # phrases which can't be indexed - checked against the whole text
+        self.unindexed_phrases = []  # type: List[int]
+        for index, subphrase in enumerate(self.word_regexes):
+            key = self.get_phrase_key(subphrase)
+            if key:
+                self.phrases_by_key.setdefault(key, []).append(index)
+            else:
+                self.unindexed_phrases.append(index)
 
-    def word_to_regex(self, word: str, ignore_case: bool) -> str:
-        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
+    def word_to_regex_str(self, word: str) -> str:
+        # " Amtsgericht Stuttgart" ->  "Amtsgericht[\s]+Stuttgart"
         subphrase = word.replace(r'\t', ' ').strip(' ').replace('  ', ' ').replace(' ', r'[\s]+')
         if self.extra_format_function is not None:
             subphrase = self.extra_format_function(subphrase)
+        return subphrase
+
+    def word_to_regex(self, word: str, ignore_case: bool) -> str:
+        # " Amtsgericht Stuttgart" ->  re("Amtsgericht[\s]+Stuttgart")
+        return self.compile_regex(self.word_to_regex_str(word), ignore_case)
+
+    @staticmethod
+    def compile_regex(subphrase: str, ignore_case: bool):
         sps = '(\\b|\\s)'
         return re.compile(sps + subphrase + sps, re.IGNORECASE | re.UNICODE) if ignore_case else \
             re.compile(sps + subphrase + sps, re.UNICODE)
 
+    @classmethod
+    def get_phrase_key(cls, subphrase: str) -> Optional[str]:
+        """
+        Get lowercase prefix of the literal word the phrase regex starts with.
+        "Amtsgericht[\s]+Stuttgart" -> "amts", "Amtsgericht[e]?" -> "amts", "Ab?" -> "a", "[A]bc" -> None
+        """
+        if '|' in subphrase:
+            return None
+        match = cls.WORD_RE.match(subphrase)
+        if not match:
+            return None
+        key = match.group(0)
+        if subphrase[match.end():match.end() + 1] in ('?', '*', '{'):
+            # the last char of the word is optional
+            key = key[:-1]
+        return cls.get_word_key(key)[:cls.KEY_PREFIX_LENGTH] or None
+
+    @classmethod
+    def get_word_key(cls, word: str) -> str:
+        """
+        Lowercase the word so that the words matched by a regex with re.IGNORECASE have the same key.
+        The key has the same length as the word.
+        """
+        return word.translate(cls.KEY_CHARS_BEFORE_LOWER).lower().translate(cls.KEY_CHARS_AFTER_LOWER)
+
+    def get_phrase_regex(self, index: int, ignore_case: bool):
+        regexes = self.word_re_ig if ignore_case else self.word_re_cs
+        regex = regexes.get(index)
+        if regex is None:
+            regex = self.compile_regex(self.word_regexes[index], ignore_case)
+            regexes[index] = regex
+        return regex
+
     def find_word(self, phrase: str, ignore_case: bool = True) -> List[PhraseMatch]:
         """
         :param phrase: "Tis better using France than trusting France: let us be back'd with God and with the seas"
@@ -42,10 +115,37 @@ class PhraseFinder:
         PhraseFinder instance had been initialized like
             PhraseFinder([' let us ', 'better', 'the sea'])
         """
-        matches = []
-        match_dict = self.word_re_ig if ignore_case else self.word_re_cs
+        # key prefix -> start positions of the text words beginning with it
+        word_starts = {}  # type: Dict[str, List[int]]
+        for word in self.WORD_RE.finditer(phrase):
+            word_lower = self.get_word_key(word.group(0))
+            for prefix_len in range(1, min(len(word_lower), self.KEY_PREFIX_LENGTH) + 1):
+                word_starts.setdefault(word_lower[:prefix_len], []).append(word.start())
 
-        for k, v in match_dict.items():
-            for match in v.finditer(phrase):
-                matches.append((k, match.start(), match.end()))
+        candidates = {index: key for key in word_starts.keys() & self.phrases_by_key.keys()
+                      for index in self.phrases_by_key[key]}
+        for index in self.unindexed_phrases:
+            candidates[index] = None
+
+        matches = []
+        for index in sorted(candidates):
+            regex = self.get_phrase_regex(index, ignore_case)
+            key = candidates[index]
+            k = self.phrases[index]
+            if key is None:
+                for match in regex.finditer(phrase):
+                    matches.append((k, match.start(), match.end()))
+                continue
+            # same as regex.finditer(): the match can start at the word or at the whitespace before it,
+            # matches don't overlap
+            last_end = 0
+            for start in word_starts[key]:
+                for pos in (start - 1, start):
+                    if pos < last_end:
+                        continue
+                    match = regex.match(phrase, pos)
+                    if match:
+                        matches.append((k, match.start(), match.end()))
+                        last_end = match.end()
+                        break
         return matches
@@ -1,3 +1,4 @@
+import re
 from unittest import TestCase
 
 from lexnlp.utils.lines_processing.phrase_finder import PhraseFinder
@@ -13,3 +14,24 @@ class TestPhraseFinder(TestCase):
         finder = PhraseFinder(['C.D. Ill.', 'sh', 'should', 'find'])
         rst = finder.find_word(text, True)
         self.assertEqual(3, len(rst))
+
+    def test_matches_and_positions(self):
+        text = "Tis better using France than trusting France: let us be back'd with God and with the seas"
+        finder = PhraseFinder([' let us ', 'better', 'the sea', 'France', 'with  God'])
+        rst = finder.find_word(text, True)
+        self.assertEqual([(' let us ', 45, 52), ('better', 3, 10), ('France', 16, 23), ('France', 37, 44),
+                          ('with  God', 62, 71)], rst)
+        self.assertEqual([], finder.find_word('BETTER france', False))
+
+    def test_extra_format_function(self):
+        finder = PhraseFinder(['Amtsgerichte', '(Bonn)'], lambda s: re.sub('e$', '[e]?', s))
+        rst = finder.find_word('Das Amtsgericht (Bonn) und das amtsgerichte', True)
+        self.assertEqual([('Amtsgerichte', 3, 15), ('Amtsgerichte', 30, 43), ('(Bonn)', 17, 21)], rst)
+
+    def test_lowercase_longer_than_phrase(self):
+        # 'İ'.lower() is two characters long
+        finder = PhraseFinder(['İstanbul', 'Aİb'])
+        self.assertEqual([('İstanbul', 0, 8)], finder.find_word('İstanbul', False))
+        self.assertEqual([('Aİb', 2, 6)], finder.find_word('in Aİb', False))
+        # re.IGNORECASE matches "i" with "ı" and "İ"
+        self.assertEqual([('i', 0, 1), ('i', 1, 3)], PhraseFinder(['i']).find_word('ı İ', True))